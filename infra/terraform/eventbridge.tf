@@ -15,11 +15,16 @@ resource "aws_cloudwatch_event_target" "weekly_lambda" {
   target_id = "lambda"
   arn       = aws_lambda_function.ingest.arn
   
-  # Collect current year only
+  # Collect current year only; league-scored points and only the weeks
+  # completed since the last run. Week objects are never rewritten, so the
+  # raw stat columns must be collected with them
   input = jsonencode({
     year                   = var.current_year
     collect_playoffs       = false
     collect_player_totals  = false
+    league_scored          = true
+    include_stat_columns   = true
+    incremental            = true
   })
 }
 
@@ -24,6 +24,24 @@ resource "aws_iam_policy" "lambda_ingest_policy" {
           "arn:aws:s3:::${aws_s3_bucket.lake.bucket}/*"
         ]
       },
+      {
+        Sid      = "S3LakeStagingWatermarks",
+        Effect   = "Allow",
+        Action   = ["s3:GetObject", "s3:DeleteObject"],
+        Resource = ["arn:aws:s3:::${aws_s3_bucket.lake.bucket}/staging/*"]
+      },
+      {
+        Sid      = "S3LakeCacheRead",
+        Effect   = "Allow",
+        Action   = ["s3:GetObject"],
+        Resource = ["arn:aws:s3:::${aws_s3_bucket.lake.bucket}/cache/*"]
+      },
+      {
+        Sid      = "S3LakeBackfillStateRead",
+        Effect   = "Allow",
+        Action   = ["s3:GetObject"],
+        Resource = ["arn:aws:s3:::${aws_s3_bucket.lake.bucket}/state/*"]
+      },
       {
         Sid      = "KMSUse",
         Effect   = "Allow",
@@ -51,6 +69,25 @@ resource "aws_iam_role_policy_attachment" "lambda_ingest_attach" {
   policy_arn = aws_iam_policy.lambda_ingest_policy.arn
 }
 
+# Backfills that reach the deadline re-invoke the function with the seasons
+# left. Attached to the role separately: the function ARN is only known once
+# the function (which depends on the policy above) exists.
+resource "aws_iam_role_policy" "lambda_ingest_self_invoke" {
+  name = "${var.project}-lambda-ingest-self-invoke"
+  role = aws_iam_role.lambda_ingest.id
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [
+      {
+        Sid      = "SelfInvoke",
+        Effect   = "Allow",
+        Action   = ["lambda:InvokeFunction"],
+        Resource = [aws_lambda_function.ingest.arn]
+      }
+    ]
+  })
+}
+
 # ========================================
 # QuickSight IAM Resources
 # ========================================
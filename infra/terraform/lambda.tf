@@ -23,6 +23,10 @@ resource "aws_lambda_function" "ingest" {
       HISTORICAL_LEAGUES = jsonencode(var.historical_leagues)
       NAME_MAP           = jsonencode(var.name_map)
       SCORING_SETTINGS   = jsonencode(var.scoring_settings)
+      SCORING_PROFILES   = jsonencode(var.scoring_profiles)
+      BACKFILL_WORKERS   = var.backfill_workers
+      MAX_CONTINUATIONS  = var.max_backfill_continuations
+      RESPONSE_CACHE     = "s3"
     }
   }
 
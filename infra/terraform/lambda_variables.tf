@@ -110,6 +110,34 @@ variable "scoring_settings" {
   }
 }
 
+variable "scoring_profiles" {
+  description = "Alternative scoring rules by name, as overrides of scoring_settings (e.g. half_ppr = { rec = 0.5 })"
+  type        = map(map(number))
+  default     = {}
+
+  validation {
+    condition     = alltrue([for name in keys(var.scoring_profiles) : can(regex("^[a-z0-9_]+$", name))])
+    error_message = "Scoring profile names become column names and must match ^[a-z0-9_]+$."
+  }
+}
+
+variable "backfill_workers" {
+  description = "Historical seasons collected concurrently in backfill mode"
+  type        = number
+  default     = 4
+
+  validation {
+    condition     = var.backfill_workers >= 1
+    error_message = "backfill_workers must be at least 1."
+  }
+}
+
+variable "max_backfill_continuations" {
+  description = "Times a backfill may re-invoke itself to finish the seasons left at the Lambda timeout"
+  type        = number
+  default     = 10
+}
+
 # Schedule control variables
 variable "enable_weekly_collection" {
   description = "Enable weekly Wednesday data collection"
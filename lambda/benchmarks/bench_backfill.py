@@ -0,0 +1,95 @@
+"""
+Benchmark: historical backfill, one season at a time vs a thread pool
+Runs lambda_function.handler in backfill mode against the stand-in Sleeper
+server (with per-request latency) and a local lake directory for each
+worker count, reports wall time and Sleeper requests, and checks every
+run wrote byte-identical partitions. At the default client rate limit the
+request budget, not latency, bounds a backfill; --rate raises it. --fail-year makes one season's league
+lookup fail to show the other seasons still complete.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_backfill [--years 5] [--workers 1 4] [--latency 0.1] [--rate 50]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# --rate must reach utils.api before it is imported
+if '--rate' in sys.argv:
+    os.environ['SLEEPER_RATE_LIMIT'] = os.environ['SLEEPER_RATE_BURST'] = \
+        sys.argv[sys.argv.index('--rate') + 1]
+os.environ['RESPONSE_CACHE'] = 'none'
+os.environ.setdefault('LAKE_BUCKET', 'local')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
+
+import lambda_function
+import utils.api
+import utils.players
+from benchmarks.local_s3 import LocalS3
+from benchmarks.replay_handler import compare
+from benchmarks.sleeper_stub import StubServer, build_name_map
+
+SCORING = {'pass_yd': 0.04, 'pass_td': 4, 'rush_yd': 0.1, 'rush_td': 6, 'rec': 0.5,
+           'rec_yd': 0.1, 'rec_td': 6, 'fum_lost': -2, 'fgm': 3, 'xpm': 1}
+
+
+def run(stub: StubServer, root: str, workers: int):
+    lambda_function.s3_client = LocalS3(root)
+    utils.players._directory = None
+    before = stub.request_count
+    start = time.perf_counter()
+    response = lambda_function.handler({'backfill_historical': True, 'backfill_workers': workers}, None)
+    elapsed = time.perf_counter() - start
+    return response, elapsed, stub.request_count - before
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--latency', type=float, default=0.1)
+    parser.add_argument('--fail-year', type=int)
+    parser.add_argument('--rate', type=float, help='client rate limit, requests/second')
+    args = parser.parse_args()
+
+    lambda_function.HISTORICAL_LEAGUES = {str(year): f'L{year}'
+                                          for year in range(2024 - args.years, 2024)}
+    lambda_function.SCORING_SETTINGS = SCORING
+    lambda_function.NAME_MAP = build_name_map()
+    if args.fail_year:
+        get_rosters = utils.api.get_league_rosters
+        utils.api.get_league_rosters = (
+            lambda league_id: [] if league_id == f'L{args.fail_year}' else get_rosters(league_id))
+
+    with StubServer(latency=args.latency) as stub, tempfile.TemporaryDirectory() as tmp:
+        stub.point_api_at()
+        roots = []
+        # Untimed pass so the stub has built every payload before the timed runs
+        stdout, sys.stdout = sys.stdout, sys.stderr
+        try:
+            run(stub, os.path.join(tmp, 'warmup'), max(args.workers))
+        finally:
+            sys.stdout = stdout
+        for workers in args.workers:
+            root = os.path.join(tmp, f'workers_{workers}')
+            roots.append(root)
+            # Collector progress goes to stderr; only the report goes to stdout
+            stdout, sys.stdout = sys.stdout, sys.stderr
+            try:
+                response, elapsed, requests = run(stub, root, workers)
+            finally:
+                sys.stdout = stdout
+            body = json.loads(response['body'])
+            print(f"workers={workers}: {elapsed:6.2f}s  {requests} requests  "
+                  f"status={response['statusCode']}  years ok={sorted(body['results'])}  "
+                  f"failed={body.get('errors', {})}")
+        for root in roots[1:]:
+            compare(os.path.join(roots[0], 'staging'), os.path.join(root, 'staging'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: cold start of lambda_function in a fresh interpreter
+Every run starts a new Python process, like a new Lambda execution
+environment, and times:
+
+  import    import lambda_function (the Lambda init phase)
+  no-league handler({}) without CURRENT_LEAGUE_ID, which returns 400 at once
+  season    handler() for one season against the stand-in Sleeper server,
+            writing to a local lake directory
+
+For each it reports process wall time, the import and handler split, and
+which heavy packages the process ended up loading. --lambda-dir points the
+runs at another checkout (e.g. a git worktree of an older commit) to compare.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_cold_start [--runs 5] [--lambda-dir DIR]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.sleeper_stub import StubServer, build_name_map
+
+SCENARIOS = {
+    'import': None,
+    'no-league': {},
+    'season': {'year': 2023, 'league_id': 'L2023', 'week': 17,
+               'collect_playoffs': True, 'collect_player_totals': True},
+}
+
+HEAVY = ('boto3', 'pandas', 'pyarrow', 'numpy', 'requests')
+
+# Runs in the fresh interpreter; argv: event JSON (or 'null'), lake directory
+CHILD = r'''
+import json, sys, time
+start = time.perf_counter()
+import lambda_function
+imported = time.perf_counter()
+event = json.loads(sys.argv[1])
+status = None
+if event is not None:
+    from benchmarks.local_s3 import LocalS3
+    lambda_function.s3_client = LocalS3(sys.argv[2])
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    try:
+        status = lambda_function.handler(event, None)['statusCode']
+    finally:
+        sys.stdout = stdout
+done = time.perf_counter()
+print(json.dumps({'import': imported - start, 'handler': done - imported, 'status': status,
+                  'loaded': [m for m in %r if m in sys.modules]}))
+''' % (HEAVY,)
+
+
+def run(event, lambda_dir: str, env: dict) -> dict:
+    with tempfile.TemporaryDirectory() as lake:
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD, json.dumps(event), lake],
+            cwd=lambda_dir, env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        wall = time.perf_counter() - start
+    return {**json.loads(output.splitlines()[-1]), 'wall': wall}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--lambda-dir', default='.')
+    parser.add_argument('--scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    args = parser.parse_args()
+
+    benchmarks_root = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+    with StubServer() as stub:
+        env = {
+            **os.environ,
+            'PYTHONPATH': os.pathsep.join([os.path.abspath(args.lambda_dir), benchmarks_root]),
+            'AWS_DEFAULT_REGION': os.environ.get('AWS_DEFAULT_REGION', 'us-west-2'),
+            'RESPONSE_CACHE': 'none',
+            'LAKE_BUCKET': 'local',
+            'NAME_MAP': json.dumps(build_name_map()),
+            'SLEEPER_API_BASE': f'{stub.base_url}/v1',
+            'SLEEPER_STATS_BASE': stub.base_url,
+            'SLEEPER_RATE_LIMIT': '1000',
+            'SLEEPER_RATE_BURST': '1000',
+        }
+        env.pop('CURRENT_LEAGUE_ID', None)
+
+        # Untimed run so the stub has built every payload
+        run(SCENARIOS['season'], args.lambda_dir, env)
+
+        print(f"{args.runs} fresh interpreters per scenario, medians ({args.lambda_dir})")
+        for name in args.scenarios:
+            runs = [run(SCENARIOS[name], args.lambda_dir, env) for _ in range(args.runs)]
+            wall, imported, handler = (statistics.median(r[key] for r in runs)
+                                       for key in ('wall', 'import', 'handler'))
+            print(f"  {name:<10} wall={wall * 1000:7.0f} ms  import={imported * 1000:6.0f} ms  "
+                  f"handler={handler * 1000:6.0f} ms  status={runs[0]['status']}  "
+                  f"loaded={','.join(runs[0]['loaded']) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: historical backfill under a Lambda time budget
+Runs a backfill once without a deadline, then again with a small
+per-invocation budget so it has to stop early and re-invoke itself with
+the seasons left. The continuations run against the local Lambda
+stand-in until none are queued; the staging tables must end up
+byte-identical to the unconstrained run.
+
+The unconstrained run records per-season durations, which the budgeted
+run starts from (as a deployed function would from earlier runs).
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_deadline [--years 6] [--budget 3] [--margin 0.25]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ['RESPONSE_CACHE'] = 'none'
+os.environ.setdefault('LAKE_BUCKET', 'local')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
+os.environ.setdefault('SLEEPER_RATE_LIMIT', '100')
+os.environ.setdefault('SLEEPER_RATE_BURST', '100')
+
+import lambda_function
+import utils.players
+from benchmarks.bench_backfill import SCORING
+from benchmarks.local_lambda import LocalContext, LocalLambda
+from benchmarks.local_s3 import LocalS3
+from benchmarks.replay_handler import compare
+from benchmarks.sleeper_stub import StubServer, build_name_map
+from utils.scheduler import COSTS_KEY
+
+
+def quietly(fn, *args):
+    # Collector progress goes to stderr; only the report goes to stdout
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    try:
+        return fn(*args)
+    finally:
+        sys.stdout = stdout
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=6)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--budget', type=float, default=3.0, help='seconds per invocation')
+    parser.add_argument('--margin', type=float, default=0.25)
+    parser.add_argument('--latency', type=float, default=0.02)
+    args = parser.parse_args()
+
+    lambda_function.HISTORICAL_LEAGUES = {str(year): f'L{year}'
+                                          for year in range(2024 - args.years, 2024)}
+    lambda_function.SCORING_SETTINGS = SCORING
+    lambda_function.NAME_MAP = build_name_map()
+    lambda_function.DEADLINE_MARGIN_SECONDS = args.margin
+    lambda_function.REQUEST_DEADLINE_MARGIN_SECONDS = args.margin / 2
+    event = {'backfill_historical': True, 'backfill_workers': args.workers}
+
+    with StubServer(latency=args.latency) as stub, tempfile.TemporaryDirectory() as tmp:
+        stub.point_api_at()
+        full, budgeted = os.path.join(tmp, 'full'), os.path.join(tmp, 'budgeted')
+
+        lambda_function.s3_client = LocalS3(full)
+        utils.players._directory = None
+        quietly(lambda_function.handler, event, None)
+
+        os.makedirs(os.path.join(budgeted, 'state'))
+        shutil.copy(os.path.join(full, 'state', COSTS_KEY), os.path.join(budgeted, 'state', COSTS_KEY))
+        lambda_function.s3_client = LocalS3(budgeted)
+        lambda_function.lambda_client = invoker = LocalLambda()
+        utils.players._directory = None
+        start = time.perf_counter()
+        responses = [quietly(lambda_function.handler, event, LocalContext(args.budget))]
+        responses += quietly(invoker.run_queued, lambda_function.handler, args.budget)
+        elapsed = time.perf_counter() - start
+
+        print(f"{args.budget:g}s budget: {len(responses)} invocations, {elapsed:.2f}s")
+        for i, response in enumerate(responses):
+            body = json.loads(response['body'])
+            continuation = body.get('continuation') or {}
+            print(f"  #{i}: years={sorted(body['results'])}  "
+                  f"left={continuation.get('event', {}).get('years', [])}  "
+                  f"enqueued={continuation.get('enqueued', False)}")
+        compare(os.path.join(full, 'staging'), os.path.join(budgeted, 'staging'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: bare requests.get vs pooled SleeperClient
+Replays the request pattern of a 17-week backfill (matchups + weekly stats
+per week) against the local stand-in server and reports per-request latency.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_http_pool [--rounds 5]
+
+Note: the stand-in is plain HTTP on loopback, so this only measures the TCP
+setup that pooling saves; against api.sleeper.app the TLS handshake makes the
+gap considerably larger.
+"""
+
+import argparse
+import statistics
+import time
+
+import requests
+
+from benchmarks.sleeper_stub import StubServer
+from utils.api import SleeperClient
+
+
+def backfill_urls(base_url: str, league_id: str = 'bench', year: int = 2023):
+    urls = []
+    for week in range(1, 18):
+        urls.append(f'{base_url}/v1/league/{league_id}/matchups/{week}')
+        urls.append(f'{base_url}/stats/nfl/{year}/{week}?season_type=regular')
+    return urls
+
+
+def run(get, urls):
+    timings = []
+    for url in urls:
+        start = time.perf_counter()
+        response = get(url)
+        response.content
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label, timings):
+    ms = sorted(t * 1000 for t in timings)
+    print(f"  {label:<14} n={len(ms):<4} mean={statistics.mean(ms):7.2f}ms  "
+          f"p50={ms[len(ms) // 2]:7.2f}ms  p95={ms[int(len(ms) * 0.95)]:7.2f}ms  total={sum(ms):8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    with StubServer() as stub:
+        urls = backfill_urls(stub.base_url)
+        client = SleeperClient()
+        # Warm the stub's payload cache so both paths see identical server cost
+        run(client.get, urls)
+
+        bare, pooled = [], []
+        for _ in range(args.rounds):
+            bare += run(lambda u: requests.get(u, timeout=30), urls)
+            pooled += run(client.get, urls)
+
+        print(f"17-week backfill request pattern, {args.rounds} rounds:")
+        report('requests.get', bare)
+        report('SleeperClient', pooled)
+        client.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: weekly job cost, full-season rewrite vs incremental
+Replays a season's Wednesday runs (weeks 1..14) against the stand-in
+Sleeper server and a local lake directory, once rewriting the season
+partition every week and once in incremental mode. Reports Sleeper
+requests, objects and bytes written per run, then checks that the
+incremental lake holds exactly the rows of the final full rewrite.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_incremental [--weeks 14]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+os.environ['RESPONSE_CACHE'] = 'none'
+os.environ.setdefault('LAKE_BUCKET', 'local')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import lambda_function
+from benchmarks.local_s3 import LocalS3
+from benchmarks.sleeper_stub import StubServer, build_name_map
+from utils.api import reset_request_cache
+from utils.lake import partition_prefix
+from utils.players import configure_player_directory, get_player_directory
+
+LEAGUE_ID = 'L2023'
+YEAR = 2023
+
+
+def read_partition(root: str, table_name: str) -> pa.Table:
+    """Every Parquet object in the year partition, ordered like a full rewrite."""
+    directory = os.path.join(root, partition_prefix(table_name, YEAR))
+    tables = [pq.read_table(os.path.join(directory, name)).replace_schema_metadata()
+              for name in sorted(os.listdir(directory)) if name.endswith('.parquet')]
+    combined = pa.concat_tables(tables)
+    return combined.take(pa.compute.sort_indices(combined, [('week', 'ascending')]))
+
+
+def run_season(stub: StubServer, root: str, weeks: int, incremental: bool):
+    lake = lambda_function.s3_client = LocalS3(root)
+    for week in range(1, weeks + 1):
+        reset_request_cache()
+        requests_before, puts_before, bytes_before = stub.request_count, lake.put_count, lake.put_bytes
+        lambda_function.collect_season_data(
+            LEAGUE_ID, YEAR, week, league_scored=True, include_stat_columns=False,
+            incremental=incremental)
+        yield (week, stub.request_count - requests_before, lake.put_count - puts_before,
+               lake.put_bytes - bytes_before)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--weeks', type=int, default=14)
+    args = parser.parse_args()
+
+    lambda_function.NAME_MAP = build_name_map()
+    configure_player_directory(None)
+    rows = {}
+    with StubServer() as stub, tempfile.TemporaryDirectory() as full_root, \
+            tempfile.TemporaryDirectory() as incremental_root:
+        stub.point_api_at()
+        # Collector progress goes to stderr; only the report goes to stdout
+        stdout, sys.stdout = sys.stdout, sys.stderr
+        try:
+            get_player_directory()
+            for mode, root in (('full', full_root), ('incremental', incremental_root)):
+                rows[mode] = list(run_season(stub, root, args.weeks, mode == 'incremental'))
+        finally:
+            sys.stdout = stdout
+
+        print(f"{'week':>4}  {'full: req  puts      KiB':>26}  {'incremental: req  puts      KiB':>33}")
+        for full, incremental in zip(rows['full'], rows['incremental']):
+            print(f"{full[0]:>4}  {full[1]:>15} {full[2]:>5} {full[3] / 2**10:>8.1f}  "
+                  f"{incremental[1]:>22} {incremental[2]:>5} {incremental[3] / 2**10:>8.1f}")
+
+        for table_name in lambda_function.WEEKLY_TABLES:
+            same = read_partition(full_root, table_name).equals(read_partition(incremental_root, table_name))
+            print(f"{table_name}: {'IDENTICAL' if same else 'MISMATCH'}")
+
+
+if __name__ == '__main__':
+    main()
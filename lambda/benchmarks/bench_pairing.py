@@ -0,0 +1,89 @@
+"""
+Benchmark: opponent pairing, groupby().apply vs the pair_opponents kernel
+Pairs synthetic matchup rows for many leagues and seasons (10 teams, weeks
+1-14, a few byes and 3-team groups mixed in), times the previous
+per-group .loc assignment against the self-merge kernel, and checks that
+both give the same opponents.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_pairing [--leagues 50] [--seasons 5]
+"""
+
+import argparse
+import random
+import time
+import warnings
+
+import pandas as pd
+
+from utils.pairing import pair_opponents
+
+KEYS = ['league_id', 'year', 'week', 'matchup_id']
+
+
+def build_rows(leagues: int, seasons: int, seed: int = 11) -> pd.DataFrame:
+    rng = random.Random(seed)
+    rows = []
+    for league in range(leagues):
+        for year in range(2020, 2020 + seasons):
+            for week in range(1, 15):
+                order = list(range(1, 11))
+                rng.shuffle(order)
+                for slot, roster_id in enumerate(order):
+                    matchup_id = slot // 2 + 1
+                    if rng.random() < 0.02:
+                        matchup_id = 6  # bye, or a third team in another group
+                    rows.append({'league_id': f'L{league}', 'year': year, 'week': week,
+                                 'matchup_id': matchup_id, 'team_id': f'T{roster_id}',
+                                 'points_scored': round(rng.uniform(60, 160), 2)})
+    return pd.DataFrame(rows)
+
+
+def apply_pairing(df: pd.DataFrame) -> pd.DataFrame:
+    """The previous groupby().apply implementation."""
+    df = df.copy()
+    df['opponent_team_id'] = None
+    df['opponent_points'] = None
+
+    def assign_opponent_data(group):
+        if len(group) == 2:
+            team1, team2 = group.iloc[0], group.iloc[1]
+            group.loc[group.index[0], 'opponent_team_id'] = team2['team_id']
+            group.loc[group.index[1], 'opponent_team_id'] = team1['team_id']
+            group.loc[group.index[0], 'opponent_points'] = team2['points_scored']
+            group.loc[group.index[1], 'opponent_points'] = team1['points_scored']
+        return group
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)  # apply over grouping columns
+        return df.groupby(KEYS, group_keys=False).apply(assign_opponent_data)
+
+
+def timed(label, fn, df):
+    start = time.perf_counter()
+    result = fn(df)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<16} {elapsed:7.3f}s  {len(df) / elapsed:12,.0f} rows/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--leagues', type=int, default=50)
+    parser.add_argument('--seasons', type=int, default=5)
+    args = parser.parse_args()
+
+    df = build_rows(args.leagues, args.seasons)
+    print(f"{len(df)} team-weeks ({args.leagues} leagues x {args.seasons} seasons x 14 weeks)")
+
+    old = timed('groupby.apply', apply_pairing, df)
+    new = timed('pair_opponents', lambda d: pair_opponents(d, 'team_id', 'points_scored', keys=KEYS), df)
+
+    old = old.sort_index()
+    same = (old['opponent_team_id'].equals(new['opponent_team_id'])
+            and old['opponent_points'].astype('float64').equals(new['opponent_points']))
+    print(f"  identical: {same}")
+
+
+if __name__ == '__main__':
+    main()
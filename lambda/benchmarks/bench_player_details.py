@@ -0,0 +1,101 @@
+"""
+Benchmark: player_details_by_team row building, per-row dicts vs columns
+Builds the stg_player_details_by_team frame from pre-fetched week bundles
+for a growing league (teams x 15 rostered players x 14 weeks), comparing
+the previous per-row dict construction with the columnar builder.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_player_details [--teams 12 32 128]
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+import collectors.player_details_by_team as details
+from benchmarks.bench_scoring import SCORING
+from benchmarks.sleeper_stub import NUM_PLAYERS, build_players, build_weekly_stats
+from utils.players import PlayerDirectory
+from utils.scoring import calculate_player_points
+from utils.weeks import WeekBundle
+
+WEEKS = range(1, 15)
+ROSTER_SIZE = 15
+
+
+def build_bundles(teams: int):
+    bundles = {}
+    for week in WEEKS:
+        rng = random.Random(teams * 100 + week)
+        stats = {row['player_id']: row['stats'] for row in build_weekly_stats(2023, week)}
+        matchups = []
+        for roster_id in range(1, teams + 1):
+            roster = [str(rng.randint(1, NUM_PLAYERS)) for _ in range(ROSTER_SIZE)]
+            matchups.append({'roster_id': roster_id, 'matchup_id': (roster_id + 1) // 2,
+                             'players': roster, 'starters': roster[:9]})
+        bundles[week] = WeekBundle(week, tuple(matchups), stats, None)
+    return bundles
+
+
+def row_dicts(bundles, roster_to_owner, owner_to_display, players):
+    """The previous builder: one stats dict and one row dict per player-week."""
+    rows = []
+    for week in WEEKS:
+        weekly_stats = bundles[week].stats
+        for matchup in bundles[week].matchups:
+            roster_id = matchup['roster_id']
+            team_name = owner_to_display.get(roster_to_owner.get(roster_id), 'Unknown')
+            starters = matchup.get('starters', [])
+            for player_id in matchup.get('players', []):
+                if not player_id:
+                    continue
+                player_name, position, nfl_team = players.lookup(player_id)
+                player_stats = weekly_stats.get(player_id, {})
+                stats_dict = {col: player_stats.get(col, None) for col in details.STAT_COLUMNS}
+                rows.append({
+                    'year': 2023, 'week': week, 'team_name': team_name, 'roster_id': roster_id,
+                    'player_id': player_id, 'player_name': player_name, 'position': position,
+                    'nfl_team': nfl_team, 'is_starter': player_id in starters,
+                    'fantasy_points': calculate_player_points(player_stats, SCORING),
+                    **stats_dict,
+                })
+    df = pd.DataFrame(rows)
+    df['week'] = df['week'].astype('int64')
+    df['roster_id'] = df['roster_id'].astype('int64')
+    df['fantasy_points'] = df['fantasy_points'].astype('float64')
+    df['is_starter'] = df['is_starter'].astype('bool')
+    for col in details.STAT_COLUMNS:
+        df[col] = df[col].astype('float64')
+    return df.drop(columns=['year'])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--teams', type=int, nargs='+', default=[12, 32, 128])
+    args = parser.parse_args()
+
+    players = PlayerDirectory.from_players(build_players())
+    details.get_player_directory = lambda: players
+
+    for teams in args.teams:
+        bundles = build_bundles(teams)
+        roster_to_owner = {r: f'u{r}' for r in range(1, teams + 1)}
+        owner_to_display = {f'u{r}': f'Team {r}' for r in range(1, teams + 1)}
+
+        start = time.process_time()
+        old = row_dicts(bundles, roster_to_owner, owner_to_display, players)
+        old_time = time.process_time() - start
+
+        start = time.process_time()
+        new = details.collect_player_details_by_team_data(
+            'L', 2023, WEEKS, roster_to_owner, owner_to_display, {}, SCORING, bundles=bundles)
+        new_time = time.process_time() - start
+
+        print(f"{teams:>4} teams  {len(new):>7} rows  row dicts={old_time:6.3f}s  "
+              f"columnar={new_time:6.3f}s  identical={old.equals(new)}")
+
+
+if __name__ == '__main__':
+    main()
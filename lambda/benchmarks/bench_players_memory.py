@@ -0,0 +1,66 @@
+"""
+Benchmark: peak memory of decoding the /players/nfl payload
+Compares the old path (response.json() of the whole body, then projecting)
+with streaming the body through utils.streaming into a PlayerDirectory.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_players_memory [--payload players.json]
+
+Without --payload a synthetic payload from the stand-in server is used; pass
+a recorded /players/nfl body for production-sized numbers.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from benchmarks.sleeper_stub import build_players
+from utils.api import STREAM_CHUNK_SIZE
+from utils.players import PlayerDirectory
+
+
+def chunked(raw: bytes):
+    for start in range(0, len(raw), STREAM_CHUNK_SIZE):
+        yield raw[start:start + STREAM_CHUNK_SIZE]
+
+
+def full_decode(raw: bytes) -> PlayerDirectory:
+    players = json.loads(raw)
+    return PlayerDirectory.from_players(players)
+
+
+def streamed_decode(raw: bytes) -> PlayerDirectory:
+    return PlayerDirectory.from_stream(chunked(raw))
+
+
+def measure(label, fn, raw):
+    tracemalloc.start()
+    start = time.perf_counter()
+    directory = fn(raw)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<12} players={len(directory):<6} peak={peak / 2**20:8.1f} MiB  time={elapsed:6.2f}s")
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--payload', help='Path to a recorded /players/nfl JSON body')
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, 'rb') as f:
+            raw = f.read()
+    else:
+        raw = json.dumps(build_players()).encode()
+
+    print(f"/players/nfl payload: {len(raw) / 2**20:.1f} MiB (peak excludes the raw body)")
+    old = measure('full decode', full_decode, raw)
+    new = measure('streamed', streamed_decode, raw)
+    assert all(old.lookup(pid) == new.lookup(pid) for pid in old.player_ids)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: per-player calculate_player_points vs the batched ScoringEngine
+Scores every player-week of N synthetic seasons (~2k players x 17 weeks each)
+both ways, reports throughput and checks the results are identical.
+
+League settings alone are scored per player by the engine too; the matrix
+path is measured with the scoring profiles (one loop per configuration vs
+one matrix product). Its time is split into building the stats matrix from
+the decoded dicts and scoring the matrix.
+
+Sleeper's weekly rows carry far more stat keys than any league scores;
+--extra-keys pads each synthetic row with that many unscored keys.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_scoring [--years 3] [--extra-keys 30]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.sleeper_stub import build_weekly_stats
+from utils.scoring import _MIDPOINT_TOLERANCE, ScoringEngine, calculate_player_points
+
+# Fractional weights put plenty of raw scores on rounding midpoints
+SCORING = {
+    'pass_yd': 0.04, 'pass_td': 4, 'pass_int': -1, 'rush_yd': 0.1, 'rush_td': 6,
+    'rec': 0.5, 'rec_yd': 0.1, 'rec_td': 6, 'fum_lost': -2, 'fgm': 3, 'fgm_40_49': 4,
+    'xpm': 1, 'def_int': 2, 'def_sack': 1, 'def_td': 6, 'pts_allow_14_20': 1,
+    'rush_fd': 0.25, 'rec_fd': 0.25, 'pass_cmp': 0.05,
+}
+
+PROFILES = {
+    'ppr': {**SCORING, 'rec': 1},
+    'standard': {**SCORING, 'rec': 0},
+}
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def report(label, seconds, total):
+    print(f"  {label:<22} {seconds:6.3f}s  {total / seconds:12,.0f} player-weeks/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--extra-keys', type=int, default=0)
+    args = parser.parse_args()
+
+    padding = {f'unscored_{k}': float(k) for k in range(args.extra_keys)}
+    weeks = [[{**row['stats'], **padding} for row in build_weekly_stats(2020 + y, week)]
+             for y in range(args.years) for week in range(1, 18)]
+    total = sum(len(rows) for rows in weeks)
+    print(f"{total} player-weeks ({args.years} seasons x 17 weeks, "
+          f"{args.extra_keys} unscored keys per row)")
+
+    configurations = [SCORING] + list(PROFILES.values())
+    engine = ScoringEngine(SCORING)
+    profiled = ScoringEngine(SCORING, PROFILES)
+
+    scalar, scalar_time = timed(
+        lambda: [[calculate_player_points(stats, SCORING) for stats in rows] for rows in weeks])
+    batched, batched_time = timed(lambda: [engine.score(rows) for rows in weeks])
+    scalar_all, scalar_all_time = timed(
+        lambda: [[[calculate_player_points(stats, settings) for stats in rows]
+                  for settings in configurations] for rows in weeks])
+    batched_all, batched_all_time = timed(lambda: [profiled.score_all(rows) for rows in weeks])
+    matrices, matrix_time = timed(lambda: [profiled.stats_matrix(rows) for rows in weeks])
+    raw, raw_time = timed(lambda: [profiled.raw_scores(matrix) for matrix in matrices])
+
+    hundredths = np.abs(np.concatenate(raw)) * 100
+    midpoints = int((np.abs(hundredths - np.floor(hundredths) - 0.5) < _MIDPOINT_TOLERANCE).sum())
+
+    print("league settings")
+    report('per-player', scalar_time, total)
+    report('engine', batched_time, total)
+    print(f"  identical: {scalar == batched}")
+    print(f"league settings + {len(PROFILES)} profiles")
+    report('per-player', scalar_all_time, total)
+    report('engine (from dicts)', batched_all_time, total)
+    report('  build matrix', matrix_time, total)
+    report('  score matrix', raw_time, total)
+    print(f"  rescored near a rounding midpoint: {midpoints} of {hundredths.size} scores")
+    print(f"  identical: {scalar_all == batched_all}")
+
+
+if __name__ == '__main__':
+    main()
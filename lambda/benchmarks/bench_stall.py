@@ -0,0 +1,76 @@
+"""
+Benchmark: a stalled Sleeper connection under the invocation deadline
+Runs lambda_function.handler for one season against the stand-in Sleeper
+server with one stats request that never answers. Without a deadline that
+request holds the run for every attempt's read timeout plus backoff; with
+one, its timeout is capped by the time left, the run stops with
+DeadlineExceeded and reports the tables written before it (status 206).
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_stall [--budget 20] [--margin 5] [--stall '/stats/nfl/\\d+/16$']
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ['RESPONSE_CACHE'] = 'none'
+os.environ.setdefault('LAKE_BUCKET', 'local')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
+os.environ.setdefault('SLEEPER_RATE_LIMIT', '100')
+os.environ.setdefault('SLEEPER_RATE_BURST', '100')
+
+import lambda_function
+import utils.api
+import utils.players
+from benchmarks.bench_backfill import SCORING
+from benchmarks.local_lambda import LocalContext
+from benchmarks.local_s3 import LocalS3
+from benchmarks.sleeper_stub import StubServer, build_name_map
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--budget', type=float, default=20.0, help='invocation seconds')
+    parser.add_argument('--margin', type=float, default=5.0,
+                        help='REQUEST_DEADLINE_MARGIN_SECONDS')
+    parser.add_argument('--stall', default=r'/stats/nfl/\d+/16$', help='regex of paths that hang')
+    args = parser.parse_args()
+
+    lambda_function.SCORING_SETTINGS = SCORING
+    lambda_function.NAME_MAP = build_name_map()
+    lambda_function.REQUEST_DEADLINE_MARGIN_SECONDS = args.margin
+    event = {'year': 2023, 'league_id': 'L2023', 'week': 17,
+             'collect_playoffs': True, 'collect_player_totals': True}
+
+    with StubServer(stall=args.stall) as stub, tempfile.TemporaryDirectory() as tmp:
+        stub.point_api_at()
+        lambda_function.s3_client = LocalS3(tmp)
+        utils.players._directory = None
+
+        # Collector progress goes to stderr; only the report goes to stdout
+        stdout, sys.stdout = sys.stdout, sys.stderr
+        try:
+            start = time.perf_counter()
+            response = lambda_function.handler(event, LocalContext(args.budget))
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = stdout
+
+        client = utils.api.get_client()
+        body = json.loads(response['body'])
+        without = client.timeout[1] * 3 + client.backoff_cap * 2
+        print(f"stalled path {args.stall!r}, {args.budget:g}s budget, {args.margin:g}s margin")
+        print(f"  without a deadline the stalled request alone could take up to ~{without:.0f}s")
+        print(f"  with the deadline: returned after {elapsed:.2f}s "
+              f"({args.budget - elapsed:.2f}s before the deadline)")
+        print(f"  status={response['statusCode']}  message={body.get('message')!r}")
+        print(f"  tables written: {body['results'].get('2023', {})}")
+        print(f"  deadline_exceeded={body['throttle']['deadline_exceeded']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: rate limiter and backoff against a fault-injecting stand-in
+Fetches a season's worth of matchup and stats URLs concurrently while the
+stand-in answers 500s at random and 429s above its own rate limit, for a
+range of client-side requests-per-second budgets.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_throttle [--server-rps 20] [--fault-rate 0.05]
+"""
+
+import argparse
+import time
+
+from benchmarks.sleeper_stub import StubServer
+from utils import api
+
+
+def season_urls(league_id: str, year: int):
+    for week in range(1, 18):
+        yield api._matchups_url(league_id, week)
+        yield api._weekly_stats_url(year, week)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--server-rps', type=int, default=20)
+    parser.add_argument('--fault-rate', type=float, default=0.05)
+    parser.add_argument('--seasons', type=int, default=3)
+    parser.add_argument('--budgets', default='5,10,20,40')
+    args = parser.parse_args()
+
+    print(f"Stand-in: {args.server_rps} req/s limit, {args.fault_rate:.0%} 500s; "
+          f"{args.seasons} seasons x 34 URLs")
+    for budget in [float(b) for b in args.budgets.split(',')]:
+        with StubServer(max_rps=args.server_rps, fault_rate=args.fault_rate, retry_after=1) as stub:
+            stub.point_api_at()
+            api.configure_client(rate_limit=budget, rate_burst=budget, backoff_base=0.1)
+            api.reset_request_cache()
+            urls = [u for s in range(args.seasons) for u in season_urls(f'bench{s}', 2020 + s)]
+
+            start = time.perf_counter()
+            results = api.fetch_many(urls, concurrency=16)
+            elapsed = time.perf_counter() - start
+
+            failed = sum(1 for r in results.values() if r is None)
+            stats = api.get_throttle_stats()
+            print(f"  budget={budget:5.1f} rps  wall={elapsed:6.2f}s  failed={failed}  "
+                  f"server_faults={stub.faults}  retries={stats['retries']}  "
+                  f"429s={stats['rate_limited']}  throttle_wait={stats['throttle_wait_seconds']}s  "
+                  f"backoff={stats['backoff_seconds']}s")
+
+
+if __name__ == '__main__':
+    main()
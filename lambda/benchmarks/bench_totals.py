@@ -0,0 +1,88 @@
+"""
+Benchmark: player season totals, nested-dict accumulation vs SeasonAccumulator
+Totals N synthetic seasons (~2k players x 17 weeks each) both ways from the
+same decoded weekly payloads, reports CPU time and peak traced memory, and
+checks that weeks played and total points are identical.
+
+Sleeper's weekly rows carry far more stat keys than any league scores
+(ranks, snap counts, pre-computed points); --extra-keys pads each synthetic
+row with that many unscored keys to approximate production payloads.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_totals [--years 3] [--extra-keys 60]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.bench_scoring import SCORING
+from benchmarks.sleeper_stub import build_weekly_stats
+from collectors.player_total_points import SeasonAccumulator, _player_season_stats
+from utils.scoring import ScoringEngine, calculate_player_points
+
+WEEKS = list(range(1, 18))
+
+
+def dict_totals(stats_by_week):
+    """The previous per-key nested-dict accumulation."""
+    year_totals = {}
+    for week in WEEKS:
+        for player_id, stats in stats_by_week[week].items():
+            if player_id not in year_totals:
+                year_totals[player_id] = {'stats': {}, 'weeks_played': 0}
+            for stat_key, stat_value in stats.items():
+                if stat_key not in year_totals[player_id]['stats']:
+                    year_totals[player_id]['stats'][stat_key] = 0
+                if stat_value:
+                    year_totals[player_id]['stats'][stat_key] += stat_value
+            year_totals[player_id]['weeks_played'] += 1
+    return {player_id: (data['weeks_played'], calculate_player_points(data['stats'], SCORING))
+            for player_id, data in year_totals.items()}
+
+
+def columnar_totals(stats_by_week):
+    engine = ScoringEngine(SCORING)
+    accumulator = SeasonAccumulator(engine.stat_keys)
+    for week in WEEKS:
+        accumulator.add_week(stats_by_week[week])
+    points = engine.score_matrix(
+        accumulator.totals,
+        lambda row: _player_season_stats(accumulator.player_ids[row], stats_by_week, WEEKS))[0]
+    return dict(zip(accumulator.player_ids, zip(accumulator.weeks_played.tolist(), points)))
+
+
+def measure(label, fn, seasons):
+    # Timed and traced in separate runs; tracing slows allocation-heavy code most
+    start = time.process_time()
+    results = [fn(stats_by_week) for stats_by_week in seasons]
+    elapsed = time.process_time() - start
+    tracemalloc.start()
+    for stats_by_week in seasons:
+        fn(stats_by_week)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<10} cpu={elapsed:6.3f}s  peak={peak / 2**20:6.1f} MiB")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--extra-keys', type=int, default=0)
+    args = parser.parse_args()
+
+    padding = {f'unscored_{k}': float(k) for k in range(args.extra_keys)}
+    seasons = [{week: {row['player_id']: {**row['stats'], **padding}
+                       for row in build_weekly_stats(2020 + y, week)}
+                for week in WEEKS} for y in range(args.years)]
+    print(f"{args.years} seasons x {len(WEEKS)} weeks, {args.extra_keys} unscored keys per row "
+          f"(peak excludes the decoded payloads)")
+
+    old = measure('dicts', dict_totals, seasons)
+    new = measure('columnar', columnar_totals, seasons)
+    print(f"  identical: {old == new}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: stg_player_details_by_team write path, pandas vs Arrow
+Builds the table from pre-fetched week bundles and encodes it to an
+in-memory Parquet upload body both ways:
+
+  pandas  collector DataFrame -> df.to_parquet(BytesIO) -> getvalue()
+  arrow   collector RecordBatch -> ParquetWriter(BufferOutputStream) -> BufferReader
+
+CPU time and peak memory are measured in separate fresh interpreters per
+path, so neither run inherits the other's allocations. Peak memory is
+reported as Python-heap peak (tracemalloc, includes NumPy) plus Arrow
+memory-pool peak, from the start of collection to the upload body.
+
+Run from the lambda/ directory:
+    python -m benchmarks.bench_write_path [--teams 32 128]
+"""
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import collectors.player_details_by_team as details
+from benchmarks.bench_player_details import WEEKS, build_bundles
+from benchmarks.bench_scoring import SCORING
+from benchmarks.sleeper_stub import build_players
+from utils.players import PlayerDirectory
+
+PATHS = ('pandas', 'arrow')
+
+
+def pandas_body(collect) -> bytes:
+    """The previous writer: DataFrame to Parquet in a BytesIO, copied out as bytes."""
+    df = collect(as_arrow=False)
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, engine='pyarrow', index=False)
+    buffer.seek(0)
+    return buffer.getvalue()
+
+
+def arrow_body(collect) -> pa.BufferReader:
+    batch = collect(as_arrow=True)
+    sink = pa.BufferOutputStream()
+    with pq.ParquetWriter(sink, batch.schema) as writer:
+        writer.write_table(pa.Table.from_batches([batch]))
+    return pa.BufferReader(sink.getvalue())
+
+
+def run_path(path: str, teams: int, mode: str) -> dict:
+    """One measurement of one path in this interpreter."""
+    players = PlayerDirectory.from_players(build_players())
+    details.get_player_directory = lambda: players
+    bundles = build_bundles(teams)
+    roster_to_owner = {r: f'u{r}' for r in range(1, teams + 1)}
+    owner_to_display = {f'u{r}': f'Team {r}' for r in range(1, teams + 1)}
+    # Numeric like the deployed NAME_MAP (Terraform map(number))
+    name_map = {f'Team {r}': r for r in range(1, teams + 1)}
+
+    def collect(as_arrow):
+        return details.collect_player_details_by_team_data(
+            'L', 2023, WEEKS, roster_to_owner, owner_to_display, name_map, SCORING,
+            bundles=bundles, as_arrow=as_arrow)
+
+    body_fn = pandas_body if path == 'pandas' else arrow_body
+    if mode == 'cpu':
+        start = time.process_time()
+        body = body_fn(collect)
+        return {'cpu': time.process_time() - start}
+
+    pool = pa.default_memory_pool()
+    pool_base = pool.bytes_allocated()
+    tracemalloc.start()
+    body = body_fn(collect)
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    data = body if isinstance(body, bytes) else body.read()
+    return {
+        'python_peak': python_peak,
+        'arrow_peak': pool.max_memory() - pool_base,
+        'size': len(data),
+        'table': pq.read_table(io.BytesIO(data)).replace_schema_metadata().to_pydict(),
+    }
+
+
+def measure(path: str, teams: int, mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_write_path',
+         '--child', path, mode, '--teams', str(teams)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--teams', type=int, nargs='+', default=[32, 128])
+    parser.add_argument('--child', nargs=2, metavar=('PATH', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        path, mode = args.child
+        print(json.dumps(run_path(path, args.teams[0], mode)))
+        return
+
+    for teams in args.teams:
+        print(f"{teams} teams x 15 players x {len(WEEKS)} weeks")
+        tables = {}
+        for path in PATHS:
+            cpu = measure(path, teams, 'cpu')['cpu']
+            memory = measure(path, teams, 'memory')
+            tables[path] = memory['table']
+            print(f"  {path:<7} cpu={cpu:6.3f}s  python peak={memory['python_peak'] / 2**20:6.1f} MiB  "
+                  f"arrow peak={memory['arrow_peak'] / 2**20:6.1f} MiB  "
+                  f"parquet={memory['size'] / 2**10:7.1f} KiB")
+        print(f"  identical: {tables['pandas'] == tables['arrow']}")
+
+
+if __name__ == '__main__':
+    main()
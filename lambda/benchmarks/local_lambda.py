@@ -0,0 +1,44 @@
+"""
+Local stand-ins for the Lambda runtime context and the Lambda client
+A LocalContext counts down a wall-clock budget like the real invocation
+deadline; LocalLambda queues asynchronous self re-invocations so they can
+be run one after another in this process.
+"""
+
+import json
+import time
+import uuid
+from collections import deque
+
+
+class LocalContext:
+    """The parts of the Lambda context object lambda_function uses."""
+
+    def __init__(self, budget_seconds: float, function_name: str = 'sleeper-ingest'):
+        self.function_name = function_name
+        self.invoked_function_arn = f'arn:aws:lambda:us-west-2:000000000000:function:{function_name}'
+        self.aws_request_id = str(uuid.uuid4())
+        self._deadline = time.monotonic() + budget_seconds
+
+    def get_remaining_time_in_millis(self) -> int:
+        return max(0, int((self._deadline - time.monotonic()) * 1000))
+
+
+class LocalLambda:
+    """The subset of the boto3 Lambda client used for self re-invocation."""
+
+    def __init__(self):
+        self.queue = deque()
+        self.invoke_count = 0
+
+    def invoke(self, FunctionName, InvocationType='RequestResponse', Payload=b'', **kwargs):
+        self.queue.append(json.loads(Payload))
+        self.invoke_count += 1
+        return {'StatusCode': 202 if InvocationType == 'Event' else 200}
+
+    def run_queued(self, handler, budget_seconds: float) -> list:
+        """Run queued invocations (and any they enqueue) until none are left."""
+        responses = []
+        while self.queue:
+            responses.append(handler(self.queue.popleft(), LocalContext(budget_seconds)))
+        return responses
@@ -0,0 +1,81 @@
+"""
+Local stand-in for the S3 client used by lambda_function
+Writes objects to a directory so handler runs can be inspected and diffed.
+"""
+
+import io
+import json
+import os
+
+
+class LocalS3:
+    """The subset of the boto3 S3 client that lambda_function uses, backed by a directory."""
+
+    class exceptions:
+        class ClientError(Exception):
+            def __init__(self, code: str, key: str):
+                super().__init__(f"{code}: {key}")
+                self.response = {'Error': {'Code': code}}
+
+        class NoSuchKey(ClientError):
+            def __init__(self, key: str):
+                super().__init__('NoSuchKey', key)
+
+    def __init__(self, root: str):
+        self.root = root
+        self.put_count = 0
+        self.put_bytes = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def put_object(self, Bucket, Key, Body, Metadata=None, **kwargs):
+        path = self._path(Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = Body.read() if hasattr(Body, 'read') else bytes(Body)
+        with open(path, 'wb') as f:
+            f.write(data)
+        with open(path + '.metadata.json', 'w') as f:
+            json.dump(Metadata or {}, f)
+        self.put_count += 1
+        self.put_bytes += len(data)
+        return {}
+
+    def get_object(self, Bucket, Key, **kwargs):
+        path = self._path(Key)
+        if not os.path.exists(path):
+            raise self.exceptions.NoSuchKey(Key)
+        with open(path, 'rb') as f:
+            data = f.read()
+        return {'Body': io.BytesIO(data), 'ContentLength': len(data),
+                'Metadata': self._metadata(path)}
+
+    def head_object(self, Bucket, Key, **kwargs):
+        path = self._path(Key)
+        if not os.path.exists(path):
+            # Like S3, HEAD reports a missing key as a bare 404
+            raise self.exceptions.ClientError('404', Key)
+        return {'ContentLength': os.path.getsize(path), 'Metadata': self._metadata(path)}
+
+    def list_objects_v2(self, Bucket, Prefix='', **kwargs):
+        keys = []
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                key = os.path.relpath(os.path.join(directory, name), self.root).replace(os.sep, '/')
+                if key.startswith(Prefix) and not key.endswith('.metadata.json'):
+                    keys.append(key)
+        return {'Contents': [{'Key': key} for key in sorted(keys)], 'IsTruncated': False}
+
+    def delete_objects(self, Bucket, Delete, **kwargs):
+        for obj in Delete['Objects']:
+            for path in (self._path(obj['Key']), self._path(obj['Key']) + '.metadata.json'):
+                if os.path.exists(path):
+                    os.remove(path)
+        return {}
+
+    def _metadata(self, path: str):
+        try:
+            with open(path + '.metadata.json') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
@@ -0,0 +1,94 @@
+"""
+Run lambda_function.handler end to end from a Sleeper cassette
+No network and no AWS: Sleeper responses come from the cassette and the
+staging tables are written to a local directory.
+
+Run from the lambda/ directory:
+
+    # record once (needs network, CURRENT_LEAGUE_ID / HISTORICAL_LEAGUES set)
+    python -m benchmarks.replay_handler --cassette run.json.gz --record --out out_live
+
+    # replay offline, optionally with cProfile and simulated latency
+    python -m benchmarks.replay_handler --cassette run.json.gz --out out_a --profile
+    python -m benchmarks.replay_handler --cassette run.json.gz --out out_b --latency recorded
+
+    # compare two runs byte for byte
+    python -m benchmarks.replay_handler --compare out_a out_b
+"""
+
+import argparse
+import cProfile
+import filecmp
+import json
+import os
+import pstats
+import sys
+import time
+
+
+def compare(dir_a: str, dir_b: str) -> bool:
+    """Byte-for-byte comparison of two output trees (ignoring metadata sidecars)."""
+    def files(root):
+        return sorted(os.path.relpath(os.path.join(d, f), root)
+                      for d, _, names in os.walk(root) for f in names
+                      if not f.endswith('.metadata.json'))
+
+    left, right = files(dir_a), files(dir_b)
+    same = left == right
+    if not same:
+        print(f"File sets differ: only in {dir_a}: {sorted(set(left) - set(right))}, "
+              f"only in {dir_b}: {sorted(set(right) - set(left))}")
+    for rel in sorted(set(left) & set(right)):
+        if not filecmp.cmp(os.path.join(dir_a, rel), os.path.join(dir_b, rel), shallow=False):
+            print(f"  DIFFERENT: {rel}")
+            same = False
+    print("IDENTICAL" if same else "DIFFERENT")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--cassette')
+    parser.add_argument('--record', action='store_true')
+    parser.add_argument('--latency', default='0', help="seconds per request, or 'recorded'")
+    parser.add_argument('--event', default='{"backfill_historical": true}')
+    parser.add_argument('--out', default='replay_out')
+    parser.add_argument('--profile', action='store_true')
+    parser.add_argument('--compare', nargs=2, metavar=('DIR_A', 'DIR_B'))
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(0 if compare(*args.compare) else 1)
+
+    # Must be set before lambda_function / utils.api are imported
+    os.environ['SLEEPER_CASSETTE'] = args.cassette
+    os.environ['SLEEPER_CASSETTE_MODE'] = 'record' if args.record else 'replay'
+    os.environ['SLEEPER_CASSETTE_LATENCY'] = args.latency
+    os.environ['RESPONSE_CACHE'] = 'none'
+    os.environ.setdefault('LAKE_BUCKET', 'local')
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
+    if not args.record:
+        os.environ.setdefault('SLEEPER_RATE_LIMIT', '1000000')
+        os.environ.setdefault('SLEEPER_RATE_BURST', '1000000')
+
+    import lambda_function
+    from benchmarks.local_s3 import LocalS3
+    lambda_function.s3_client = LocalS3(args.out)
+
+    event = json.loads(args.event)
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    result = lambda_function.handler(event, None)
+    if profiler:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    print(f"\nstatusCode={result['statusCode']} elapsed={elapsed:.2f}s output={args.out}")
+    if profiler:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+
+
+if __name__ == '__main__':
+    main()
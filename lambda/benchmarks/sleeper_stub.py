@@ -0,0 +1,286 @@
+"""
+Local stand-in for the Sleeper API
+Serves deterministic synthetic league, matchup, player and stats payloads
+over HTTP/1.1 keep-alive so the collectors can be benchmarked offline.
+
+Usage:
+    with StubServer(latency=0.02) as stub:
+        stub.point_api_at()   # redirect utils.api to the stub
+        ...
+"""
+
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+
+NUM_PLAYERS = 2000
+NUM_ROSTERS = 10
+ROSTER_SIZE = 15
+STARTERS = 9
+
+POSITIONS = ['QB', 'RB', 'WR', 'TE', 'K', 'DEF']
+TEAMS = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN',
+         'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LV', 'LAC', 'LAR', 'MIA']
+STAT_KEYS = ['pass_yd', 'pass_td', 'pass_int', 'pass_att', 'pass_cmp', 'rush_yd',
+             'rush_td', 'rush_att', 'rush_fd', 'rec', 'rec_yd', 'rec_td', 'rec_tgt',
+             'rec_fd', 'fgm', 'fga', 'fgm_30_39', 'fgm_40_49', 'xpm', 'xpa',
+             'def_int', 'def_sack', 'def_td', 'pts_allow', 'pts_allow_14_20',
+             'fum_lost', 'off_snp', 'tm_off_snp', 'pos_rank_ppr']
+
+
+def build_players(seed: int = 7) -> Dict[str, Dict]:
+    """Synthetic /players/nfl payload (player_id -> ~40 key dict)."""
+    rng = random.Random(seed)
+    players = {}
+    for i in range(1, NUM_PLAYERS + 1):
+        pid = str(i)
+        info = {
+            'player_id': pid,
+            'first_name': f'First{i}',
+            'last_name': f'Last{i}',
+            'position': POSITIONS[i % len(POSITIONS)],
+            'team': TEAMS[i % len(TEAMS)] if i % 9 else None,
+        }
+        # Padding fields so the payload has a realistic shape and size
+        for k in range(35):
+            info[f'field_{k}'] = rng.choice([None, rng.randint(0, 9999), f'value_{rng.randint(0, 999)}'])
+        players[pid] = info
+    return players
+
+
+def build_weekly_stats(year: int, week: int) -> List[Dict]:
+    """Synthetic /stats/nfl/{year}/{week} payload (list of player stat rows)."""
+    rng = random.Random(year * 100 + week)
+    rows = []
+    for i in range(1, NUM_PLAYERS + 1):
+        if rng.random() < 0.25:
+            continue
+        stats = {key: round(rng.uniform(0, 40), 1) for key in rng.sample(STAT_KEYS, 12)}
+        stats['gp'] = 1
+        rows.append({'player_id': str(i), 'week': week, 'season': str(year), 'stats': stats})
+    return rows
+
+
+def build_season_stats(year: int) -> List[Dict]:
+    """Synthetic season-aggregate stats, summed over the regular season's weekly payloads."""
+    totals: Dict[str, Dict] = {}
+    for week in range(1, 18 if year <= 2020 else 19):
+        for row in build_weekly_stats(year, week):
+            agg = totals.setdefault(row['player_id'], {})
+            for key, value in row['stats'].items():
+                agg[key] = agg.get(key, 0) + value
+    return [{'player_id': pid, 'season': str(year), 'stats': stats} for pid, stats in totals.items()]
+
+
+def build_rosters(league_id: str) -> List[Dict]:
+    return [{
+        'roster_id': r,
+        'owner_id': f'{league_id}-u{r}',
+        'settings': {'wins': r % 8, 'losses': 14 - r % 8, 'fpts': 1400 + r * 7,
+                     'fpts_decimal': r * 3, 'fpts_against': 1350 + r * 5,
+                     'fpts_against_decimal': r * 2},
+    } for r in range(1, NUM_ROSTERS + 1)]
+
+
+def build_users(league_id: str) -> List[Dict]:
+    return [{'user_id': f'{league_id}-u{r}', 'display_name': str(r)}
+            for r in range(1, NUM_ROSTERS + 1)]
+
+
+def build_name_map() -> Dict[str, int]:
+    """NAME_MAP for the stand-in league; Terraform renders it as display name -> member_id number."""
+    return {str(r): r for r in range(1, NUM_ROSTERS + 1)}
+
+
+def build_matchups(league_id: str, week: int) -> List[Dict]:
+    rng = random.Random(f'{league_id}-{week}')
+    player_ids = [str(i) for i in rng.sample(range(1, NUM_PLAYERS + 1), NUM_ROSTERS * ROSTER_SIZE)]
+    order = list(range(1, NUM_ROSTERS + 1))
+    rng.shuffle(order)
+    matchups = []
+    for slot, roster_id in enumerate(order):
+        roster_players = player_ids[(roster_id - 1) * ROSTER_SIZE: roster_id * ROSTER_SIZE]
+        starters = roster_players[:STARTERS]
+        players_points = {pid: round(rng.uniform(0, 30), 2) for pid in roster_players}
+        matchups.append({
+            'roster_id': roster_id,
+            'matchup_id': slot // 2 + 1,
+            'points': round(sum(players_points[p] for p in starters), 2),
+            'starters': starters,
+            'players': roster_players,
+            'starters_points': [players_points[p] for p in starters],
+            'players_points': players_points,
+        })
+    return matchups
+
+
+def build_bracket() -> List[Dict]:
+    return [{'r': 1, 'm': 1, 't1': 1, 't2': 4}, {'r': 1, 'm': 2, 't1': 2, 't2': 3},
+            {'r': 2, 'm': 3, 't1': 1, 't2': 2}]
+
+
+ROUTES = [
+    (re.compile(r'^/v1/league/([^/]+)/rosters$'), lambda m, y: build_rosters(m.group(1))),
+    (re.compile(r'^/v1/league/([^/]+)/users$'), lambda m, y: build_users(m.group(1))),
+    (re.compile(r'^/v1/league/([^/]+)/matchups/(\d+)$'), lambda m, y: build_matchups(m.group(1), int(m.group(2)))),
+    (re.compile(r'^/v1/league/([^/]+)/winners_bracket$'), lambda m, y: build_bracket()),
+    (re.compile(r'^/v1/players/nfl$'), lambda m, y: build_players()),
+    (re.compile(r'^/v1/state/nfl$'), lambda m, y: {'week': 17, 'season': str(y)}),
+    (re.compile(r'^/stats/nfl/(\d+)/(\d+)$'), lambda m, y: build_weekly_stats(int(m.group(1)), int(m.group(2)))),
+    (re.compile(r'^/stats/nfl/(\d+)$'), lambda m, y: build_season_stats(int(m.group(1)))),
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        path = self.path.split('?', 1)[0]
+        with server.lock:
+            server.request_count += 1
+            server.paths.append(path)
+        if server.latency:
+            time.sleep(server.latency)
+        if server.stall and re.search(server.stall, path):
+            time.sleep(server.stall_seconds)
+        if self._inject_fault():
+            return
+
+        body = server.body_cache.get(path)
+        if body is None:
+            for pattern, build in ROUTES:
+                match = pattern.match(path)
+                if match:
+                    body = json.dumps(build(match, server.year)).encode()
+                    server.body_cache[path] = body
+                    break
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        headers = {'Content-Type': 'application/json', 'ETag': etag}
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            gz_path = path + '#gzip'
+            if gz_path not in server.body_cache:
+                server.body_cache[gz_path] = gzip.compress(body, compresslevel=1)
+            body = server.body_cache[gz_path]
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(200)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def _inject_fault(self) -> bool:
+        """Reply 429 above max_rps or 500 at fault_rate; True if a fault was sent."""
+        server = self.server
+        status, headers = None, {}
+        with server.lock:
+            now = time.monotonic()
+            if server.max_rps:
+                window = server.recent
+                while window and now - window[0] > 1.0:
+                    window.popleft()
+                if len(window) >= server.max_rps:
+                    status, headers = 429, {'Retry-After': str(server.retry_after)}
+                else:
+                    window.append(now)
+            if status is None and server.fault_rate and server.rng.random() < server.fault_rate:
+                status = 500
+            if status:
+                server.faults[status] = server.faults.get(status, 0) + 1
+        if status is None:
+            return False
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return True
+
+
+class StubServer:
+    """
+    Threaded local Sleeper stand-in.
+
+    Args:
+        latency: Seconds of artificial server-side latency per request
+        year: Season reported by /state/nfl
+        fault_rate: Fraction of requests answered with a 500
+        max_rps: Requests per rolling second before answering 429
+        retry_after: Retry-After seconds sent with 429s
+        stall: Regex of paths whose requests hang for stall_seconds before any reply
+    """
+
+    def __init__(self, latency: float = 0.0, year: int = 2024, fault_rate: float = 0.0,
+                 max_rps: int = 0, retry_after: float = 1, stall: str = None,
+                 stall_seconds: float = 600):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.year = year
+        self.httpd.lock = threading.Lock()
+        self.httpd.request_count = 0
+        self.httpd.paths = []
+        self.httpd.body_cache = {}
+        self.httpd.fault_rate = fault_rate
+        self.httpd.max_rps = max_rps
+        self.httpd.retry_after = retry_after
+        self.httpd.stall = stall
+        self.httpd.stall_seconds = stall_seconds
+        self.httpd.recent = deque()
+        self.httpd.faults = {}
+        self.httpd.rng = random.Random(0)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address
+        return f'http://{host}:{port}'
+
+    @property
+    def request_count(self) -> int:
+        return self.httpd.request_count
+
+    @property
+    def faults(self) -> Dict[int, int]:
+        return dict(self.httpd.faults)
+
+    def point_api_at(self):
+        """Redirect utils.api to this server."""
+        from utils import api
+        api.API_BASE = f'{self.base_url}/v1'
+        api.STATS_BASE = self.base_url
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
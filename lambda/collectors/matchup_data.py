@@ -5,14 +5,19 @@ Outputs to: stg_matchup_data
 """
 
 import pandas as pd
-from typing import Dict, List
-from utils.api import get_matchups
+import pyarrow as pa
+from typing import Dict, List, Optional, Union
 from utils.mappings import get_real_name
+from utils.pairing import pair_opponents
+from utils.schemas import MATCHUP_DATA, from_pandas
+from utils.weeks import WeekBundle, fetch_week_bundles
 
 
 def collect_matchup_data(league_id: str, year: int, weeks: range,
                          roster_to_owner: Dict, owner_to_display: Dict, 
-                         name_map: Dict) -> pd.DataFrame:
+                         name_map: Dict,
+                         bundles: Optional[Dict[int, WeekBundle]] = None,
+                         as_arrow: bool = False) -> Union[pd.DataFrame, pa.RecordBatch]:
     """
     Collect weekly matchup data for regular season.
     
@@ -23,22 +28,29 @@ def collect_matchup_data(league_id: str, year: int, weeks: range,
         roster_to_owner: Mapping of roster_id -> owner_id
         owner_to_display: Mapping of owner_id -> display_name
         name_map: Mapping of display_name -> real_name
+        bundles: Pre-fetched week bundles (fetched here if not given)
+        as_arrow: Return a RecordBatch against the declared table schema
         
     Returns:
-        DataFrame with weekly matchup data including opponents
+        DataFrame (or RecordBatch) with weekly matchup data including opponents
     """
     print(f"  Collecting weekly matchups...")
     
     all_data = []
+    if bundles is None:
+        bundles = fetch_week_bundles(league_id, year, weeks)
     
     for week in weeks:
-        matchups = get_matchups(league_id, week)
+        matchups = bundles[week].matchups
         if not matchups:
             continue
             
         for matchup in matchups:
             team_id = matchup['roster_id']
             matchup_id = matchup['matchup_id']
+            if matchup_id is None:
+                # Bye week or unassigned pairing; there is no opponent row to write
+                continue
             points_scored = matchup['points']
             owner_id = roster_to_owner.get(team_id)
             real_name = get_real_name(owner_id, owner_to_display, name_map)
@@ -62,6 +74,8 @@ def collect_matchup_data(league_id: str, year: int, weeks: range,
     df['points_scored'] = df['points_scored'].astype('float64')
     df['opponent_points'] = df['opponent_points'].astype('float64')
     
+    if as_arrow:
+        return from_pandas(df, MATCHUP_DATA)
     return df
 
 
@@ -70,19 +84,7 @@ def _assign_opponents(df: pd.DataFrame) -> pd.DataFrame:
     Add opponent information to matchup data.
     Teams with the same matchup_id in the same week face each other.
     """
-    df['opponent_team_id'] = None
-    df['opponent_points'] = None
-
-    def assign_opponent_data(group):
-        if len(group) == 2:
-            team1, team2 = group.iloc[0], group.iloc[1]
-            group.loc[group.index[0], 'opponent_team_id'] = team2['team_id']
-            group.loc[group.index[1], 'opponent_team_id'] = team1['team_id']
-            group.loc[group.index[0], 'opponent_points'] = team2['points_scored']
-            group.loc[group.index[1], 'opponent_points'] = team1['points_scored']
-        return group
-
-    res = df.groupby(['week', 'matchup_id'], group_keys=False).apply(assign_opponent_data)
+    res = pair_opponents(df, id_col='team_id', points_col='points_scored')
     # Drop 'year' before writing; it's provided by the S3 partition
     res = res.drop(columns=['year'], errors='ignore')
-    return res
\ No newline at end of file
+    return res
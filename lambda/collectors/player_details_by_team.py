@@ -4,20 +4,37 @@ Collects individual player statistics and fantasy points by team
 Outputs to: stg_player_details_by_team
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict
-from utils.api import get_matchups, get_weekly_stats, get_all_players
+import pyarrow as pa
+from typing import Dict, Optional, Union
 from utils.mappings import get_real_name
-from utils.scoring import calculate_player_points
+from utils.players import get_player_directory
+from utils.schemas import STAT_COLUMNS, player_details_schema, to_record_batch
+from utils.scoring import ScoringEngine
+from utils.weeks import WeekBundle, fetch_week_bundles
+
+
+_STATS_TYPE = pa.struct([(col, pa.float64()) for col in STAT_COLUMNS])
+_NO_STATS: Dict = {}
 
 
 def collect_player_details_by_team_data(league_id: str, year: int, weeks: range,
                         roster_to_owner: Dict, owner_to_display: Dict,
-                        name_map: Dict, scoring_settings: Dict) -> pd.DataFrame:
+                        name_map: Dict, scoring_settings: Dict,
+                        bundles: Optional[Dict[int, WeekBundle]] = None,
+                        league_scored: bool = False,
+                        include_stat_columns: bool = True,
+                        scoring_profiles: Optional[Dict[str, Dict]] = None,
+                        as_arrow: bool = False) -> Union[pd.DataFrame, pa.RecordBatch]:
     """
     Collect player-level data for all weeks by team.
     This includes individual player fantasy points.
     
+    In league-scored mode fantasy points come from the matchup payload's
+    players_points (what Sleeper shows), and the weekly stats download is
+    skipped unless the raw stat columns are requested.
+    
     Args:
         league_id: Sleeper league ID
         year: Season year
@@ -26,114 +43,93 @@ def collect_player_details_by_team_data(league_id: str, year: int, weeks: range,
         owner_to_display: Mapping of owner_id -> display_name
         name_map: Mapping of display_name -> real_name
         scoring_settings: League scoring configuration
+        bundles: Pre-fetched week bundles (fetched here if not given); must
+            carry stats unless league_scored and not include_stat_columns
+        league_scored: Take fantasy points from the matchups' players_points
+        include_stat_columns: Fill the raw stat columns (otherwise left null)
+        scoring_profiles: Alternative scoring configurations by name; each
+            adds a fantasy_points_{name} column scored from the same stats
+        as_arrow: Return a RecordBatch against the declared table schema
         
     Returns:
-        DataFrame with player-level data by team
+        DataFrame (or RecordBatch) with player-level data by team
     """
     print(f"  Collecting player details by team (this may take a while)...")
     
-    # Get players map once
-    players_map = get_all_players()
+    # Get player directory once
+    players = get_player_directory()
+    
+    # Output columns, appended to per matchup and typed once at the end
+    week_col, team_col, roster_col, player_col, starter_col = [], [], [], [], []
+    league_points = []
+    # Every row's stats, scored together once all weeks are collected
+    row_stats = []
+    scoring_engine = ScoringEngine(scoring_settings, scoring_profiles)
     
-    all_player_data = []
+    needs_stats = include_stat_columns or not league_scored or bool(scoring_profiles)
+    if bundles is None:
+        bundles = fetch_week_bundles(league_id, year, weeks,
+                                     stats_weeks=weeks if needs_stats else ())
     
     for week in weeks:
         print(f"    Processing Week {week}...")
         
-        matchups = get_matchups(league_id, week)
+        matchups = bundles[week].matchups
         if not matchups:
             continue
         
         # Get weekly stats for all players
-        weekly_stats = get_weekly_stats(year, week)
+        weekly_stats = bundles[week].stats
         
         for matchup in matchups:
             roster_id = matchup['roster_id']
             owner_id = roster_to_owner.get(roster_id)
             team_name = get_real_name(owner_id, owner_to_display, name_map)
             
-            starters = matchup.get('starters', [])
-            all_players = matchup.get('players', [])
+            starters = set(matchup.get('starters') or [])
+            player_ids = [player_id for player_id in matchup.get('players') or [] if player_id]
+            players_points = (matchup.get('players_points') or {}) if league_scored else {}
             
-            for player_id in all_players:
-                if not player_id:
-                    continue
-                
-                is_starter = player_id in starters
-                player_info = players_map.get(player_id, {})
-                player_stats = weekly_stats.get(player_id, {})
-                
-                # Calculate fantasy points
-                fantasy_points = calculate_player_points(player_stats, scoring_settings)
-                
-                # Extract key stats (will be NaN if not applicable for position)
-                stats_dict = {
-                    # Passing
-                    'pass_yd': player_stats.get('pass_yd', None),
-                    'pass_td': player_stats.get('pass_td', None),
-                    'pass_int': player_stats.get('pass_int', None),
-                    'pass_att': player_stats.get('pass_att', None),
-                    'pass_cmp': player_stats.get('pass_cmp', None),
-                    
-                    # Rushing
-                    'rush_yd': player_stats.get('rush_yd', None),
-                    'rush_td': player_stats.get('rush_td', None),
-                    'rush_att': player_stats.get('rush_att', None),
-                    
-                    # Receiving  
-                    'rec': player_stats.get('rec', None),
-                    'rec_yd': player_stats.get('rec_yd', None),
-                    'rec_td': player_stats.get('rec_td', None),
-                    'rec_tgt': player_stats.get('rec_tgt', None),
-                    
-                    # Kicking
-                    'fgm': player_stats.get('fgm', None),
-                    'fga': player_stats.get('fga', None),
-                    'xpm': player_stats.get('xpm', None),
-                    'xpa': player_stats.get('xpa', None),
-                    
-                    # Defense
-                    'def_int': player_stats.get('def_int', None),
-                    'def_sack': player_stats.get('def_sack', None),
-                    'def_td': player_stats.get('def_td', None),
-                    'pts_allow': player_stats.get('pts_allow', None),
-                    
-                    # Misc
-                    'fum_lost': player_stats.get('fum_lost', None),
-                }
-                
-                all_player_data.append({
-                    'year': year,
-                    'week': week,
-                    'team_name': team_name,
-                    'roster_id': roster_id,
-                    'player_id': player_id,
-                    'player_name': f"{player_info.get('first_name', '')} {player_info.get('last_name', '')}".strip() or player_id,
-                    'position': player_info.get('position', 'Unknown'),
-                    'nfl_team': player_info.get('team', 'FA'),
-                    'is_starter': is_starter,
-                    'fantasy_points': fantasy_points,
-                    **stats_dict  # Add all stats columns
-                })
+            week_col.extend([week] * len(player_ids))
+            team_col.extend([team_name] * len(player_ids))
+            roster_col.extend([roster_id] * len(player_ids))
+            player_col.extend(player_ids)
+            starter_col.extend([player_id in starters for player_id in player_ids])
+            row_stats.extend([weekly_stats.get(player_id, _NO_STATS) for player_id in player_ids])
+            # League-scored points when available, otherwise calculated from stats
+            league_points.extend([float(players_points[player_id] or 0.0)
+                                  if player_id in players_points else np.nan
+                                  for player_id in player_ids])
     
-    df = pd.DataFrame(all_player_data)
+    names, positions, nfl_teams = players.lookup_columns(player_col)
+    points, *profile_points = scoring_engine.score_all(row_stats)
+    league_points = np.array(league_points, dtype='float64')
+    fantasy_points = np.where(np.isnan(league_points), np.array(points, dtype='float64'), league_points)
     
-    # Ensure correct data types
-    df['week'] = df['week'].astype('int64')
-    df['roster_id'] = df['roster_id'].astype('int64')
-    df['fantasy_points'] = df['fantasy_points'].astype('float64')
-    df['is_starter'] = df['is_starter'].astype('bool')
+    columns = {
+        'week': np.array(week_col, dtype='int64'),
+        'team_name': team_col,
+        'roster_id': np.array(roster_col, dtype='int64'),
+        'player_id': player_col,
+        'player_name': names,
+        'position': positions,
+        'nfl_team': nfl_teams,
+        'is_starter': np.array(starter_col, dtype='bool'),
+        'fantasy_points': fantasy_points,
+    }
     
-    # Cast all stat columns to float64
-    stat_columns = ['pass_yd', 'pass_td', 'pass_int', 'pass_att', 'pass_cmp',
-                    'rush_yd', 'rush_td', 'rush_att', 'rec', 'rec_yd', 'rec_td', 
-                    'rec_tgt', 'fgm', 'fga', 'xpm', 'xpa', 'def_int', 'def_sack', 
-                    'def_td', 'pts_allow', 'fum_lost']
-    for col in stat_columns:
-        if col in df.columns:
-            df[col] = df[col].astype('float64')
+    # Key stats (NaN if not applicable for position)
+    if include_stat_columns:
+        stats = pa.array(row_stats, type=_STATS_TYPE)
+        for i, col in enumerate(STAT_COLUMNS):
+            columns[col] = stats.field(i).to_numpy(zero_copy_only=False)
+    else:
+        for col in STAT_COLUMNS:
+            columns[col] = np.full(len(player_col), np.nan)
     
-    # **CRITICAL: Drop year column since it's provided by partition path**
-    df = df.drop(columns=['year'], errors='ignore')
+    for name, column_points in zip(scoring_engine.profile_names, profile_points):
+        columns[f'fantasy_points_{name}'] = np.array(column_points, dtype='float64')
     
-    return df    
\ No newline at end of file
+    if as_arrow:
+        return to_record_batch(columns, player_details_schema(scoring_engine.profile_names))
+    return pd.DataFrame(columns)
@@ -5,89 +5,211 @@ Outputs to: stg_player_total_points
 Used for draft value analysis
 """
 
+import numpy as np
 import pandas as pd
-from typing import List
-from utils.api import get_weekly_stats, get_all_players
-from utils.scoring import calculate_player_points
+import pyarrow as pa
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from utils.api import get_season_stats, get_weekly_stats_by_week, regular_season_weeks
+from utils.players import get_player_directory
+from utils.schemas import player_total_points_schema, to_record_batch
+from utils.scoring import ScoringEngine
 
 
-def collect_player_total_points_data(years: List[int], scoring_settings: dict) -> pd.DataFrame:
+# Season points per player: (player_ids, weeks_played, one points list per scoring configuration)
+SeasonPoints = Tuple[List[str], List[int], List[List[float]]]
+
+
+def collect_player_total_points_data(years: List[int], scoring_settings: dict,
+                                     weeks: Iterable[int] = range(1, 18),
+                                     use_season_aggregate: bool = False,
+                                     scoring_profiles: Optional[Dict[str, Dict]] = None,
+                                     weekly_stats: Optional[Mapping[int, Mapping[str, Dict]]] = None,
+                                     as_arrow: bool = False) -> Union[pd.DataFrame, pa.RecordBatch]:
     """
     Collect season totals for all players across multiple years.
     This creates a lookup table for draft analysis.
-    Uses weeks 1-17 (full fantasy season including playoffs).
+    Uses weeks 1-17 (full fantasy season including playoffs) by default.
     
     Args:
         years: List of years to collect (e.g., [2021, 2022, 2023, 2024])
         scoring_settings: League scoring configuration
+        weeks: Weeks to total
+        use_season_aggregate: Fetch one season-aggregate payload per year
+            whose regular season is exactly these weeks (other years use
+            the weekly stats). weeks_played is then Sleeper's games-played
+            count ('gp'); tests/test_totals_parity.py checks it against the
+            weekly path on recorded payloads
+        scoring_profiles: Alternative scoring configurations by name; each
+            adds a total_fantasy_points_{name} column
+        weekly_stats: Weekly stats already fetched, by week (single-year
+            calls); only the other weeks are requested
+        as_arrow: Return a RecordBatch against the declared table schema
         
     Returns:
-        DataFrame with player season totals
+        DataFrame (or RecordBatch) with player season totals
     """
-    print(f"\n  Collecting historical player totals for {len(years)} years (weeks 1-17)...")
-    
-    # Get players map once
-    players_map = get_all_players()
+    weeks = list(weeks)
+    print(f"\n  Collecting historical player totals for {len(years)} years (weeks {weeks[0]}-{weeks[-1]})...")
     
-    all_player_totals = []
+    # Get player directory once
+    players = get_player_directory()
     
-    # Use full fantasy season (weeks 1-17)
-    weeks = range(1, 18)
+    columns = {
+        'year': [], 'player_id': [], 'player_name': [], 'position': [], 'nfl_team': [],
+        'weeks_played': [], 'total_fantasy_points': [], 'avg_points_per_game': [],
+    }
+    scoring_engine = ScoringEngine(scoring_settings, scoring_profiles)
+    profile_columns = [f'total_fantasy_points_{name}' for name in scoring_engine.profile_names]
+    for col in profile_columns:
+        columns[col] = []
     
     for year in years:
-        print(f"    Processing {year}...")
-        year_totals = {}
+        season = None
+        if use_season_aggregate and weeks == list(regular_season_weeks(year)):
+            print(f"    Processing {year} (season aggregate)...")
+            season = _season_aggregate_points(year, scoring_engine)
+            if season is None:
+                print(f"    No season aggregate for {year}, falling back to weekly stats")
+        if season is None:
+            print(f"    Processing {year} (weekly stats, {len(weeks)} weeks)...")
+            season = _weekly_points(year, weeks, scoring_engine, weekly_stats or {})
         
-        for week in weeks:
-            weekly_stats = get_weekly_stats(year, week)
-            
-            for player_id, stats in weekly_stats.items():
-                if player_id not in year_totals:
-                    year_totals[player_id] = {
-                        'stats': {},
-                        'weeks_played': 0
-                    }
-                
-                # Accumulate stats
-                for stat_key, stat_value in stats.items():
-                    if stat_key not in year_totals[player_id]['stats']:
-                        year_totals[player_id]['stats'][stat_key] = 0
-                    if stat_value:
-                        year_totals[player_id]['stats'][stat_key] += stat_value
-                
-                year_totals[player_id]['weeks_played'] += 1
-        
-        # Calculate fantasy points for each player
-        for player_id, player_data in year_totals.items():
-            player_info = players_map.get(player_id, {})
-            total_points = calculate_player_points(player_data['stats'], scoring_settings)
-            
-            player_name = f"{player_info.get('first_name', '')} {player_info.get('last_name', '')}".strip() or player_id
-            
-            all_player_totals.append({
-                'year': year,
-                'player_id': player_id,
-                'player_name': player_name,
-                'position': player_info.get('position', 'Unknown'),
-                'nfl_team': player_info.get('team', 'FA'),
-                'weeks_played': player_data['weeks_played'],
-                'total_fantasy_points': round(total_points, 2),
-                'avg_points_per_game': round(total_points / player_data['weeks_played'], 2) if player_data['weeks_played'] > 0 else 0
-            })
+        player_ids, weeks_played, (season_points, *profile_points) = season
+        names, positions, nfl_teams = players.lookup_columns(player_ids)
+        columns['year'].extend([year] * len(player_ids))
+        columns['player_id'].extend(player_ids)
+        columns['player_name'].extend(names)
+        columns['position'].extend(positions)
+        columns['nfl_team'].extend(nfl_teams)
+        columns['weeks_played'].extend(weeks_played)
+        columns['total_fantasy_points'].extend(round(total, 2) for total in season_points)
+        columns['avg_points_per_game'].extend(
+            round(total / played, 2) if played > 0 else 0.0
+            for total, played in zip(season_points, weeks_played)
+        )
+        for col, points in zip(profile_columns, profile_points):
+            columns[col].extend(points)
     
-    df = pd.DataFrame(all_player_totals)
+    # Sort by year, then total points descending (stable, like pandas' multi-key sort)
+    totals = np.array(columns['total_fantasy_points'], dtype='float64')
+    order = np.lexsort((-totals, np.array(columns['year'], dtype='int64')))
     
-    # Sort by year and total points
-    df = df.sort_values(['year', 'total_fantasy_points'], ascending=[True, False])
+    print(f"    Collected totals for {len(order)} player-seasons")
     
-    print(f"    Collected totals for {len(df)} player-seasons")
+    # **CRITICAL: Drop year column if it's a partition**
+    del columns['year']
+    sorted_columns = {
+        'player_id': [columns['player_id'][i] for i in order],
+        'player_name': [columns['player_name'][i] for i in order],
+        'position': [columns['position'][i] for i in order],
+        'nfl_team': [columns['nfl_team'][i] for i in order],
+        'weeks_played': np.array(columns['weeks_played'], dtype='int64')[order],
+        'total_fantasy_points': totals[order],
+        'avg_points_per_game': np.array(columns['avg_points_per_game'], dtype='float64')[order],
+    }
+    for col in profile_columns:
+        sorted_columns[col] = np.array(columns[col], dtype='float64')[order]
     
-    # Ensure correct data types
-    df['weeks_played'] = df['weeks_played'].astype('int64')
-    df['total_fantasy_points'] = df['total_fantasy_points'].astype('float64')
-    df['avg_points_per_game'] = df['avg_points_per_game'].astype('float64')
+    if as_arrow:
+        return to_record_batch(sorted_columns, player_total_points_schema(scoring_engine.profile_names))
+    return pd.DataFrame(sorted_columns)
+
+
+class SeasonAccumulator:
+    """
+    Running season totals held as a players x stat_keys float array.
+
+    Only the scored stat keys are kept. Rows are added in first-seen order
+    and the array grows by doubling; weeks_played counts the weeks each
+    player had a stat row.
+    """
+
+    def __init__(self, stat_keys: Sequence[str], capacity: int = 4096):
+        self.stat_keys = tuple(stat_keys)
+        self._struct_type = pa.struct([(key, pa.float64()) for key in self.stat_keys])
+        self.player_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._totals = np.zeros((capacity, len(self.stat_keys)), dtype='float64')
+        self._weeks_played = np.zeros(capacity, dtype='int64')
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    def _row_indices(self, player_ids: Iterable[str]) -> np.ndarray:
+        rows = self._rows
+        indices = []
+        for player_id in player_ids:
+            row = rows.get(player_id)
+            if row is None:
+                row = rows[player_id] = len(self.player_ids)
+                self.player_ids.append(player_id)
+            indices.append(row)
+        if len(self.player_ids) > len(self._weeks_played):
+            self._grow(len(self.player_ids))
+        return np.array(indices, dtype='int64')
+
+    def _grow(self, needed: int):
+        capacity = max(needed, 2 * len(self._weeks_played))
+        totals = np.zeros((capacity, len(self.stat_keys)), dtype='float64')
+        totals[:len(self._totals)] = self._totals
+        weeks_played = np.zeros(capacity, dtype='int64')
+        weeks_played[:len(self._weeks_played)] = self._weeks_played
+        self._totals, self._weeks_played = totals, weeks_played
+
+    def add_week(self, weekly_stats: Dict[str, Dict]):
+        """Add one week's player_id -> stats payload."""
+        if not weekly_stats:
+            return
+        rows = self._row_indices(weekly_stats)
+        # Arrow pulls the scored keys out of the stats dicts in C++
+        week = pa.array(list(weekly_stats.values()), type=self._struct_type)
+        for j, key in enumerate(self.stat_keys):
+            self._totals[rows, j] += week.field(j).fill_null(0).to_numpy()
+        self._weeks_played[rows] += 1
+
+    @property
+    def totals(self) -> np.ndarray:
+        return self._totals[:len(self.player_ids)]
+
+    @property
+    def weeks_played(self) -> np.ndarray:
+        return self._weeks_played[:len(self.player_ids)]
+
+
+def _weekly_points(year: int, weeks: List[int], scoring_engine: ScoringEngine,
+                   weekly_stats: Mapping[int, Mapping[str, Dict]]) -> SeasonPoints:
+    """Total the weekly payloads column-wise and score every player at once."""
+    stats_by_week = dict(weekly_stats)
+    stats_by_week.update(get_weekly_stats_by_week(
+        year, [week for week in weeks if week not in stats_by_week]))
+    accumulator = SeasonAccumulator(scoring_engine.stat_keys)
+    for week in weeks:
+        accumulator.add_week(stats_by_week[week])
     
-    # **CRITICAL: Drop year column if it's a partition**
-    df = df.drop(columns=['year'], errors='ignore')
+    def season_stats(row: int) -> Dict:
+        return _player_season_stats(accumulator.player_ids[row], stats_by_week, weeks)
     
-    return df
\ No newline at end of file
+    points = scoring_engine.score_matrix(accumulator.totals, season_stats)
+    return accumulator.player_ids, accumulator.weeks_played.tolist(), points
+
+
+def _player_season_stats(player_id: str, stats_by_week: Dict[int, Dict], weeks: List[int]) -> Dict:
+    """One player's season stats dict, summed key by key in first-seen order."""
+    season_stats = {}
+    for week in weeks:
+        for stat_key, stat_value in stats_by_week[week].get(player_id, {}).items():
+            if stat_key not in season_stats:
+                season_stats[stat_key] = 0
+            if stat_value:
+                season_stats[stat_key] += stat_value
+    return season_stats
+
+
+def _season_aggregate_points(year: int, scoring_engine: ScoringEngine) -> Optional[SeasonPoints]:
+    """Season points from the aggregate endpoint; weeks_played is Sleeper's games-played count."""
+    season_stats = get_season_stats(year)
+    if not season_stats:
+        return None
+    stats_rows = list(season_stats.values())
+    weeks_played = [int(stats.get('gp') or 0) for stats in stats_rows]
+    return list(season_stats), weeks_played, scoring_engine.score_all(stats_rows)
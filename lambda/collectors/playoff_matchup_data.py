@@ -4,9 +4,13 @@ Collects playoff bracket and matchup information
 Outputs to: auto_stg_playoff_matchup_data
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
+import numpy as np
 import pandas as pd
-from utils.api import get_playoff_bracket, get_matchups
+import pyarrow as pa
+from utils.pairing import pair_opponents
+from utils.schemas import PLAYOFF_MATCHUP_DATA, from_pandas
+from utils.weeks import WeekBundle, fetch_week_bundles
 
 def collect_playoff_matchup_data(
     league_id: str,
@@ -15,15 +19,19 @@ def collect_playoff_matchup_data(
     week_to_round: Dict[int, int],
     rosters: List[dict],
     users: List[dict],
-    name_map: Dict
-) -> pd.DataFrame:
+    name_map: Dict,
+    bundles: Optional[Dict[int, WeekBundle]] = None,
+    as_arrow: bool = False
+) -> Union[pd.DataFrame, pa.RecordBatch]:
     """
     Collect playoff matchup data with consistent member IDs.
+    Uses pre-fetched week bundles when given, otherwise fetches them.
 
     Returns a DataFrame with columns:
       week (int), round (int), matchup_id (int),
       member_id (int), opponent_team_id (int),
       points (float), opponent_points (float)
+    or, with as_arrow, a RecordBatch against the declared table schema.
     """
     print("  Collecting playoff matchup data...")
 
@@ -39,107 +47,54 @@ def collect_playoff_matchup_data(
                 member_id = int(name_map.get(display_name, display_name))
                 roster_to_member[roster['roster_id']] = member_id
 
-    # Bracket fetch retained in case you still want additional validation/filtering later
-    _ = get_playoff_bracket(league_id)
+    # Bundles carry the bracket, retained in case you still want additional validation/filtering later
+    if bundles is None:
+        bundles = fetch_week_bundles(league_id, year, playoff_weeks, with_bracket=True)
 
     rows = []
 
     for week in playoff_weeks:
-        matchups = get_matchups(league_id, week)
-        if not matchups:
-            continue
+        round_number = int(week_to_round.get(week, 0))
 
-        # Group by matchup_id to reliably find opponents
-        by_mid: Dict[int, List[dict]] = {}
-        for m in matchups:
+        for m in bundles[week].matchups:
             mid = m.get("matchup_id")
             if mid is None:
                 continue
-            by_mid.setdefault(int(mid), []).append(m)
-
-        round_number = int(week_to_round.get(week, 0))
-
-        for mid, group in by_mid.items():
-            if len(group) < 1:
-                continue
-
-            if len(group) == 1:
-                a = group[0]
-                roster_id = a["roster_id"]
-                member_id = roster_to_member.get(roster_id)
-                if member_id is None:
-                    continue
-                    
-                rows.append({
-                    "week": int(week),
-                    "round": round_number,
-                    "matchup_id": int(mid),
-                    "member_id": member_id,
-                    "opponent_team_id": None,
-                    "points": float(a.get("points", 0.0) or 0.0),
-                    "opponent_points": None,
-                })
-                continue
-
-            # len(group) >= 2: pair them
-            for i in range(0, len(group), 2):
-                a = group[i]
-                b = group[i + 1] if i + 1 < len(group) else None
-
-                a_roster_id = a["roster_id"]
-                a_member = roster_to_member.get(a_roster_id)
-                a_points = float(a.get("points", 0.0) or 0.0)
-                
-                if a_member is None:
-                    continue
-
-                if b is not None:
-                    b_roster_id = b["roster_id"]
-                    b_member = roster_to_member.get(b_roster_id)
-                    b_points = float(b.get("points", 0.0) or 0.0)
-                    
-                    if b_member is None:
-                        continue
-
-                    # Row for team A
-                    rows.append({
-                        "week": int(week),
-                        "round": round_number,
-                        "matchup_id": int(mid),
-                        "member_id": a_member,
-                        "opponent_team_id": b_member,
-                        "points": a_points,
-                        "opponent_points": b_points,
-                    })
-                    # Row for team B
-                    rows.append({
-                        "week": int(week),
-                        "round": round_number,
-                        "matchup_id": int(mid),
-                        "member_id": b_member,
-                        "opponent_team_id": a_member,
-                        "points": b_points,
-                        "opponent_points": a_points,
-                    })
-                else:
-                    # No opponent record
-                    rows.append({
-                        "week": int(week),
-                        "round": round_number,
-                        "matchup_id": int(mid),
-                        "member_id": a_member,
-                        "opponent_team_id": None,
-                        "points": a_points,
-                        "opponent_points": None,
-                    })
-
-    df = pd.DataFrame.from_records(rows, columns=[
+            rows.append({
+                "week": int(week),
+                "round": round_number,
+                "matchup_id": int(mid),
+                "roster_id": m["roster_id"],
+                "points": float(m.get("points", 0.0) or 0.0),
+            })
+
+    teams = pd.DataFrame.from_records(rows, columns=["week", "round", "matchup_id", "roster_id", "points"])
+
+    # Teams of a matchup pair off in listed order (1st vs 2nd, 3rd vs 4th, ...);
+    # a team left over, like a lone team, gets no opponent
+    matchups = teams.groupby(["week", "matchup_id"], sort=False)
+    teams["pair"] = matchups.cumcount() // 2
+    teams["order"] = matchups.ngroup()
+    teams = pair_opponents(teams, id_col="roster_id", points_col="points",
+                           opponent_id_col="opponent_roster_id",
+                           keys=("week", "matchup_id", "pair"))
+    teams["member_id"] = teams["roster_id"].map(roster_to_member)
+    teams["opponent_team_id"] = teams["opponent_roster_id"].map(roster_to_member)
+
+    # Teams without a member are dropped, and a pair is dropped with either team
+    paired = teams["opponent_roster_id"].notna()
+    teams = teams[teams["member_id"].notna() & ~(paired & teams["opponent_team_id"].isna())]
+
+    # Matchups in first-seen order with both teams of a pair together
+    teams = teams.iloc[np.argsort(teams["order"].to_numpy(), kind="stable")]
+
+    df = teams[[
         "week", "round", "matchup_id",
         "member_id", "opponent_team_id", "points", "opponent_points"
-    ])
+    ]].reset_index(drop=True)
 
     if df.empty:
-        return df
+        return from_pandas(df, PLAYOFF_MATCHUP_DATA) if as_arrow else df
 
     df = df[~df['matchup_id'].isin([5, 7])]
 
@@ -153,4 +108,6 @@ def collect_playoff_matchup_data(
         if c in df.columns:
             df[c] = df[c].fillna(0.0).astype("float64")
 
+    if as_arrow:
+        return from_pandas(df, PLAYOFF_MATCHUP_DATA)
     return df
\ No newline at end of file
@@ -5,12 +5,15 @@ Outputs to: auto_stg_regular_season
 """
 
 import pandas as pd
-from typing import List, Dict
+import pyarrow as pa
+from typing import List, Dict, Union
 from utils.mappings import calculate_points_with_decimal
+from utils.schemas import REGULAR_SEASON, from_pandas
 
 
 def collect_regular_season_data(league_id: str, year: int, rosters: List[dict], 
-                             users: List[dict], name_map: Dict) -> pd.DataFrame:
+                             users: List[dict], name_map: Dict,
+                             as_arrow: bool = False) -> Union[pd.DataFrame, pa.RecordBatch]:
     """
     Collect regular season standings data.
     
@@ -20,9 +23,10 @@ def collect_regular_season_data(league_id: str, year: int, rosters: List[dict],
         rosters: List of roster objects
         users: List of user objects
         name_map: Mapping of display names to real names
+        as_arrow: Return a RecordBatch against the declared table schema
         
     Returns:
-        DataFrame with regular season standings
+        DataFrame (or RecordBatch) with regular season standings
     """
     print(f"  Collecting regular season standings...")
     
@@ -52,4 +56,6 @@ def collect_regular_season_data(league_id: str, year: int, rosters: List[dict],
     # Reorder columns
     df = df[["member_id", "place", "wins", "losses", "points_scored", "points_against"]]
     
+    if as_arrow:
+        return from_pandas(df, REGULAR_SEASON)
     return df
@@ -15,24 +15,40 @@ Manual Tables (NOT collected):
 - stg_lineup_efficiency_weekly
 """
 
-import json
 import os
-import boto3
-import pandas as pd
+
+# PROFILE_IMPORTS=true logs how long every module takes to import: the init
+# phase below, then the deferred imports of the first invocation
+PROFILE_IMPORTS = os.environ.get('PROFILE_IMPORTS', 'false').lower() == 'true'
+if PROFILE_IMPORTS:
+    from utils import import_profile
+    import_profile.start()
+
+import json
 from datetime import datetime
-from io import BytesIO
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 import traceback
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-# Import collectors
-from collectors.regular_season import collect_regular_season_data
-from collectors.matchup_data import collect_matchup_data
-from collectors.playoff_matchup_data import collect_playoff_matchup_data
-from collectors.player_details_by_team import collect_player_details_by_team_data
-from collectors.player_total_points import collect_player_total_points_data
+# Heavy dependencies (boto3, pandas, pyarrow, requests, and the collectors
+# and Sleeper client built on them) are imported where they are first used,
+# so the init phase and invocations that return early don't pay for them
 
 # Import utilities
-from utils.api import get_league_rosters, get_league_users, get_nfl_state
+from utils.cache import ResponseCache, LocalDirBackend, TmpBackend, S3Backend
+from utils.lake import (
+    CONTENT_HASH_METADATA, LAST_WEEK_METADATA, content_hash, data_key, week_key,
+    object_metadata, read_watermark, delete_week_objects
+)
+from utils.manifest import BackfillManifest
 from utils.mappings import create_mappings
+from utils.metrics import reset_metrics, get_metrics, emit_emf
+from utils.scheduler import TimeBudget, UnitCosts
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 
 # Configuration
@@ -43,53 +59,269 @@ LAKE_BUCKET = os.environ.get('LAKE_BUCKET')
 NAME_MAP = json.loads(os.environ.get('NAME_MAP', '{}'))
 SCORING_SETTINGS = json.loads(os.environ.get('SCORING_SETTINGS', '{}'))
 
-s3_client = boto3.client('s3')
+# Alternative scoring rules, name -> overrides of SCORING_SETTINGS; each adds
+# a fantasy_points_{name} / total_fantasy_points_{name} column
+SCORING_PROFILES = {
+    name: {**SCORING_SETTINGS, **overrides}
+    for name, overrides in json.loads(os.environ.get('SCORING_PROFILES', '{}')).items()
+}
+
+# Persistent Sleeper response cache: none | local | tmp | s3
+RESPONSE_CACHE = os.environ.get('RESPONSE_CACHE', 'tmp')
+RESPONSE_CACHE_DIR = os.environ.get('RESPONSE_CACHE_DIR', '.sleeper-cache')
+RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', 3600))
+
+# Player totals from one season-aggregate request per year, used only for
+# seasons whose regular season is exactly the totalled weeks 1-17 (through
+# 2020); later seasons keep the weekly path. Enable once
+# tests/test_totals_parity.py passes on a recording of such a season
+SEASON_AGGREGATE_STATS = os.environ.get('SEASON_AGGREGATE_STATS', 'false').lower() == 'true'
+
+# Historical seasons collected concurrently in backfill mode (1 = one at a time)
+BACKFILL_WORKERS = int(os.environ.get('BACKFILL_WORKERS', 4))
+
+# Backfills stop starting seasons once the Lambda deadline is this close,
+# and (with SELF_CONTINUE) re-invoke themselves with the seasons left
+DEADLINE_MARGIN_SECONDS = float(os.environ.get('DEADLINE_MARGIN_SECONDS', 60))
+SELF_CONTINUE = os.environ.get('SELF_CONTINUE', 'true').lower() == 'true'
+MAX_CONTINUATIONS = int(os.environ.get('MAX_CONTINUATIONS', 10))
+
+# Sleeper requests stop this long before the Lambda deadline, leaving time to
+# write what was collected and report it
+REQUEST_DEADLINE_MARGIN_SECONDS = float(os.environ.get('REQUEST_DEADLINE_MARGIN_SECONDS', 15))
+
+STAGING_TABLES = (
+    'stg_regular_season', 'stg_matchup_data', 'stg_player_details_by_team',
+    'stg_playoff_matchup_data', 'stg_player_total_points',
+)
+
+# Tables with one row set per regular-season week; incremental runs write
+# these a week at a time
+WEEKLY_TABLES = ('stg_matchup_data', 'stg_player_details_by_team')
+
+# AWS clients, created on first use (get_s3_client / get_lambda_client)
+s3_client = None
+lambda_client = None
+
+class SeasonIncomplete(Exception):
+    """A season stopped at the invocation deadline; results has the tables it finished."""
+    
+    def __init__(self, year: int, results: Dict[str, int]):
+        super().__init__(f"{year} stopped at the deadline after {len(results)} of "
+                         f"{len(STAGING_TABLES)} tables")
+        self.year = year
+        self.results = results
+
+
+# S3 keys of the partitions this invocation uploaded, or left alone because
+# their content hash was unchanged
+partition_writes = {'written': [], 'skipped': []}
 
 
-def write_to_s3(df: pd.DataFrame, table_name: str, year: int):
+def reset_partition_writes():
+    """Start a fresh written/skipped record (call once per invocation)."""
+    global partition_writes
+    partition_writes = {'written': [], 'skipped': []}
+
+
+def get_s3_client():
+    global s3_client
+    if s3_client is None:
+        import boto3
+        s3_client = boto3.client('s3')
+    return s3_client
+
+
+def get_lambda_client():
+    global lambda_client
+    if lambda_client is None:
+        import boto3
+        lambda_client = boto3.client('lambda')
+    return lambda_client
+
+
+def write_to_s3(data: 'Union[pd.DataFrame, pa.RecordBatch, pa.Table]', table_name: str, year: int,
+                week: Optional[int] = None, last_week: Optional[int] = None):
     """
-    Write DataFrame to S3 as year-partitioned Parquet.
-    Overwrites existing file for that year.
+    Write collector output to S3 as year-partitioned Parquet.
+    Overwrites existing file for that year (or that week).
+    
+    Arrow input is streamed into the Parquet writer as is; DataFrames are
+    converted once. The encoded file is uploaded straight from the Arrow
+    buffer without copying it into bytes, along with a SHA-256 of the
+    table's content; when the stored object already has that hash nothing
+    is encoded or uploaded, so re-runs over unchanged data create no new
+    object versions.
     
     Args:
-        df: DataFrame to write
+        data: DataFrame, RecordBatch or Table to write
         table_name: Name of the table (e.g., 'stg_regular_season')
         year: Year for partitioning
+        week: Write one incremental week object instead of the season file
+        last_week: Last week the season file covers (weekly tables); recorded
+            as its watermark, and the week objects it supersedes are deleted
     """
-    if df.empty:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    if not len(data):
         print(f"  WARNING: Skipping {table_name} - no data to write")
         return
     
     # Construct S3 path with year partition
-    s3_key = f"staging/{table_name}/year={year}/data.parquet"
+    s3_key = week_key(table_name, year, week) if week is not None else data_key(table_name, year)
+    metadata = {LAST_WEEK_METADATA: str(last_week)} if last_week is not None else {}
+    
+    if isinstance(data, pa.RecordBatch):
+        table = pa.Table.from_batches([data])
+    elif isinstance(data, pa.Table):
+        table = data
+    else:
+        table = pa.Table.from_pandas(data, preserve_index=False)
     
-    # Convert to parquet in memory
-    parquet_buffer = BytesIO()
-    df.to_parquet(parquet_buffer, engine='pyarrow', index=False)
-    parquet_buffer.seek(0)
+    metadata[CONTENT_HASH_METADATA] = content_hash(table)
     
-    # Upload to S3
+    # Encode and upload to S3 unless the stored object already has this content
     try:
-        s3_client.put_object(
-            Bucket=LAKE_BUCKET,
-            Key=s3_key,
-            Body=parquet_buffer.getvalue()
-        )
-        print(f"  SUCCESS: Wrote {len(df)} rows to s3://{LAKE_BUCKET}/{s3_key}")
+        stored = object_metadata(get_s3_client(), LAKE_BUCKET, s3_key) or {}
+        if stored == metadata:
+            partition_writes['skipped'].append(s3_key)
+            print(f"  UNCHANGED: Skipped {len(table)} rows, s3://{LAKE_BUCKET}/{s3_key} is up to date")
+        else:
+            sink = pa.BufferOutputStream()
+            with pq.ParquetWriter(sink, table.schema) as writer:
+                writer.write_table(table)
+            body = sink.getvalue()
+            get_s3_client().put_object(
+                Bucket=LAKE_BUCKET,
+                Key=s3_key,
+                Body=pa.BufferReader(body),
+                Metadata=metadata
+            )
+            partition_writes['written'].append(s3_key)
+            print(f"  SUCCESS: Wrote {len(table)} rows to s3://{LAKE_BUCKET}/{s3_key}")
+        if last_week is not None:
+            deleted = delete_week_objects(get_s3_client(), LAKE_BUCKET, table_name, year, last_week)
+            if deleted:
+                print(f"  Removed {deleted} week objects now covered by {s3_key}")
     except Exception as e:
         print(f"  ERROR: Failed to write to S3: {e}")
         raise
 
 
+def write_weekly_table(data: 'pa.RecordBatch', table_name: str, year: int,
+                       weeks: range, watermark: Optional[int] = None) -> int:
+    """
+    Write a weekly table: the whole season, or only the weeks from its watermark on.
+    
+    The watermark week is rewritten when it has its own week object; weeks
+    inside data.parquet are only rewritten by a full run.
+    
+    Args:
+        data: Collector output covering weeks
+        table_name: Name of the table (e.g., 'stg_matchup_data')
+        year: Year for partitioning
+        weeks: Weeks the data covers
+        watermark: Last week already in the lake (None rewrites the season)
+    
+    Returns:
+        Number of rows written
+    """
+    if watermark is None:
+        write_to_s3(data, table_name, year, last_week=weeks[-1] if weeks else 0)
+        return len(data)
+    
+    import pyarrow.compute as pc
+    
+    rows = 0
+    for week in weeks:
+        if week < watermark:
+            continue
+        if week == watermark and object_metadata(
+                get_s3_client(), LAKE_BUCKET, week_key(table_name, year, week)) is None:
+            continue
+        week_data = data.filter(pc.equal(data.column('week'), week))
+        write_to_s3(week_data, table_name, year, week=week)
+        rows += len(week_data)
+    return rows
+
+
+def last_played_week(bundles: Dict, weeks: range) -> int:
+    """Last week in weeks whose matchups have any points; later weeks have not been played."""
+    played = [week for week in weeks if any(m.get('points') for m in bundles[week].matchups)]
+    return played[-1] if played else weeks.start - 1
+
+
+def last_completed_week(year: int) -> Optional[int]:
+    """
+    Last week of a season whose games are all final (None when the season is over).
+    
+    Points alone do not mean a week is over: a run during the week sees
+    partial scores. Sleeper's NFL state week is the week in progress (or
+    about to start), so only the weeks before it are complete.
+    """
+    if year < CURRENT_YEAR:
+        return None
+    from utils.api import get_nfl_state
+    nfl_state = get_nfl_state()
+    if not nfl_state.get('season'):
+        print("  WARNING: NFL state unavailable, treating no week as complete")
+        return 0
+    season = int(nfl_state['season'])
+    if season > year or (season == year and nfl_state.get('season_type') in ('post', 'off')):
+        return None
+    if season < year:
+        return 0
+    return max(int(nfl_state.get('week') or 0) - 1, 0)
+
+
+def build_cache_backend(name: str):
+    """
+    Build a cache storage backend from the RESPONSE_CACHE setting.
+    
+    Args:
+        name: Sub-namespace for the entries (S3 prefix / directory under the cache root)
+    """
+    if RESPONSE_CACHE == 's3' and LAKE_BUCKET:
+        return S3Backend(get_s3_client(), LAKE_BUCKET, prefix=f"cache/{name}/")
+    if RESPONSE_CACHE == 'local':
+        return LocalDirBackend(os.path.join(RESPONSE_CACHE_DIR, name))
+    if RESPONSE_CACHE == 'tmp':
+        return TmpBackend(f"/tmp/sleeper-cache/{name}")
+    return None
+
+
+def build_response_cache():
+    """
+    Build the persistent response cache from configuration.
+    Leagues of past seasons are frozen, so their responses never expire.
+    """
+    backend = build_cache_backend('sleeper')
+    if backend is None:
+        return None
+    
+    frozen_league_ids = [
+        league_id for year_str, league_id in HISTORICAL_LEAGUES.items()
+        if int(year_str) < CURRENT_YEAR
+    ]
+    return ResponseCache(backend, CURRENT_YEAR, frozen_league_ids, RESPONSE_CACHE_TTL)
+
+
 def get_current_week():
     """Get current NFL week from Sleeper API."""
+    from utils.api import get_nfl_state
     nfl_state = get_nfl_state()
     return nfl_state.get('week', 1)
 
 
 def collect_season_data(league_id: str, year: int, week: int = None, 
                         collect_playoffs: bool = False,
-                        collect_player_totals: bool = False):
+                        collect_player_totals: bool = False,
+                        league_scored: bool = False,
+                        include_stat_columns: bool = True,
+                        incremental: bool = False,
+                        manifest: Optional[BackfillManifest] = None,
+                        resume: bool = False):
     """
     Collect data for a specific season.
     
@@ -99,7 +331,29 @@ def collect_season_data(league_id: str, year: int, week: int = None,
         week: Current week (if None, will fetch from API for current year only)
         collect_playoffs: Whether to collect playoff data
         collect_player_totals: Whether to collect player total points
+        league_scored: Take player fantasy points from the matchup payload
+        include_stat_columns: Download weekly stats for the raw stat columns
+        incremental: Fetch and write only the completed regular-season weeks
+            after each weekly table's watermark in the lake (one object per
+            week), rewriting the watermark week's object to pick up stat
+            corrections; otherwise the season partition is rewritten in full
+        manifest: Backfill progress; each table written is recorded in it
+        resume: Skip tables the manifest lists as complete for this season
+        
+    Raises:
+        SeasonIncomplete: A Sleeper request hit the invocation deadline; the
+            tables written before it are kept (and recorded in the manifest)
     """
+    from collectors.regular_season import collect_regular_season_data
+    from collectors.matchup_data import collect_matchup_data
+    from collectors.playoff_matchup_data import collect_playoff_matchup_data
+    from collectors.player_details_by_team import collect_player_details_by_team_data
+    from collectors.player_total_points import collect_player_total_points_data
+    from utils.api import (
+        get_league_rosters, get_league_users, evict_cached_responses, DeadlineExceeded
+    )
+    from utils.weeks import fetch_week_bundles
+    
     print(f"\n{'='*60}")
     print(f"Collecting data for {year} season")
     print(f"League ID: {league_id}")
@@ -114,149 +368,454 @@ def collect_season_data(league_id: str, year: int, week: int = None,
     
     print(f"Collecting through week: {week}")
     
-    # Fetch league info
-    print("\nFetching league info...")
-    rosters = get_league_rosters(league_id)
-    users = get_league_users(league_id)
+    results = {}
     
-    if not rosters or not users:
-        raise Exception(f"Failed to fetch league rosters or users for {year}")
+    # Tables a resumed backfill already finished for this season
+    completed = {}
+    if manifest is not None and resume:
+        completed = {table: manifest.rows(year, table, league_id) for table in STAGING_TABLES}
+        completed = {table: rows for table, rows in completed.items() if rows is not None}
+        if completed:
+            print(f"Already complete (manifest): {', '.join(completed)}")
+            results.update(completed)
+        if len(completed) == len(STAGING_TABLES):
+            return results
     
-    # Create mappings
-    roster_to_owner, owner_to_display, owner_to_user_id = create_mappings(rosters, users)
+    def record(table_name: str, rows: int):
+        results[table_name] = rows
+        if manifest is not None:
+            manifest.mark_complete(year, table_name, league_id, rows)
     
     # Define week ranges
     regular_season_weeks = range(1, min(week + 1, 15))  # Weeks 1-14
     playoff_weeks = [w for w in range(15, min(week + 1, 18))]  # Weeks 15-17
     
-    results = {}
+    # Incremental runs start at the oldest watermark of the weekly tables; the
+    # week at the watermark is collected again for late stat corrections
+    watermarks = {table: None for table in WEEKLY_TABLES}
+    collect_weeks = regular_season_weeks
+    if incremental:
+        watermarks = {table: read_watermark(get_s3_client(), LAKE_BUCKET, table, year)
+                      for table in WEEKLY_TABLES}
+        print("Watermarks: " + ", ".join(f"{table} week {watermark}"
+                                         for table, watermark in watermarks.items()))
+        collect_weeks = range(max(min(watermarks.values()), 1), regular_season_weeks.stop)
+    
+    # Completed weekly tables need no weekly data (nor playoffs their bracket)
+    if 'stg_matchup_data' in completed and 'stg_player_details_by_team' in completed:
+        collect_weeks = range(1, 1)
+    if 'stg_playoff_matchup_data' in completed:
+        playoff_weeks = []
     
     try:
-        # 1. Regular Season Standings
-        print("\n[1/5] Regular Season Standings")
-        df_regular_season = collect_regular_season_data(
-            league_id, year, rosters, users, NAME_MAP
-        )
-        write_to_s3(df_regular_season, 'stg_regular_season', year)
-        results['stg_regular_season'] = len(df_regular_season)
+        # Fetch league info
+        print("\nFetching league info...")
+        rosters = get_league_rosters(league_id)
+        users = get_league_users(league_id)
         
-        # 2. Weekly Matchup Data
-        print("\n[2/5] Weekly Matchup Data")
-        df_matchups = collect_matchup_data(
-            league_id, year, regular_season_weeks,
-            roster_to_owner, owner_to_display, NAME_MAP
-        )
-        write_to_s3(df_matchups, 'stg_matchup_data', year)
-        results['stg_matchup_data'] = len(df_matchups)
+        if not rosters or not users:
+            raise Exception(f"Failed to fetch league rosters or users for {year}")
+        
+        # Create mappings
+        roster_to_owner, owner_to_display, owner_to_user_id = create_mappings(rosters, users)
         
-        # 3. Player Details by Team
-        print("\n[3/5] Player Details by Team")
-        df_players = collect_player_details_by_team_data(
-            league_id, year, regular_season_weeks,
-            roster_to_owner, owner_to_display, NAME_MAP, SCORING_SETTINGS
+        # Fetch each week's matchups, stats and bracket once for every collector
+        print("\nFetching weekly data...")
+        needs_stats = ('stg_player_details_by_team' not in completed and
+                       (include_stat_columns or not league_scored or SCORING_PROFILES))
+        bundles = fetch_week_bundles(
+            league_id, year, list(collect_weeks) + playoff_weeks,
+            stats_weeks=collect_weeks if needs_stats else (),
+            with_bracket=bool(playoff_weeks),
         )
-        write_to_s3(df_players, 'stg_player_details_by_team', year)
-        results['stg_player_details_by_team'] = len(df_players)
+        
+        # Only played weeks: unplayed weeks would only add zero-point rows.
+        # Incremental runs also stop before a week in progress, whose partial
+        # scores would become the watermark week
+        through_week = last_played_week(bundles, collect_weeks)
+        if incremental:
+            completed_week = last_completed_week(year)
+            if completed_week is not None:
+                through_week = min(through_week, completed_week)
+        collect_weeks = range(collect_weeks.start, through_week + 1)
+        if incremental:
+            print(f"Weeks to write: {list(collect_weeks) or 'none'}")
+        
+        # 1. Regular Season Standings
+        if 'stg_regular_season' in completed:
+            print("\n[1/5] Regular Season Standings - SKIPPED: Already complete")
+        else:
+            print("\n[1/5] Regular Season Standings")
+            standings = collect_regular_season_data(
+                league_id, year, rosters, users, NAME_MAP, as_arrow=True
+            )
+            write_to_s3(standings, 'stg_regular_season', year)
+            record('stg_regular_season', len(standings))
+        
+        # 2-3. Weekly tables (nothing to do before week 1 or without new weeks)
+        if 'stg_matchup_data' in completed:
+            print("\n[2/5] Weekly Matchup Data - SKIPPED: Already complete")
+        elif not collect_weeks:
+            print("\n[2/5] Weekly Matchup Data - SKIPPED: No new weeks")
+        else:
+            # 2. Weekly Matchup Data
+            print("\n[2/5] Weekly Matchup Data")
+            matchups = collect_matchup_data(
+                league_id, year, collect_weeks,
+                roster_to_owner, owner_to_display, NAME_MAP, bundles=bundles,
+                as_arrow=True
+            )
+            record('stg_matchup_data', write_weekly_table(
+                matchups, 'stg_matchup_data', year, collect_weeks, watermarks['stg_matchup_data']))
+        
+        if 'stg_player_details_by_team' in completed:
+            print("\n[3/5] Player Details by Team - SKIPPED: Already complete")
+        elif not collect_weeks:
+            print("\n[3/5] Player Details by Team - SKIPPED: No new weeks")
+        else:
+            # 3. Player Details by Team
+            print("\n[3/5] Player Details by Team")
+            player_details = collect_player_details_by_team_data(
+                league_id, year, collect_weeks,
+                roster_to_owner, owner_to_display, NAME_MAP, SCORING_SETTINGS,
+                bundles=bundles, league_scored=league_scored,
+                include_stat_columns=include_stat_columns,
+                scoring_profiles=SCORING_PROFILES, as_arrow=True
+            )
+            record('stg_player_details_by_team', write_weekly_table(
+                player_details, 'stg_player_details_by_team', year, collect_weeks,
+                watermarks['stg_player_details_by_team']))
+            del player_details
+        
+        # Weekly stats payloads are not read again except by the totals
+        totals_pending = collect_player_totals and 'stg_player_total_points' not in completed
+        weekly_stats = {week: bundle.stats for week, bundle in bundles.items()
+                        if bundle.stats} if totals_pending else {}
+        bundles = {week: bundle.without_stats() for week, bundle in bundles.items()}
         
         # 4. Playoff Matchup Data (only if requested or playoffs have started)
-        if collect_playoffs or playoff_weeks:
+        if 'stg_playoff_matchup_data' in completed:
+            print("\n[4/5] Playoff Matchup Data - SKIPPED: Already complete")
+        elif collect_playoffs or playoff_weeks:
             print("\n[4/5] Playoff Matchup Data")
             if playoff_weeks:
                 week_to_round = {15: 1, 16: 2, 17: 3}
-                df_playoffs = collect_playoff_matchup_data(
+                playoff_matchups = collect_playoff_matchup_data(
                     league_id=league_id,
                     year=year,
                     playoff_weeks=playoff_weeks,
                     week_to_round=week_to_round,
                     rosters=rosters,        # Changed from roster_to_owner
                     users=users,            # Changed from owner_to_display
-                    name_map=NAME_MAP       # Same
+                    name_map=NAME_MAP,      # Same
+                    bundles=bundles,
+                    as_arrow=True
                 )
-                write_to_s3(df_playoffs, 'stg_playoff_matchup_data', year)
-                results['stg_playoff_matchup_data'] = len(df_playoffs)
+                write_to_s3(playoff_matchups, 'stg_playoff_matchup_data', year)
+                record('stg_playoff_matchup_data', len(playoff_matchups))
             else:
                 print("  SKIPPED: No playoff weeks yet")
         else:
             print("\n[4/5] Playoff Matchup Data - SKIPPED")
         
         # 5. Player Total Points (only if requested)
-        if collect_player_totals:
+        if 'stg_player_total_points' in completed:
+            print("\n[5/5] Player Total Points - SKIPPED: Already complete")
+        elif collect_player_totals:
             print("\n[5/5] Player Total Points")
-            df_totals = collect_player_total_points_data([year], SCORING_SETTINGS)
-            write_to_s3(df_totals, 'stg_player_total_points', year)
-            results['stg_player_total_points'] = len(df_totals)
+            player_totals = collect_player_total_points_data(
+                [year], SCORING_SETTINGS, use_season_aggregate=SEASON_AGGREGATE_STATS,
+                scoring_profiles=SCORING_PROFILES, weekly_stats=weekly_stats, as_arrow=True
+            )
+            del weekly_stats
+            write_to_s3(player_totals, 'stg_player_total_points', year)
+            record('stg_player_total_points', len(player_totals))
         else:
             print("\n[5/5] Player Total Points - SKIPPED")
         
+    except DeadlineExceeded as e:
+        print(f"\nDEADLINE: Stopped collecting {year} with {len(results)} tables done: {e}")
+        raise SeasonIncomplete(year, results) from e
     except Exception as e:
         print(f"\nERROR: Error collecting data for {year}: {e}")
         traceback.print_exc()
         raise
+    finally:
+        # This season's league/stats responses (weekly and season aggregate)
+        # won't be requested again this invocation
+        evict_cached_responses([f"/league/{league_id}/", f"/stats/nfl/{year}/",
+                                f"/stats/nfl/{year}?"])
     
     return results
 
 
+def build_backfill_manifest() -> Optional[BackfillManifest]:
+    """Backfill progress manifest under state/ in the lake bucket (None without a bucket)."""
+    if not LAKE_BUCKET:
+        return None
+    return BackfillManifest(S3Backend(get_s3_client(), LAKE_BUCKET, prefix='state/')).load()
+
+
+def build_unit_costs() -> UnitCosts:
+    """Per-season duration estimates under state/ in the lake bucket (in memory without a bucket)."""
+    if not LAKE_BUCKET:
+        return UnitCosts()
+    return UnitCosts(S3Backend(get_s3_client(), LAKE_BUCKET, prefix='state/')).load()
+
+
+def continue_backfill(event: Dict, context, remaining: List[int], progressed: bool) -> Dict:
+    """
+    Re-invoke this function asynchronously for the seasons a backfill left.
+    
+    The continuation resumes from the progress manifest. It is only enqueued
+    when this invocation made progress (finished a season or wrote a table,
+    so an invocation with no time left cannot loop) and MAX_CONTINUATIONS is
+    not reached.
+    
+    Returns:
+        {'event': continuation event, 'enqueued': whether it was invoked}
+    """
+    continuation = int(event.get('continuation', 0)) + 1
+    next_event = {**event, 'resume': True, 'years': remaining, 'continuation': continuation}
+    next_event.pop('reset_manifest', None)
+    
+    enqueued = False
+    if not SELF_CONTINUE or context is None:
+        print("Self-continuation disabled; re-run with the continuation event to finish")
+    elif not progressed:
+        print("No progress in this invocation; not re-invoking")
+    elif continuation > MAX_CONTINUATIONS:
+        print(f"Reached MAX_CONTINUATIONS ({MAX_CONTINUATIONS}); not re-invoking")
+    else:
+        get_lambda_client().invoke(
+            FunctionName=context.invoked_function_arn,
+            InvocationType='Event',
+            Payload=json.dumps(next_event).encode()
+        )
+        enqueued = True
+        print(f"Enqueued continuation {continuation} for {remaining}")
+    return {'event': next_event, 'enqueued': enqueued}
+
+
+def backfill_historical(workers: int = BACKFILL_WORKERS,
+                        manifest: Optional[BackfillManifest] = None, resume: bool = False,
+                        years: Optional[List[int]] = None,
+                        budget: Optional[TimeBudget] = None,
+                        costs: Optional[UnitCosts] = None):
+    """
+    Collect every season in HISTORICAL_LEAGUES, several at a time.
+    
+    Seasons run on a thread pool: collection is dominated by waiting on the
+    Sleeper API, and all seasons share the rate limiter, connection pool and
+    player directory. A failed season is reported and does not stop the rest.
+    
+    A season is only started while the time budget covers its estimated
+    cost; seasons that would not finish before the deadline are left for a
+    continuation. Each finished season's duration refines the estimates.
+    The first season always starts while any time is left over the margin,
+    so an overestimate cannot stall a backfill (the manifest keeps whatever
+    tables it finishes). Seasons cut short by the request deadline are
+    reported with the tables they finished and left for a continuation too;
+    no further seasons are started after one is.
+    
+    Args:
+        workers: Seasons collected concurrently
+        manifest: Progress manifest every finished (year, table) is recorded in
+        resume: Skip the (year, table) units the manifest lists as complete
+        years: Only these seasons (default: all of HISTORICAL_LEAGUES)
+        budget: Time left in this invocation (default: unlimited)
+        costs: Per-season duration estimates, updated as seasons finish
+        
+    Returns:
+        (results, errors, remaining): year -> table row counts (for seasons
+        cut short, of the tables they finished), year -> error message for
+        seasons that failed, and the years not finished before the deadline
+    """
+    budget = budget or TimeBudget()
+    costs = costs or UnitCosts()
+    pending = [(int(year_str), league_id) for year_str, league_id in HISTORICAL_LEAGUES.items()
+               if years is None or int(year_str) in years]
+    results, errors = {}, {}
+    running = {}
+    started = 0
+    interrupted = []
+    
+    def collect(year: int, league_id: str):
+        start = time.monotonic()
+        season = collect_season_data(
+            league_id,
+            year,
+            week=17,  # Full season
+            collect_playoffs=True,
+            collect_player_totals=True,
+            manifest=manifest,
+            resume=resume
+        )
+        costs.record(str(year), time.monotonic() - start)
+        return season
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='backfill') as executor:
+        while pending or running:
+            # Start the next seasons that fit in the time left
+            for year, league_id in list(pending):
+                if len(running) >= max(1, workers) or interrupted:
+                    break
+                estimate = costs.estimate(str(year)) if started else 0.0
+                if budget.allows(estimate):
+                    pending.remove((year, league_id))
+                    running[executor.submit(collect, year, league_id)] = year
+                    started += 1
+            if not running:
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                year = running.pop(future)
+                try:
+                    results[year] = future.result()
+                    print(f"\nFinished historical year: {year}")
+                except SeasonIncomplete as e:
+                    results[year] = e.results
+                    interrupted.append(year)
+                    print(f"\nHistorical year {year} stopped at the deadline")
+                except Exception as e:
+                    errors[year] = str(e)
+                    print(f"\nERROR: Historical year {year} failed: {e}")
+    
+    remaining = sorted(interrupted + [year for year, _ in pending])
+    if remaining:
+        print(f"\nStopping before the deadline ({budget.remaining():.0f}s left); "
+              f"cut short: {sorted(interrupted)}, not started: {sorted(y for y, _ in pending)}")
+    costs.save()
+    return dict(sorted(results.items())), dict(sorted(errors.items())), remaining
+
+
+def start_collection(context):
+    """Set up the Sleeper client, caches and deadline for a collecting invocation."""
+    from utils.api import (
+        reset_request_cache, reset_throttle_stats, configure_deadline, configure_response_cache
+    )
+    from utils.players import configure_player_directory
+    
+    # Memoize Sleeper responses for this invocation only
+    reset_request_cache()
+    reset_throttle_stats()
+    configure_deadline(TimeBudget(context, margin=REQUEST_DEADLINE_MARGIN_SECONDS))
+    configure_response_cache(build_response_cache())
+    configure_player_directory(build_cache_backend('reference'))
+
+
 def handler(event, context):
     """
     Lambda handler function.
     
     Event parameters:
         - backfill_historical: (bool) If true, collect all historical years
+        - backfill_workers: (int) Historical years collected concurrently
+          (default BACKFILL_WORKERS)
+        - resume: (bool) Backfill only the (year, table) units the progress
+          manifest does not list as complete
+        - reset_manifest: (bool) Clear the backfill progress manifest first
+          (on its own, just clear it)
+        - years: (list) Backfill only these historical years
+        - continuation: (int) Set on self re-invocations; counts continuations
         - year: (int) Specific year to collect
         - league_id: (str) Override league ID for specific year
         - week: (int) Override current week
         - collect_playoffs: (bool) Force playoff collection
         - collect_player_totals: (bool) Force player totals collection
+        - league_scored: (bool) Use Sleeper's league-scored player points
+        - include_stat_columns: (bool) Fetch weekly stats for raw stat columns (default true)
+        - incremental: (bool) Write only the last written week and those after it (default
+          false, a full-season rewrite)
     """
     print(f"Lambda invoked at: {datetime.utcnow().isoformat()}")
     print(f"Event: {json.dumps(event, default=str)}")
     
+    reset_metrics()
+    reset_partition_writes()
+    
     try:
         all_results = {}
+        all_errors = {}
+        continuation = None
+        incomplete = []
+        
+        manifest = None
+        if event.get('backfill_historical') or event.get('reset_manifest'):
+            manifest = build_backfill_manifest()
+        if event.get('reset_manifest') and manifest is not None:
+            manifest.reset()
+            print("Backfill manifest reset")
+            if not event.get('backfill_historical'):
+                return {
+                    'statusCode': 200,
+                    'body': json.dumps({'message': 'Backfill manifest reset'})
+                }
+        
+        league_id = event.get('league_id', CURRENT_LEAGUE_ID)
+        if not event.get('backfill_historical') and not league_id:
+            return {
+                'statusCode': 400,
+                'body': json.dumps({'error': 'CURRENT_LEAGUE_ID not configured'})
+            }
+        
+        start_collection(context)
         
         # Historical backfill mode
         if event.get('backfill_historical'):
+            workers = int(event.get('backfill_workers', BACKFILL_WORKERS))
+            resume = bool(event.get('resume')) and manifest is not None
             print("\n" + "="*60)
-            print("HISTORICAL BACKFILL MODE")
+            print(f"HISTORICAL BACKFILL MODE ({len(HISTORICAL_LEAGUES)} years, {workers} workers"
+                  f"{', resuming' if resume else ''})")
             print("="*60)
+            if resume:
+                for year, tables in manifest.completed().items():
+                    print(f"  {year}: {len(tables)} tables already complete")
             
-            for year_str, league_id in HISTORICAL_LEAGUES.items():
-                year = int(year_str)
-                print(f"\nProcessing historical year: {year}")
-                results = collect_season_data(
-                    league_id, 
-                    year, 
-                    week=17,  # Full season
-                    collect_playoffs=True,
-                    collect_player_totals=True
-                )
-                all_results[year] = results
+            all_results, all_errors, remaining = backfill_historical(
+                workers, manifest, resume,
+                years=event.get('years'),
+                budget=TimeBudget(context, margin=DEADLINE_MARGIN_SECONDS),
+                costs=build_unit_costs()
+            )
             
             print("\n" + "="*60)
-            print("HISTORICAL BACKFILL COMPLETE")
+            if remaining:
+                print(f"HISTORICAL BACKFILL PAUSED ({len(remaining)} years left)")
+                finished = set(all_results) - set(remaining)
+                wrote = partition_writes['written'] or partition_writes['skipped']
+                continuation = continue_backfill(
+                    event, context, remaining, progressed=bool(finished or all_errors or wrote))
+            else:
+                print("HISTORICAL BACKFILL COMPLETE")
             print("="*60)
             
         # Single year collection mode
         else:
             year = event.get('year', CURRENT_YEAR)
-            league_id = event.get('league_id', CURRENT_LEAGUE_ID)
             week = event.get('week')
             collect_playoffs = event.get('collect_playoffs', False)
             collect_player_totals = event.get('collect_player_totals', False)
+            league_scored = event.get('league_scored', False)
+            include_stat_columns = event.get('include_stat_columns', True)
+            incremental = event.get('incremental', False)
             
-            if not league_id:
-                return {
-                    'statusCode': 400,
-                    'body': json.dumps({'error': 'CURRENT_LEAGUE_ID not configured'})
-                }
-            
-            results = collect_season_data(
-                league_id, 
-                year, 
-                week,
-                collect_playoffs,
-                collect_player_totals
-            )
+            try:
+                results = collect_season_data(
+                    league_id, 
+                    year, 
+                    week,
+                    collect_playoffs,
+                    collect_player_totals,
+                    league_scored=league_scored,
+                    include_stat_columns=include_stat_columns,
+                    incremental=incremental
+                )
+            except SeasonIncomplete as e:
+                results = e.results
+                incomplete.append(year)
             all_results[year] = results
         
         print(f"\n{'='*60}")
@@ -267,12 +826,41 @@ def handler(event, context):
             print(f"\nYear {year}:")
             for table, count in results.items():
                 print(f"  {table}: {count} rows")
+        for year, error in all_errors.items():
+            print(f"\nYear {year}: FAILED - {error}")
+        
+        from utils.api import get_request_cache_stats, get_throttle_stats, save_cassette
+        cache_stats = get_request_cache_stats()
+        print(f"\nRequest cache: {cache_stats['hits']} hits, "
+              f"{cache_stats['coalesced']} coalesced, {cache_stats['misses']} misses")
+        print(f"Partitions: {len(partition_writes['written'])} written, "
+              f"{len(partition_writes['skipped'])} unchanged")
+        emit_emf()
+        save_cassette()
+        
+        if all_errors:
+            message = (f'Data collection failed for {len(all_errors)} of '
+                       f'{len(all_results) + len(all_errors)} years')
+        elif continuation:
+            message = (f"Data collection paused before the deadline; "
+                       f"{len(continuation['event']['years'])} years left")
+        elif incomplete:
+            message = f"Data collection stopped at the deadline for {incomplete}"
+        else:
+            message = 'Data collection successful'
         
         return {
-            'statusCode': 200,
+            'statusCode': 500 if all_errors else 206 if incomplete else 200,
             'body': json.dumps({
-                'message': 'Data collection successful',
+                'message': message,
                 'results': all_results,
+                'errors': all_errors,
+                'incomplete': incomplete,
+                'continuation': continuation,
+                'partitions': partition_writes,
+                'request_cache': cache_stats,
+                'throttle': get_throttle_stats(),
+                'http_metrics': get_metrics().summary(),
                 'timestamp': datetime.utcnow().isoformat()
             }, default=str)
         }
@@ -280,14 +868,25 @@ def handler(event, context):
     except Exception as e:
         error_msg = f"Error: {str(e)}\n{traceback.format_exc()}"
         print(error_msg)
+        emit_emf()
+        from utils.api import save_cassette
+        save_cassette()
         
         return {
             'statusCode': 500,
             'body': json.dumps({
                 'error': str(e),
-                'traceback': traceback.format_exc()
+                'traceback': traceback.format_exc(),
+                'http_metrics': get_metrics().summary()
             })
         }
+    finally:
+        if PROFILE_IMPORTS:
+            import_profile.report('Imports during invocation')
+
+
+if PROFILE_IMPORTS:
+    import_profile.report('Init imports')
 
 
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+"""
+Test configuration
+The Lambda code imports its packages from the lambda/ directory (the
+deployment root), so the tests put it on sys.path the same way.
+
+Run from the lambda/ directory:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
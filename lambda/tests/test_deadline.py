@@ -0,0 +1,89 @@
+"""Tests for the invocation deadline in utils.api.SleeperClient."""
+
+import time
+
+import pytest
+
+from benchmarks.local_lambda import LocalContext
+from benchmarks.sleeper_stub import StubServer
+from utils.api import MIN_REQUEST_SECONDS, DeadlineExceeded, SleeperClient
+from utils.scheduler import TimeBudget
+
+
+class FixedBudget:
+    """A deadline that always has the same time left."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def available(self) -> float:
+        return self.seconds
+
+
+@pytest.fixture
+def stub():
+    with StubServer() as server:
+        yield server
+
+
+def make_client(deadline=None, **kwargs) -> SleeperClient:
+    client = SleeperClient(**{'rate_limit': 100, 'rate_burst': 100, **kwargs})
+    client.deadline = deadline
+    return client
+
+
+def state_url(server) -> str:
+    return f'{server.base_url}/v1/state/nfl'
+
+
+def test_fetch_without_deadline(stub):
+    assert make_client().fetch_json(state_url(stub)) == {'week': 17, 'season': '2024'}
+    assert stub.request_count == 1
+
+
+def test_no_request_started_too_close_to_deadline(stub):
+    client = make_client(FixedBudget(MIN_REQUEST_SECONDS / 2))
+    tokens = client.rate_limiter._tokens
+    with pytest.raises(DeadlineExceeded):
+        client.fetch_json(state_url(stub))
+    assert stub.request_count == 0
+    assert client.rate_limiter._tokens == tokens
+    assert client.stats.snapshot()['deadline_exceeded'] == 1
+
+
+def test_queued_request_fails_fast(stub):
+    # The next token is 10s away but only 5s are left: fail now, don't sleep first
+    client = make_client(FixedBudget(MIN_REQUEST_SECONDS + 4), rate_limit=0.1, rate_burst=1)
+    client.rate_limiter.acquire()
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        client.fetch_json(state_url(stub))
+    assert time.monotonic() - start < 1
+    assert stub.request_count == 0
+
+
+def test_retry_that_cannot_finish_is_not_attempted():
+    with StubServer(fault_rate=1.0) as server:
+        client = make_client(FixedBudget(MIN_REQUEST_SECONDS + 4), backoff_base=10, backoff_cap=10)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.fetch_json(state_url(server))
+        assert time.monotonic() - start < 1
+        assert server.request_count == 1
+
+
+def test_timeouts_capped_by_time_left():
+    client = make_client(FixedBudget(2.0), connect_timeout=3.05, read_timeout=30)
+    assert client._timeout('url') == (2.0, 2.0)
+    client.deadline = FixedBudget(60.0)
+    assert client._timeout('url') == (3.05, 30)
+
+
+def test_stalled_request_stops_at_deadline():
+    with StubServer(stall=r'/state/nfl$', stall_seconds=30) as server:
+        client = make_client(TimeBudget(LocalContext(MIN_REQUEST_SECONDS + 1.5), margin=0))
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.fetch_json(state_url(server))
+        assert time.monotonic() - start < MIN_REQUEST_SECONDS + 2
+        assert server.request_count == 1
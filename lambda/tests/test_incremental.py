@@ -0,0 +1,172 @@
+"""Tests for incremental runs: lake watermarks, week objects and completed weeks."""
+
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import lambda_function
+import utils.api
+from benchmarks.local_s3 import LocalS3
+from benchmarks.sleeper_stub import StubServer, build_name_map
+from utils.cache import ResponseCache
+from utils.lake import (
+    LAST_WEEK_METADATA, data_key, delete_week_objects, list_partition, read_watermark, week_key
+)
+
+TABLE = 'stg_matchup_data'
+YEAR = 2024
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    s3 = LocalS3(str(tmp_path))
+    monkeypatch.setattr(lambda_function, 's3_client', s3)
+    monkeypatch.setattr(lambda_function, 'LAKE_BUCKET', 'lake')
+    lambda_function.reset_partition_writes()
+    return s3
+
+
+def weeks_table(weeks, points=1.0) -> pa.RecordBatch:
+    return pa.RecordBatch.from_pydict({
+        'week': pa.array(weeks, pa.int64()),
+        'points': pa.array([points] * len(weeks), pa.float64()),
+    })
+
+
+def put_parquet(s3, key, table, metadata=None):
+    sink = io.BytesIO()
+    pq.write_table(pa.Table.from_batches([table]), sink)
+    s3.put_object(Bucket='lake', Key=key, Body=sink.getvalue(), Metadata=metadata or {})
+
+
+def read_points(s3, key):
+    body = s3.get_object(Bucket='lake', Key=key)['Body'].read()
+    return pq.read_table(io.BytesIO(body)).column('points').to_pylist()
+
+
+def test_watermark_of_empty_partition(lake):
+    assert read_watermark(lake, 'lake', TABLE, YEAR) == 0
+
+
+def test_watermark_from_week_objects(lake):
+    for week in (1, 2, 3):
+        put_parquet(lake, week_key(TABLE, YEAR, week), weeks_table([week]))
+    assert read_watermark(lake, 'lake', TABLE, YEAR) == 3
+
+
+def test_watermark_from_data_object_metadata(lake):
+    put_parquet(lake, data_key(TABLE, YEAR), weeks_table([1, 2]), {LAST_WEEK_METADATA: '5'})
+    assert read_watermark(lake, 'lake', TABLE, YEAR) == 5
+
+
+def test_watermark_from_data_object_without_metadata(lake):
+    put_parquet(lake, data_key(TABLE, YEAR), weeks_table([1, 2, 4, 3]))
+    assert read_watermark(lake, 'lake', TABLE, YEAR) == 4
+
+
+def test_watermark_over_data_and_week_objects(lake):
+    put_parquet(lake, data_key(TABLE, YEAR), weeks_table([1, 2]), {LAST_WEEK_METADATA: '2'})
+    put_parquet(lake, week_key(TABLE, YEAR, 3), weeks_table([3]))
+    assert read_watermark(lake, 'lake', TABLE, YEAR) == 3
+    assert read_watermark(lake, 'lake', TABLE, YEAR + 1) == 0
+
+
+def test_delete_week_objects_through_week(lake):
+    put_parquet(lake, data_key(TABLE, YEAR), weeks_table([1]), {LAST_WEEK_METADATA: '1'})
+    for week in (2, 3, 4):
+        put_parquet(lake, week_key(TABLE, YEAR, week), weeks_table([week]))
+    assert delete_week_objects(lake, 'lake', TABLE, YEAR, 3) == 2
+    assert list_partition(lake, 'lake', TABLE, YEAR) == [
+        data_key(TABLE, YEAR), week_key(TABLE, YEAR, 4)]
+
+
+def test_full_write_records_watermark_and_supersedes_week_objects(lake):
+    put_parquet(lake, week_key(TABLE, YEAR, 1), weeks_table([1]))
+    rows = lambda_function.write_weekly_table(weeks_table([1, 2]), TABLE, YEAR, range(1, 3))
+    assert rows == 2
+    assert list_partition(lake, 'lake', TABLE, YEAR) == [data_key(TABLE, YEAR)]
+    assert read_watermark(lake, 'lake', TABLE, YEAR) == 2
+
+
+def test_incremental_write_rewrites_watermark_week_object(lake):
+    for week in (1, 2):
+        put_parquet(lake, week_key(TABLE, YEAR, week), weeks_table([week]))
+    # Week 2 was corrected after it was written; week 1 is not revisited
+    rows = lambda_function.write_weekly_table(
+        weeks_table([1, 2, 3], points=2.0), TABLE, YEAR, range(1, 4), watermark=2)
+    assert rows == 2
+    assert read_points(lake, week_key(TABLE, YEAR, 1)) == [1.0]
+    assert read_points(lake, week_key(TABLE, YEAR, 2)) == [2.0]
+    assert read_points(lake, week_key(TABLE, YEAR, 3)) == [2.0]
+
+
+def test_incremental_write_leaves_weeks_in_data_object(lake):
+    put_parquet(lake, data_key(TABLE, YEAR), weeks_table([1, 2]), {LAST_WEEK_METADATA: '2'})
+    rows = lambda_function.write_weekly_table(
+        weeks_table([2, 3], points=2.0), TABLE, YEAR, range(2, 4), watermark=2)
+    assert rows == 1
+    assert list_partition(lake, 'lake', TABLE, YEAR) == [
+        data_key(TABLE, YEAR), week_key(TABLE, YEAR, 3)]
+
+
+@pytest.mark.parametrize('state, completed', [
+    ({'season': '2024', 'season_type': 'regular', 'week': 7}, 6),
+    ({'season': '2024', 'season_type': 'pre', 'week': 0}, 0),
+    ({'season': '2024', 'season_type': 'post', 'week': 18}, None),
+    ({'season': '2025', 'season_type': 'regular', 'week': 1}, None),
+    ({'season': '2023', 'season_type': 'off', 'week': 0}, 0),
+    ({}, 0),
+])
+def test_last_completed_week(monkeypatch, state, completed):
+    monkeypatch.setattr(lambda_function, 'CURRENT_YEAR', YEAR)
+    monkeypatch.setattr(utils.api, 'get_nfl_state', lambda: state)
+    assert lambda_function.last_completed_week(YEAR) == completed
+
+
+def test_past_season_is_complete(monkeypatch):
+    monkeypatch.setattr(lambda_function, 'CURRENT_YEAR', YEAR)
+    assert lambda_function.last_completed_week(YEAR - 1) is None
+
+
+def test_nfl_state_is_not_persisted():
+    assert not ResponseCache.is_cacheable('https://api.sleeper.app/v1/state/nfl')
+    assert ResponseCache.is_cacheable('https://api.sleeper.app/v1/league/1/matchups/1')
+    assert ResponseCache.is_cacheable('https://api.sleeper.com/stats/nfl/2024/1?season_type=regular')
+
+
+@pytest.fixture
+def run_season(lake, monkeypatch):
+    """Collect the stub's 2024 season (14 weeks played) during week 7."""
+    with StubServer(year=YEAR) as stub:
+        monkeypatch.setattr(utils.api, 'API_BASE', f'{stub.base_url}/v1')
+        monkeypatch.setattr(utils.api, 'STATS_BASE', stub.base_url)
+        monkeypatch.setattr(utils.api, 'get_nfl_state',
+                            lambda: {'season': str(YEAR), 'season_type': 'regular', 'week': 7})
+        monkeypatch.setattr(lambda_function, 'CURRENT_YEAR', YEAR)
+        monkeypatch.setattr(lambda_function, 'NAME_MAP', build_name_map())
+
+        def run(incremental):
+            utils.api.reset_request_cache()
+            return lambda_function.collect_season_data(
+                f'L{YEAR}', YEAR, 14, league_scored=True, include_stat_columns=False,
+                incremental=incremental)
+
+        yield run
+    utils.api.reset_request_cache()
+
+
+def watermarks(s3):
+    return {table: read_watermark(s3, 'lake', table, YEAR) for table in lambda_function.WEEKLY_TABLES}
+
+
+def test_full_run_includes_week_in_progress(run_season, lake):
+    run_season(incremental=False)
+    assert watermarks(lake) == {table: 14 for table in lambda_function.WEEKLY_TABLES}
+
+
+def test_incremental_run_stops_before_week_in_progress(run_season, lake):
+    run_season(incremental=True)
+    assert watermarks(lake) == {table: 6 for table in lambda_function.WEEKLY_TABLES}
+    assert list_partition(lake, 'lake', TABLE, YEAR)[-1] == week_key(TABLE, YEAR, 6)
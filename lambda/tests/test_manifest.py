@@ -0,0 +1,163 @@
+"""Tests for the backfill progress manifest and resuming a season from it."""
+
+import threading
+
+import pytest
+
+import collectors.playoff_matchup_data
+import lambda_function
+import utils.api
+import utils.players
+from benchmarks.bench_backfill import SCORING
+from benchmarks.local_s3 import LocalS3
+from benchmarks.sleeper_stub import StubServer, build_name_map
+from utils.api import DeadlineExceeded
+from utils.cache import LocalDirBackend
+from utils.lake import list_partition
+from utils.manifest import BackfillManifest
+
+YEAR = 2023
+LEAGUE_ID = f'L{YEAR}'
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return LocalDirBackend(str(tmp_path / 'state'))
+
+
+def test_progress_survives_reload(backend):
+    BackfillManifest(backend).mark_complete(YEAR, 'stg_matchup_data', LEAGUE_ID, 140)
+    manifest = BackfillManifest(backend).load()
+    assert manifest.rows(YEAR, 'stg_matchup_data', LEAGUE_ID) == 140
+    assert manifest.is_complete(YEAR, 'stg_matchup_data', LEAGUE_ID)
+    assert not manifest.is_complete(YEAR, 'stg_regular_season', LEAGUE_ID)
+    assert not manifest.is_complete(YEAR + 1, 'stg_matchup_data', LEAGUE_ID)
+
+
+def test_zero_rows_count_as_complete(backend):
+    manifest = BackfillManifest(backend)
+    manifest.mark_complete(YEAR, 'stg_playoff_matchup_data', LEAGUE_ID, 0)
+    assert manifest.rows(YEAR, 'stg_playoff_matchup_data', LEAGUE_ID) == 0
+    assert manifest.is_complete(YEAR, 'stg_playoff_matchup_data', LEAGUE_ID)
+
+
+def test_other_league_is_not_complete(backend):
+    manifest = BackfillManifest(backend)
+    manifest.mark_complete(YEAR, 'stg_matchup_data', LEAGUE_ID, 140)
+    assert manifest.rows(YEAR, 'stg_matchup_data', 'other') is None
+
+
+def test_reset_is_persisted(backend):
+    BackfillManifest(backend).mark_complete(YEAR, 'stg_matchup_data', LEAGUE_ID, 140)
+    BackfillManifest(backend).load().reset()
+    assert BackfillManifest(backend).load().completed() == {}
+
+
+def test_completed_by_year(backend):
+    manifest = BackfillManifest(backend)
+    manifest.mark_complete(YEAR, 'stg_matchup_data', LEAGUE_ID, 140)
+    manifest.mark_complete(YEAR - 1, 'stg_regular_season', 'L2022', 10)
+    manifest.mark_complete(YEAR, 'stg_regular_season', LEAGUE_ID, 10)
+    assert manifest.completed() == {
+        '2022': ['stg_regular_season'],
+        '2023': ['stg_matchup_data', 'stg_regular_season'],
+    }
+
+
+def test_concurrent_seasons_all_persist(backend):
+    manifest = BackfillManifest(backend)
+    threads = [threading.Thread(target=manifest.mark_complete,
+                                args=(year, table, f'L{year}', 1))
+               for year in range(2015, 2023) for table in lambda_function.STAGING_TABLES]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    reloaded = BackfillManifest(backend).load().completed()
+    assert len(reloaded) == 8
+    assert all(len(tables) == len(lambda_function.STAGING_TABLES) for tables in reloaded.values())
+
+
+@pytest.fixture
+def collect(tmp_path, monkeypatch):
+    """Collect the stub's 2023 season into a local lake, all five tables."""
+    lake = LocalS3(str(tmp_path / 'lake'))
+    monkeypatch.setattr(lambda_function, 's3_client', lake)
+    monkeypatch.setattr(lambda_function, 'LAKE_BUCKET', 'lake')
+    monkeypatch.setattr(lambda_function, 'NAME_MAP', build_name_map())
+    monkeypatch.setattr(lambda_function, 'SCORING_SETTINGS', SCORING)
+    monkeypatch.setattr(utils.players, '_directory', None)
+    utils.players.configure_player_directory(None)
+    lambda_function.reset_partition_writes()
+    with StubServer(year=YEAR) as stub:
+        monkeypatch.setattr(utils.api, 'API_BASE', f'{stub.base_url}/v1')
+        monkeypatch.setattr(utils.api, 'STATS_BASE', stub.base_url)
+
+        def run(manifest, resume):
+            utils.api.reset_request_cache()
+            return lambda_function.collect_season_data(
+                LEAGUE_ID, YEAR, collect_playoffs=True, collect_player_totals=True,
+                league_scored=True, include_stat_columns=False,
+                manifest=manifest, resume=resume)
+
+        yield run, lake
+    utils.api.reset_request_cache()
+
+
+def written_tables(lake):
+    return [table for table in lambda_function.STAGING_TABLES
+            if list_partition(lake, 'lake', table, YEAR)]
+
+
+def test_resume_skips_completed_tables(collect, backend):
+    run, lake = collect
+    manifest = BackfillManifest(backend)
+    manifest.mark_complete(YEAR, 'stg_regular_season', LEAGUE_ID, 10)
+    manifest.mark_complete(YEAR, 'stg_matchup_data', LEAGUE_ID, 140)
+
+    results = run(manifest, resume=True)
+    assert results['stg_regular_season'] == 10
+    assert results['stg_matchup_data'] == 140
+    assert written_tables(lake) == ['stg_player_details_by_team', 'stg_playoff_matchup_data',
+                                    'stg_player_total_points']
+    assert manifest.completed() == {str(YEAR): sorted(lambda_function.STAGING_TABLES)}
+
+
+def test_resume_of_complete_season_writes_nothing(collect, backend):
+    run, lake = collect
+    manifest = BackfillManifest(backend)
+    for table in lambda_function.STAGING_TABLES:
+        manifest.mark_complete(YEAR, table, LEAGUE_ID, 1)
+    assert run(manifest, resume=True) == {table: 1 for table in lambda_function.STAGING_TABLES}
+    assert lake.put_count == 0
+
+
+def test_without_resume_every_table_is_written(collect, backend):
+    run, lake = collect
+    manifest = BackfillManifest(backend)
+    manifest.mark_complete(YEAR, 'stg_regular_season', LEAGUE_ID, 10)
+    run(manifest, resume=False)
+    assert written_tables(lake) == list(lambda_function.STAGING_TABLES)
+
+
+def test_interrupted_season_resumes_where_it_stopped(collect, backend, monkeypatch):
+    run, lake = collect
+
+    def deadline(*args, **kwargs):
+        raise DeadlineExceeded(f'/league/{LEAGUE_ID}/matchups/15', 0.5)
+
+    manifest = BackfillManifest(backend)
+    with monkeypatch.context() as patch:
+        patch.setattr(collectors.playoff_matchup_data, 'collect_playoff_matchup_data', deadline)
+        with pytest.raises(lambda_function.SeasonIncomplete) as stopped:
+            run(manifest, resume=True)
+    assert list(stopped.value.results) == ['stg_regular_season', 'stg_matchup_data',
+                                           'stg_player_details_by_team']
+
+    puts = lake.put_count
+    resumed = run(BackfillManifest(backend).load(), resume=True)
+    assert lake.put_count - puts == 2
+    assert resumed == {**stopped.value.results,
+                       'stg_playoff_matchup_data': resumed['stg_playoff_matchup_data'],
+                       'stg_player_total_points': resumed['stg_player_total_points']}
+    assert written_tables(lake) == list(lambda_function.STAGING_TABLES)
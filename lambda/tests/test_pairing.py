@@ -0,0 +1,105 @@
+"""Tests for utils.pairing and the playoff matchup pairing built on it."""
+
+import numpy as np
+import pandas as pd
+
+from collectors.playoff_matchup_data import collect_playoff_matchup_data
+from utils.pairing import pair_opponents
+from utils.weeks import WeekBundle
+
+
+def teams(rows):
+    return pd.DataFrame(rows, columns=['week', 'matchup_id', 'team_id', 'points'])
+
+
+def pair(df, **kwargs):
+    return pair_opponents(df, id_col='team_id', points_col='points', **kwargs)
+
+
+def opponents(df):
+    return [None if pd.isna(team) else team for team in df['opponent_team_id']]
+
+
+def test_two_teams_face_each_other():
+    result = pair(teams([(1, 1, 'a', 10.0), (1, 1, 'b', 20.0)]))
+    assert opponents(result) == ['b', 'a']
+    assert result['opponent_points'].tolist() == [20.0, 10.0]
+
+
+def test_bye_has_no_opponent():
+    result = pair(teams([(1, 1, 'a', 10.0), (1, 1, 'b', 20.0), (1, 2, 'c', 30.0)]))
+    assert opponents(result) == ['b', 'a', None]
+    assert np.isnan(result['opponent_points'].iloc[2])
+
+
+def test_three_team_group_is_not_paired():
+    result = pair(teams([(1, 1, 'a', 10.0), (1, 1, 'b', 20.0), (1, 1, 'c', 30.0)]))
+    assert opponents(result) == [None, None, None]
+    assert result['opponent_points'].isna().all()
+
+
+def test_null_matchup_id_is_not_paired():
+    result = pair(teams([(1, None, 'a', 10.0), (1, None, 'b', 20.0), (1, 1, 'c', 30.0), (1, 1, 'd', 40.0)]))
+    assert opponents(result) == [None, None, 'd', 'c']
+
+
+def test_same_matchup_id_in_other_week_is_separate():
+    result = pair(teams([(1, 1, 'a', 10.0), (2, 1, 'b', 20.0)]))
+    assert opponents(result) == [None, None]
+
+
+def test_keeps_rows_order_and_input():
+    df = teams([(2, 1, 'a', 10.0), (1, 1, 'b', 20.0), (2, 1, 'c', 30.0), (1, 1, 'd', 40.0)])
+    df.index = [7, 5, 3, 1]
+    result = pair(df)
+    assert result.index.tolist() == [7, 5, 3, 1]
+    assert opponents(result) == ['c', 'd', 'a', 'b']
+    assert 'opponent_team_id' not in df.columns
+
+
+# Playoffs: 'u<n>' owns roster n, shown as member n * 10; roster 9 has no owner
+USERS = [{'user_id': f'u{n}', 'display_name': f'team{n}'} for n in range(1, 9)]
+ROSTERS = [{'roster_id': n, 'owner_id': f'u{n}' if n < 9 else None} for n in range(1, 10)]
+NAME_MAP = {f'team{n}': n * 10 for n in range(1, 9)}
+
+
+def playoffs(matchups):
+    bundles = {15: WeekBundle(15, tuple(matchups), {}, ())}
+    df = collect_playoff_matchup_data('league', 2024, [15], {15: 1}, ROSTERS, USERS, NAME_MAP,
+                                      bundles=bundles)
+    return df[['matchup_id', 'member_id', 'opponent_team_id', 'points', 'opponent_points']]
+
+
+def entry(roster_id, matchup_id, points):
+    return {'roster_id': roster_id, 'matchup_id': matchup_id, 'points': points}
+
+
+def test_playoff_pairs_and_bye():
+    df = playoffs([entry(1, 1, 100.0), entry(3, 2, 90.0), entry(2, 1, 80.0)])
+    assert df.values.tolist() == [
+        [1, 10, 20, 100.0, 80.0],
+        [1, 20, 10, 80.0, 100.0],
+        [2, 30, -1, 90.0, 0.0],
+    ]
+
+
+def test_playoff_group_pairs_off_in_listed_order():
+    df = playoffs([entry(1, 1, 1.0), entry(2, 1, 2.0), entry(3, 1, 3.0), entry(4, 1, 4.0), entry(6, 1, 6.0)])
+    assert df[['member_id', 'opponent_team_id']].values.tolist() == [
+        [10, 20], [20, 10], [30, 40], [40, 30], [60, -1],
+    ]
+
+
+def test_playoff_pair_with_unknown_member_is_dropped():
+    df = playoffs([entry(1, 1, 1.0), entry(9, 1, 9.0), entry(2, 2, 2.0), entry(3, 2, 3.0), entry(9, 3, 9.0)])
+    assert df['member_id'].tolist() == [20, 30]
+
+
+def test_playoff_null_matchup_id_and_excluded_matchups_are_skipped():
+    df = playoffs([entry(1, None, 1.0), entry(2, 5, 2.0), entry(3, 5, 3.0), entry(4, 7, 4.0), entry(6, 4, 6.0)])
+    assert df['member_id'].tolist() == [60]
+
+
+def test_playoff_group_order_counts_dropped_teams():
+    df = playoffs([entry(9, 2, 9.0), entry(1, 1, 1.0), entry(2, 2, 2.0), entry(3, 1, 3.0), entry(4, 2, 4.0)])
+    assert df[['matchup_id', 'member_id']].values.tolist() == [[2, 40], [1, 10], [1, 30]]
@@ -0,0 +1,76 @@
+"""Tests for utils.api.RequestCache."""
+
+import threading
+import time
+
+import pytest
+
+from utils.api import RequestCache
+
+
+def test_fetches_each_url_once():
+    cache, calls = RequestCache(), []
+
+    def fetch(url):
+        calls.append(url)
+        return {'url': url}
+
+    assert cache.get_or_fetch('a', fetch) == {'url': 'a'}
+    assert cache.get_or_fetch('a', fetch) == {'url': 'a'}
+    assert calls == ['a']
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'coalesced': 0, 'entries': 1}
+
+
+def test_concurrent_callers_share_one_fetch():
+    cache, calls = RequestCache(), []
+    release = threading.Event()
+
+    def fetch(url):
+        calls.append(url)
+        release.wait(5)
+        return 'body'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch('a', fetch)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while cache.stats()['coalesced'] < 7:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == ['a']
+    assert results == ['body'] * 8
+
+
+def test_failures_are_not_cached():
+    cache = RequestCache()
+    assert cache.get_or_fetch('a', lambda url: None) is None
+    assert cache.get_or_fetch('a', lambda url: 'body') == 'body'
+
+
+def test_exception_reaches_caller_and_is_not_cached():
+    cache = RequestCache()
+
+    def fail(url):
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch('a', fail)
+    assert cache.get_or_fetch('a', lambda url: 'body') == 'body'
+
+
+def test_evict_weekly_and_season_aggregate_stats():
+    cache = RequestCache()
+    urls = [
+        'https://api.sleeper.com/stats/nfl/2020/1?season_type=regular',
+        'https://api.sleeper.com/stats/nfl/2020?season_type=regular',
+        'https://api.sleeper.com/stats/nfl/2021/1?season_type=regular',
+        'https://api.sleeper.app/v1/league/L2020/matchups/1',
+        'https://api.sleeper.app/v1/players/nfl',
+    ]
+    for url in urls:
+        cache.get_or_fetch(url, lambda u: 'body')
+    cache.evict(['/league/L2020/', '/stats/nfl/2020/', '/stats/nfl/2020?'])
+    assert sorted(cache._responses) == sorted([urls[2], urls[4]])
@@ -0,0 +1,83 @@
+"""Tests for utils.streaming.iter_object_items."""
+
+import json
+
+import pytest
+
+from utils.streaming import iter_object_items
+
+DOCUMENT = {
+    '1': {'full_name': 'Plain Name', 'team': 'KC', 'age': 27},
+    '2': {'full_name': 'Say "Hi" \\ Bye', 'note': '{not, a: member}'},
+    '3': {'full_name': 'Zoë Ünïcødé ✓', 'weight': 215.5, 'ratio': -1.25e-3},
+    '4': {'active': True, 'injured': False, 'team': None, 'depth': [1, [2, 3], {}]},
+    '5': 12345678901234567890,
+    '6': 'x',
+    '7': 0.5,
+}
+
+
+def encode(document=DOCUMENT, separators=(', ', ': ')) -> bytes:
+    return json.dumps(document, ensure_ascii=False, separators=separators).encode('utf-8')
+
+
+def decode(chunks):
+    return list(iter_object_items(chunks))
+
+
+def test_single_chunk():
+    assert decode([encode()]) == list(DOCUMENT.items())
+
+
+def test_byte_at_a_time():
+    body = encode()
+    assert decode(body[i:i + 1] for i in range(len(body))) == list(DOCUMENT.items())
+
+
+@pytest.mark.parametrize('separators', [(', ', ': '), (',', ':')])
+def test_every_split_into_three_chunks(separators):
+    # Covers delimiters, escaped quotes, multi-byte characters and numbers
+    # cut at every possible pair of chunk boundaries
+    body = encode(separators=separators)
+    expected = list(DOCUMENT.items())
+    for i in range(len(body) + 1):
+        for j in range(i, len(body) + 1):
+            assert decode([body[:i], body[i:j], body[j:]]) == expected, (i, j)
+
+
+def test_number_split_at_chunk_boundary():
+    assert decode([b'{"a": 1.', b'5, "b": 12', b'34}']) == [('a', 1.5), ('b', 1234)]
+
+
+def test_whitespace_and_empty_chunks():
+    assert decode([b'', b'  \n{ ', b'', b'"a" ', b': ', b'"b"\n', b'}\n']) == [('a', 'b')]
+
+
+def test_empty_object():
+    assert decode([b'{', b'}']) == []
+
+
+def test_stops_at_closing_brace():
+    def chunks():
+        yield b'{"a": 1}'
+        raise AssertionError("read past the end of the object")
+
+    assert decode(chunks()) == [('a', 1)]
+
+
+@pytest.mark.parametrize('body', [b'[1, 2]', b'"text"', b'null'])
+def test_not_an_object(body):
+    with pytest.raises(ValueError):
+        decode([body])
+
+
+@pytest.mark.parametrize('body', [b'{"a": 1', b'{"a": ', b'{"a": "unterminated', b'{"a": 1,'])
+def test_truncated(body):
+    with pytest.raises(ValueError):
+        decode([body])
+
+
+@pytest.mark.parametrize('body', [b'{"a" 1}', b'{"a": 1 "b": 2}'])
+def test_missing_delimiter(body):
+    with pytest.raises(ValueError):
+        decode([body])
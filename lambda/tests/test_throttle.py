@@ -0,0 +1,117 @@
+"""Tests for utils.throttle."""
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import utils.throttle as throttle
+from utils.throttle import (
+    DecorrelatedJitter, TokenBucket, is_retryable_status, parse_retry_after
+)
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so waits take no real time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(throttle.time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(throttle.time, 'sleep', fake.sleep)
+    return fake
+
+
+def test_burst_then_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_refill_is_capped_at_burst(clock):
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket.acquire(), bucket.acquire()
+    clock.now += 60
+    assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.1)
+
+
+def test_max_wait_gives_up_without_taking_a_token(clock):
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.acquire()
+    assert bucket.acquire(max_wait=0.5) is None
+    assert clock.slept == []
+    # The token it declined is still there for the next caller
+    clock.now += 1
+    assert bucket.acquire(max_wait=0) == 0.0
+
+
+def test_max_wait_allows_a_wait_that_fits(clock):
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.acquire()
+    assert bucket.acquire(max_wait=1.5) == pytest.approx(1.0)
+
+
+def test_throttled_halves_rate_and_drains(clock):
+    bucket = TokenBucket(rate=8, burst=8, min_rate=1)
+    bucket.on_throttled()
+    assert bucket.rate == 4
+    assert bucket.acquire() == pytest.approx(0.25)
+    for _ in range(5):
+        bucket.on_throttled()
+    assert bucket.rate == 1
+
+
+def test_success_recovers_towards_max_rate(clock):
+    bucket = TokenBucket(rate=10)
+    bucket.on_throttled()
+    for _ in range(9):
+        bucket.on_success()
+    assert bucket.rate == pytest.approx(9.5)
+    bucket.on_success()
+    bucket.on_success()
+    assert bucket.rate == 10
+
+
+def test_decorrelated_jitter_stays_within_bounds():
+    backoff = DecorrelatedJitter(base=0.5, cap=4)
+    previous = 0.5
+    for _ in range(200):
+        delay = backoff.next()
+        assert 0.5 <= delay <= min(4, previous * 3)
+        previous = delay
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, None), ('', None), ('0', 0.0), ('3', 3.0), ('1.5', 1.5), ('-2', 0.0), ('soon', None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(future) <= 30
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=30), usegmt=True)
+    assert parse_retry_after(past) == 0.0
+
+
+@pytest.mark.parametrize('status, retryable', [
+    (429, True), (500, True), (503, True), (400, False), (404, False), (304, False),
+])
+def test_is_retryable_status(status, retryable):
+    assert is_retryable_status(status) is retryable
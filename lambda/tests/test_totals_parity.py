@@ -0,0 +1,60 @@
+"""
+Parity of the season-aggregate and weekly player totals on recorded Sleeper data.
+
+SEASON_AGGREGATE_STATS may only be enabled if both paths produce the same
+stg_player_total_points rows, including weeks_played (Sleeper's 'gp' on the
+aggregate path, the number of weekly stat rows on the weekly path). This
+replays a cassette of /players/nfl, /stats/nfl/{year}?season_type=regular and
+every /stats/nfl/{year}/{week} of that regular season, and is skipped when
+the cassette is absent.
+
+Record one (needs network access to api.sleeper.app):
+    SLEEPER_TOTALS_CASSETTE_MODE=record python -m pytest tests/test_totals_parity.py
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+import utils.api as api
+import utils.players as players
+from benchmarks.bench_scoring import SCORING
+from collectors.player_total_points import collect_player_total_points_data
+
+YEAR = int(os.environ.get('SLEEPER_TOTALS_YEAR', 2020))
+CASSETTE = os.environ.get(
+    'SLEEPER_TOTALS_CASSETTE',
+    os.path.join(os.path.dirname(__file__), 'fixtures', f'totals_{YEAR}.json.gz'))
+MODE = os.environ.get('SLEEPER_TOTALS_CASSETTE_MODE', api.REPLAY)
+
+
+@pytest.fixture
+def recorded_season(monkeypatch):
+    if MODE == api.REPLAY and not os.path.exists(CASSETTE):
+        pytest.skip(f'no recorded season at {CASSETTE}')
+    monkeypatch.setattr(api, '_client', None)
+    monkeypatch.setattr(api, '_cassette', None)
+    monkeypatch.setattr(players, '_directory', None)
+    players.configure_player_directory(None)
+    api.reset_request_cache()
+    api.use_cassette(CASSETTE, MODE)
+    yield
+    api.save_cassette()
+    api.get_client().close()
+    api.reset_request_cache()
+
+
+def test_aggregate_matches_weekly_totals(recorded_season):
+    assert list(api.regular_season_weeks(YEAR)) == list(range(1, 18)), \
+        'the aggregate path only applies to seasons of weeks 1-17'
+    assert api.get_season_stats(YEAR), 'the aggregate payload must be recorded'
+    weekly = collect_player_total_points_data([YEAR], SCORING)
+    aggregate = collect_player_total_points_data([YEAR], SCORING, use_season_aggregate=True)
+    assert len(weekly) > 0
+
+    weekly = weekly.sort_values('player_id').reset_index(drop=True)
+    aggregate = aggregate.sort_values('player_id').reset_index(drop=True)
+    assert weekly['player_id'].tolist() == aggregate['player_id'].tolist()
+    assert weekly['weeks_played'].tolist() == aggregate['weeks_played'].tolist()
+    pd.testing.assert_frame_equal(aggregate, weekly)
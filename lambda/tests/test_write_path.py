@@ -0,0 +1,80 @@
+"""Tests for write_to_s3: content hashing and skipping unchanged objects."""
+
+import pyarrow as pa
+import pytest
+
+import lambda_function
+from benchmarks.local_s3 import LocalS3
+from utils.lake import CONTENT_HASH_METADATA, content_hash, data_key, object_metadata
+
+TABLE = 'stg_regular_season'
+YEAR = 2024
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    s3 = LocalS3(str(tmp_path))
+    monkeypatch.setattr(lambda_function, 's3_client', s3)
+    monkeypatch.setattr(lambda_function, 'LAKE_BUCKET', 'lake')
+    lambda_function.reset_partition_writes()
+    return s3
+
+
+def standings(points=(101.5, 99.0, 87.25)) -> pa.Table:
+    return pa.table({
+        'member_id': pa.array([10, 20, 30], pa.int64()),
+        'team_name': pa.array(['a', 'b', None], pa.string()),
+        'points': pa.array(points, pa.float64()),
+    })
+
+
+def test_hash_ignores_schema_metadata():
+    table = standings()
+    assert content_hash(table.replace_schema_metadata({'pandas': '{}', 'writer': 'x'})) == content_hash(table)
+    assert content_hash(pa.Table.from_pandas(table.to_pandas(), preserve_index=False)) == content_hash(table)
+
+
+def test_hash_ignores_chunking():
+    table = standings()
+    assert content_hash(pa.concat_tables([table.slice(0, 1), table.slice(1)])) == content_hash(table)
+    assert content_hash(table.slice(1)) == content_hash(pa.table({
+        'member_id': pa.array([20, 30], pa.int64()),
+        'team_name': pa.array(['b', None], pa.string()),
+        'points': pa.array([99.0, 87.25], pa.float64()),
+    }))
+
+
+def test_hash_covers_values_and_types():
+    table = standings()
+    assert content_hash(standings(points=(101.5, 99.0, 87.5))) != content_hash(table)
+    assert content_hash(table.cast(pa.schema([
+        ('member_id', pa.int32()), ('team_name', pa.string()), ('points', pa.float64())]))) != content_hash(table)
+    assert content_hash(table.rename_columns(['member_id', 'team', 'points'])) != content_hash(table)
+
+
+def test_unchanged_content_is_not_rewritten(lake):
+    lambda_function.write_to_s3(standings(), TABLE, YEAR)
+    lambda_function.write_to_s3(standings().to_pandas(), TABLE, YEAR)
+    assert lake.put_count == 1
+    assert lambda_function.partition_writes['written'] == [data_key(TABLE, YEAR)]
+    assert lambda_function.partition_writes['skipped'] == [data_key(TABLE, YEAR)]
+
+
+def test_changed_content_is_rewritten(lake):
+    lambda_function.write_to_s3(standings(), TABLE, YEAR)
+    lambda_function.write_to_s3(standings(points=(101.5, 99.0, 90.0)), TABLE, YEAR)
+    assert lake.put_count == 2
+    stored = object_metadata(lake, 'lake', data_key(TABLE, YEAR))
+    assert stored[CONTENT_HASH_METADATA] == content_hash(standings(points=(101.5, 99.0, 90.0)))
+
+
+def test_changed_watermark_is_rewritten(lake):
+    lambda_function.write_to_s3(standings(), TABLE, YEAR, last_week=3)
+    lambda_function.write_to_s3(standings(), TABLE, YEAR, last_week=4)
+    assert lake.put_count == 2
+
+
+def test_stored_object_without_hash_is_rewritten(lake):
+    lake.put_object(Bucket='lake', Key=data_key(TABLE, YEAR), Body=b'old', Metadata={})
+    lambda_function.write_to_s3(standings().to_pandas(), TABLE, YEAR)
+    assert lake.put_count == 2
@@ -3,92 +3,642 @@ Sleeper API wrapper functions
 Handles all API calls to Sleeper with retry logic and error handling
 """
 
+import asyncio
+import json
+import os
 import requests
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+from urllib3.util.request import ACCEPT_ENCODING
+from utils.cache import ResponseCache
+from utils.cassette import REPLAY, Cassette, CassetteAdapter
+from utils.metrics import get_metrics
+from utils.scheduler import TimeBudget
+from utils.throttle import (
+    DecorrelatedJitter, ThrottleStats, TokenBucket, is_retryable_status, parse_retry_after
+)
+
+
+# Base URLs (overridable so the collectors can run against a local stand-in server)
+API_BASE = os.environ.get('SLEEPER_API_BASE', 'https://api.sleeper.app/v1')
+STATS_BASE = os.environ.get('SLEEPER_STATS_BASE', 'https://api.sleeper.com')
+
+# Transport defaults
+CONNECT_TIMEOUT = float(os.environ.get('SLEEPER_CONNECT_TIMEOUT', 3.05))
+READ_TIMEOUT = float(os.environ.get('SLEEPER_READ_TIMEOUT', 30))
+POOL_SIZE = int(os.environ.get('SLEEPER_POOL_SIZE', 16))
+
+# Requests are not started (nor retried) with less time than this left before
+# the invocation deadline
+MIN_REQUEST_SECONDS = float(os.environ.get('SLEEPER_MIN_REQUEST_SECONDS', 1.0))
+
+# Max requests in flight at once for the concurrent fetch helpers
+MAX_CONCURRENCY = int(os.environ.get('SLEEPER_MAX_CONCURRENCY', 8))
+
+# Rate limit and retry policy (Sleeper asks clients to stay under 1000 calls/minute)
+RATE_LIMIT = float(os.environ.get('SLEEPER_RATE_LIMIT', 15))
+RATE_BURST = float(os.environ.get('SLEEPER_RATE_BURST', 15))
+BACKOFF_BASE = float(os.environ.get('SLEEPER_BACKOFF_BASE', 0.5))
+BACKOFF_CAP = float(os.environ.get('SLEEPER_BACKOFF_CAP', 20))
+
+# Record/replay cassette (see utils.cassette): path, mode and replay latency
+CASSETTE_PATH = os.environ.get('SLEEPER_CASSETTE')
+CASSETTE_MODE = os.environ.get('SLEEPER_CASSETTE_MODE', REPLAY)
+CASSETTE_LATENCY = os.environ.get('SLEEPER_CASSETTE_LATENCY', '0')
+
+# Read size for streamed (incrementally decoded) responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+T = TypeVar('T')
+
+
+class DeadlineExceeded(Exception):
+    """A Sleeper request could not finish before the invocation deadline."""
+
+    def __init__(self, url: str, seconds_left: float):
+        super().__init__(f"{max(seconds_left, 0):.1f}s left before the deadline, not fetching {url}")
+        self.url = url
+        self.seconds_left = seconds_left
+
+
+class SleeperClient:
+    """
+    Pooled, keep-alive HTTP client for the Sleeper API.
+
+    A single requests.Session is reused for every call, so the TCP/TLS
+    handshake to each Sleeper host happens once per container instead of
+    once per request. Responses are requested gzip/brotli compressed
+    (brotli only when a brotli decoder is installed).
+
+    Every request first takes a token from a shared rate limiter. Transient
+    failures (connection errors, 429, 5xx) are retried with decorrelated-jitter
+    backoff, honoring Retry-After; other 4xx responses are not retried.
+
+    With a deadline set, timeouts are capped by the time left before it, and
+    a request (or retry) that cannot start MIN_REQUEST_SECONDS before it
+    raises DeadlineExceeded instead of being attempted.
+    """
+
+    def __init__(self, connect_timeout: float = CONNECT_TIMEOUT,
+                 read_timeout: float = READ_TIMEOUT,
+                 pool_size: int = POOL_SIZE,
+                 rate_limit: float = RATE_LIMIT,
+                 rate_burst: float = RATE_BURST,
+                 backoff_base: float = BACKOFF_BASE,
+                 backoff_cap: float = BACKOFF_CAP):
+        """
+        Args:
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait between bytes of the response
+            pool_size: Max connections per host; extra concurrent requests
+                wait for a free connection instead of opening new ones
+            rate_limit: Requests per second across all threads
+            rate_burst: Requests allowed back-to-back before the rate applies
+            backoff_base: Minimum seconds between retries
+            backoff_cap: Maximum seconds between retries
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+        self.response_cache: Optional[ResponseCache] = None
+        self.deadline: Optional[TimeBudget] = None
+        self.rate_limiter = TokenBucket(rate_limit, rate_burst)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.stats = ThrottleStats()
+
+        self.session = requests.Session()
+        self.mount(HTTPAdapter(pool_connections=4, pool_maxsize=pool_size,
+                               pool_block=True, max_retries=0))
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+
+    def mount(self, adapter: HTTPAdapter):
+        """Route all requests through the given transport adapter."""
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            stream: bool = False, timeout=None) -> requests.Response:
+        """Issue a single GET over the pooled session (no rate limiting or retries)."""
+        return self.session.get(url, headers=headers, timeout=timeout or self.timeout, stream=stream)
+
+    def seconds_left(self) -> float:
+        """Seconds until the deadline (infinite without one)."""
+        return self.deadline.available() if self.deadline is not None else float('inf')
+
+    def _check_deadline(self, url: str) -> float:
+        """Seconds left before the deadline; raises DeadlineExceeded if too few to start url."""
+        left = self.seconds_left()
+        if left < MIN_REQUEST_SECONDS:
+            self.stats.add('deadline_exceeded')
+            raise DeadlineExceeded(url, left)
+        return left
+
+    def _timeout(self, url: str):
+        """(connect, read) timeout for the next attempt, capped by the time left."""
+        left = self._check_deadline(url)
+        return tuple(min(timeout, left) for timeout in self.timeout)
+
+    def _until_deadline(self, url: str, chunks: Iterable[bytes]) -> Iterable[bytes]:
+        # A streamed body arrives over many reads; stop between them at the deadline
+        for chunk in chunks:
+            if self.seconds_left() <= 0:
+                self.stats.add('deadline_exceeded')
+                raise DeadlineExceeded(url, self.seconds_left())
+            yield chunk
+
+    def _request(self, url: str, handle: Callable[[requests.Response], T],
+                 retry_count: int = 3, headers: Optional[Dict[str, str]] = None,
+                 stream: bool = False) -> Optional[T]:
+        """
+        GET url and pass the response to handle(), with rate limiting and retries.
+        Errors raised by handle() (e.g. a truncated JSON body) are retried too.
+
+        Returns:
+            handle()'s result, or None if the request failed for good
+
+        Raises:
+            DeadlineExceeded: Too little time is left for the request or its next retry
+        """
+        backoff = DecorrelatedJitter(self.backoff_base, self.backoff_cap)
+
+        for attempt in range(retry_count):
+            # Fail fast instead of queueing for a token the request could not use,
+            # and queue only as long as it could still start in time
+            left = self._check_deadline(url)
+            waited = self.rate_limiter.acquire(max_wait=left - MIN_REQUEST_SECONDS)
+            if waited is None:
+                self.stats.add('deadline_exceeded')
+                raise DeadlineExceeded(url, self.seconds_left())
+            if waited:
+                self.stats.add('throttle_waits')
+                self.stats.add('throttle_wait_seconds', waited)
+            timeout = self._timeout(url)
+            self.stats.add('requests')
+
+            retry_after = None
+            start = time.perf_counter()
+            try:
+                with self.get(url, headers, stream, timeout) as response:
+                    response.raise_for_status()
+                    if not stream:
+                        response.content  # finish the download before timing the decode
+                    fetched = time.perf_counter()
+                    result = handle(response)
+                    decoded = time.perf_counter()
+                    wire_bytes = response.raw.tell() or len(response.content or b'')
+                # Streamed bodies are decoded while they download, so it all counts as latency
+                get_metrics().record_request(
+                    url, response.status_code,
+                    latency_seconds=(decoded if stream else fetched) - start,
+                    num_bytes=wire_bytes,
+                    decode_seconds=0.0 if stream else decoded - fetched,
+                )
+                self.rate_limiter.on_success()
+                return result
+            except requests.HTTPError as e:
+                status = e.response.status_code
+                get_metrics().record_request(url, status, time.perf_counter() - start)
+                if not is_retryable_status(status):
+                    self.stats.add('client_errors')
+                    self.stats.add('failures')
+                    print(f"  Failed to fetch: {url}")
+                    print(f"  Error: {e} (not retried)")
+                    return None
+                if status == 429:
+                    self.stats.add('rate_limited')
+                    self.rate_limiter.on_throttled()
+                else:
+                    self.stats.add('server_errors')
+                retry_after = parse_retry_after(e.response.headers.get('Retry-After'))
+                error = e
+            except (requests.RequestException, ValueError) as e:
+                self.stats.add('transport_errors')
+                get_metrics().record_request(url, None, time.perf_counter() - start)
+                error = e
+
+            if self.seconds_left() < MIN_REQUEST_SECONDS:
+                # Most likely a timeout cut short by the deadline
+                self.stats.add('deadline_exceeded')
+                raise DeadlineExceeded(url, self.seconds_left()) from error
+            if attempt == retry_count - 1:
+                self.stats.add('failures')
+                print(f"  Failed to fetch: {url}")
+                print(f"  Error: {error}")
+                return None
+
+            delay = backoff.next()
+            if retry_after is not None:
+                self.stats.add('retry_after_honored')
+                delay = max(delay, retry_after)
+            if delay + MIN_REQUEST_SECONDS > self.seconds_left():
+                # The retry could not finish in time; fail now rather than sleep into the deadline
+                self.stats.add('deadline_exceeded')
+                raise DeadlineExceeded(url, self.seconds_left()) from error
+            self.stats.add('retries')
+            self.stats.add('backoff_seconds', delay)
+            get_metrics().record_retry(url)
+            print(f"  Retry {attempt + 1}/{retry_count} for {url} in {delay:.1f}s")
+            time.sleep(delay)
+        return None
+
+    def fetch_json(self, url: str, retry_count: int = 3):
+        """
+        Fetch a JSON document with retry logic.
+        When a persistent response cache is attached, fresh entries are served
+        without a request and stale ones are revalidated with a conditional GET.
+
+        Returns:
+            Decoded JSON, or None if every attempt failed
+        """
+        cache = self.response_cache
+        if cache and not cache.is_cacheable(url):
+            cache = None
+        entry = cache.lookup(url) if cache else None
+        if entry is not None and cache.is_fresh(entry):
+            get_metrics().record_cache_hit(url, 'persistent')
+            return json.loads(entry.body)
+
+        def handle(response):
+            if response.status_code == 304 and entry is not None:
+                get_metrics().record_cache_hit(url, 'revalidated')
+                cache.touch(url, entry)
+                return json.loads(entry.body)
+            data = response.json()
+            if cache:
+                cache.store(url, response.content, response.headers)
+            return data
+
+        return self._request(url, handle, retry_count,
+                             headers=entry.validators() if entry else None)
+
+    def fetch_streamed(self, url: str, consume: Callable[[Iterable[bytes]], T],
+                       retry_count: int = 3) -> Optional[T]:
+        """
+        Stream a response body into consume() instead of decoding it whole.
+        The body is handed over as decompressed chunks; on failure the whole
+        download is retried.
+
+        Returns:
+            Whatever consume() returns, or None if every attempt failed
+        """
+        return self._request(
+            url, lambda response: consume(
+                self._until_deadline(url, response.iter_content(STREAM_CHUNK_SIZE))),
+            retry_count, stream=True
+        )
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+
+class RequestCache:
+    """
+    Request-scoped response cache keyed by URL, with single-flight coalescing.
+
+    The first caller for a URL performs the fetch; concurrent callers for the
+    same URL wait on that in-flight request instead of issuing their own.
+    Failed fetches (None) are not cached so a later caller can try again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._responses: Dict[str, object] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get_or_fetch(self, url: str, fetch: Callable[[str], object]):
+        """Return the cached response for url, fetching it at most once."""
+        with self._lock:
+            if url in self._responses:
+                self.hits += 1
+                get_metrics().record_cache_hit(url, 'request')
+                return self._responses[url]
+            future = self._in_flight.get(url)
+            is_owner = future is None
+            if is_owner:
+                self.misses += 1
+                future = self._in_flight[url] = Future()
+            else:
+                self.coalesced += 1
+                get_metrics().record_cache_hit(url, 'request')
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fetch(url)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[url]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if result is not None:
+                self._responses[url] = result
+            del self._in_flight[url]
+        future.set_result(result)
+        return result
+
+    def evict(self, url_fragments: Iterable[str]):
+        """Drop cached responses whose URL contains any of the fragments."""
+        fragments = list(url_fragments)
+        with self._lock:
+            for url in [u for u in self._responses if any(f in u for f in fragments)]:
+                del self._responses[url]
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for reporting."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'entries': len(self._responses),
+            }
+
+
+_client: Optional[SleeperClient] = None
+_cassette: Optional[Cassette] = None
+_request_cache = RequestCache()
+
+
+def get_client() -> SleeperClient:
+    """Get the shared client, creating it on first use (reused across warm invocations)."""
+    global _client
+    if _client is None:
+        _client = SleeperClient()
+        if CASSETTE_PATH:
+            use_cassette(CASSETTE_PATH, CASSETTE_MODE, CASSETTE_LATENCY)
+    return _client
+
+
+def configure_client(**kwargs) -> SleeperClient:
+    """
+    Replace the shared client with one built from the given options.
+
+    Args:
+        **kwargs: Passed through to SleeperClient (timeouts, pool size, rate limit, backoff)
+
+    Returns:
+        The new shared client
+    """
+    global _client
+    response_cache = deadline = None
+    if _client is not None:
+        response_cache, deadline = _client.response_cache, _client.deadline
+        _client.close()
+    _client = SleeperClient(**kwargs)
+    _client.response_cache = response_cache
+    _client.deadline = deadline
+    if _cassette is not None:
+        _client.mount(CassetteAdapter(_cassette, _cassette_mode, _cassette_latency,
+                                      pool_maxsize=_client.pool_size, pool_block=True))
+    return _client
+
+
+_cassette_mode = REPLAY
+_cassette_latency = '0'
+
+
+def use_cassette(path: str, mode: str = REPLAY, latency='0') -> Cassette:
+    """
+    Record Sleeper responses to, or replay them from, a cassette file.
+
+    Args:
+        path: Cassette file (gzipped JSON)
+        mode: 'record' or 'replay'
+        latency: Replay delay per request in seconds, or 'recorded'
+
+    Returns:
+        The active cassette
+    """
+    global _cassette, _cassette_mode, _cassette_latency
+    cassette = Cassette(path)
+    if mode == REPLAY:
+        cassette.load()
+    _cassette, _cassette_mode, _cassette_latency = cassette, mode, latency
+    client = get_client()
+    client.mount(CassetteAdapter(cassette, mode, latency,
+                                 pool_maxsize=client.pool_size, pool_block=True))
+    print(f"Sleeper cassette: {mode} {path} ({len(cassette.entries)} responses)")
+    return cassette
+
+
+def save_cassette():
+    """Write the active cassette to disk if it is recording."""
+    if _cassette is not None and _cassette_mode != REPLAY:
+        _cassette.save()
+        print(f"Sleeper cassette: saved {len(_cassette.entries)} responses to {_cassette.path}")
+
+
+def get_throttle_stats() -> Dict[str, float]:
+    """Rate limiting / retry counters of the shared client."""
+    return get_client().stats.snapshot()
+
+
+def reset_throttle_stats():
+    """Zero the shared client's rate limiting / retry counters."""
+    get_client().stats.reset()
+
+
+def configure_response_cache(cache: Optional[ResponseCache]):
+    """Attach (or with None, detach) a persistent response cache to the shared client."""
+    get_client().response_cache = cache
+
+
+def configure_deadline(deadline: Optional[TimeBudget]):
+    """Bound every Sleeper request by an invocation deadline (None: no deadline)."""
+    get_client().deadline = deadline
+
+
+def reset_request_cache():
+    """Start a fresh request-scoped cache (call once per invocation)."""
+    global _request_cache
+    _request_cache = RequestCache()
+
+
+def evict_cached_responses(url_fragments: Iterable[str]):
+    """Release cached responses that will not be requested again this invocation."""
+    _request_cache.evict(url_fragments)
+
+
+def get_request_cache_stats() -> Dict[str, int]:
+    """Hit/miss counts for the current invocation's request cache."""
+    return _request_cache.stats()
 
 
 def fetch_data(url: str, retry_count: int = 3) -> Optional[Dict]:
     """
     Fetch data from Sleeper API with retry logic.
-    
+    Responses are memoized per invocation, so each URL is requested at most once.
+
     Args:
         url: The API endpoint URL
         retry_count: Number of retry attempts
-        
+
     Returns:
         JSON response as dict, or None if failed
+
+    Raises:
+        DeadlineExceeded: The invocation deadline is too close to fetch it
     """
-    for attempt in range(retry_count):
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            if attempt < retry_count - 1:
-                print(f"  Retry {attempt + 1}/{retry_count} for {url}")
-                time.sleep(1)
-            else:
-                print(f"  Failed to fetch: {url}")
-                print(f"  Error: {e}")
-                return None
+    client = get_client()
+    return _request_cache.get_or_fetch(url, lambda u: client.fetch_json(u, retry_count))
+
+
+async def _fetch_all_async(urls: List[str], concurrency: int) -> List:
+    """Run fetch_data for every URL with at most `concurrency` in flight."""
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def fetch_one(url):
+            async with semaphore:
+                return await loop.run_in_executor(executor, fetch_data, url)
+
+        return await asyncio.gather(*(fetch_one(url) for url in urls))
+
+
+def fetch_many(urls: Iterable[str], concurrency: int = MAX_CONCURRENCY) -> Dict[str, Optional[Dict]]:
+    """
+    Fetch many URLs concurrently over the shared pooled client.
+
+    requests is blocking, so an asyncio loop schedules the calls onto a
+    bounded worker pool; the client's per-host pool caps open connections.
+
+    Args:
+        urls: API endpoint URLs (duplicates are fetched once)
+        concurrency: Max requests in flight at once
+
+    Returns:
+        Dictionary of url -> JSON response (None for failed requests)
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    get_client()  # create the shared client before the workers race for it
+    results = asyncio.run(_fetch_all_async(unique_urls, max(1, concurrency)))
+    return dict(zip(unique_urls, results))
 
 
 def get_league_rosters(league_id: str) -> List[Dict]:
     """Get all rosters in a league."""
-    url = f'https://api.sleeper.app/v1/league/{league_id}/rosters'
+    url = f'{API_BASE}/league/{league_id}/rosters'
     return fetch_data(url) or []
 
 
 def get_league_users(league_id: str) -> List[Dict]:
     """Get all users in a league."""
-    url = f'https://api.sleeper.app/v1/league/{league_id}/users'
+    url = f'{API_BASE}/league/{league_id}/users'
     return fetch_data(url) or []
 
 
+def _matchups_url(league_id: str, week: int) -> str:
+    return f'{API_BASE}/league/{league_id}/matchups/{week}'
+
+
 def get_matchups(league_id: str, week: int) -> List[Dict]:
     """Get matchups for a specific week."""
-    url = f'https://api.sleeper.app/v1/league/{league_id}/matchups/{week}'
-    return fetch_data(url) or []
+    return fetch_data(_matchups_url(league_id, week)) or []
+
+
+def _bracket_url(league_id: str) -> str:
+    return f'{API_BASE}/league/{league_id}/winners_bracket'
 
 
 def get_playoff_bracket(league_id: str) -> List[Dict]:
     """Get the winners bracket for playoffs."""
-    url = f'https://api.sleeper.app/v1/league/{league_id}/winners_bracket'
-    return fetch_data(url) or []
+    return fetch_data(_bracket_url(league_id)) or []
 
 
 def get_all_players() -> Dict[str, Dict]:
     """
     Get all NFL players from Sleeper.
     This is a large (~5MB) response, so use sparingly.
-    
+
     Returns:
         Dictionary of player_id -> player_info
     """
     print("  Fetching player database (~5MB, this may take a moment)...")
-    url = 'https://api.sleeper.app/v1/players/nfl'
+    url = f'{API_BASE}/players/nfl'
     players = fetch_data(url)
-    
+
     if players:
         print(f"  Loaded {len(players)} players")
     return players or {}
 
 
+def stream_all_players(consume: Callable[[Iterable[bytes]], T]) -> Optional[T]:
+    """
+    Stream the /players/nfl body into consume() (see utils.streaming) so the
+    ~5MB payload never has to exist as one nested dict.
+
+    Returns:
+        consume()'s result, or None if the download failed
+    """
+    print("  Streaming player database (~5MB)...")
+    return get_client().fetch_streamed(f'{API_BASE}/players/nfl', consume)
+
+
 def get_weekly_stats(year: int, week: int) -> Dict[str, Dict]:
     """
     Get weekly stats for all players.
-    
+
     Args:
         year: Season year
         week: Week number
-        
+
     Returns:
         Dictionary of player_id -> stats
     """
-    url = f"https://api.sleeper.com/stats/nfl/{year}/{week}?season_type=regular"
-    stats = fetch_data(url)
-    
+    return _parse_stats(fetch_data(_weekly_stats_url(year, week)))
+
+
+def get_weekly_stats_by_week(year: int, weeks: Iterable[int]) -> Dict[int, Dict[str, Dict]]:
+    """
+    Get weekly stats for several weeks of a season concurrently.
+
+    Returns:
+        Dictionary of week -> (player_id -> stats)
+    """
+    urls = {week: _weekly_stats_url(year, week) for week in weeks}
+    responses = fetch_many(urls.values())
+    return {week: _parse_stats(responses.get(url)) for week, url in urls.items()}
+
+
+def _weekly_stats_url(year: int, week: int) -> str:
+    return f"{STATS_BASE}/stats/nfl/{year}/{week}?season_type=regular"
+
+
+def get_season_stats(year: int) -> Dict[str, Dict]:
+    """
+    Get regular-season aggregate stats for all players in one request.
+
+    Args:
+        year: Season year
+
+    Returns:
+        Dictionary of player_id -> season stats (includes 'gp', games played)
+    """
+    return _parse_stats(fetch_data(f"{STATS_BASE}/stats/nfl/{year}?season_type=regular"))
+
+
+def regular_season_weeks(year: int) -> range:
+    """NFL regular-season weeks: 17 through 2020, 18 from 2021 on."""
+    return range(1, 18 if year <= 2020 else 19)
+
+
+def _parse_stats(stats) -> Dict[str, Dict]:
     # The API returns a list, convert to dict keyed by player_id
     if isinstance(stats, list):
         stats_dict = {}
@@ -105,5 +655,5 @@ def get_weekly_stats(year: int, week: int) -> Dict[str, Dict]:
 
 def get_nfl_state() -> Dict:
     """Get current NFL season state."""
-    url = 'https://api.sleeper.app/v1/state/nfl'
+    url = f'{API_BASE}/state/nfl'
     return fetch_data(url) or {}
@@ -0,0 +1,193 @@
+"""
+Persistent Sleeper response cache
+Stores raw API responses across invocations so finished seasons are only
+ever downloaded once. Backends: local directory, Lambda /tmp, S3 prefix.
+"""
+
+import gzip
+import json
+import os
+import re
+import time
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+
+class CacheBackend:
+    """Minimal key -> bytes store used by the response cache."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def put(self, key: str, data: bytes):
+        raise NotImplementedError
+
+
+class LocalDirBackend(CacheBackend):
+    """Store entries as files under a local directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class TmpBackend(LocalDirBackend):
+    """Lambda /tmp storage; survives only as long as the warm container."""
+
+    def __init__(self, root: str = '/tmp/sleeper-cache'):
+        super().__init__(root)
+
+
+class S3Backend(CacheBackend):
+    """Store entries under a prefix in an S3 bucket (e.g. the lake bucket)."""
+
+    def __init__(self, s3_client, bucket: str, prefix: str = 'cache/sleeper/'):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            obj = self.s3_client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        except self.s3_client.exceptions.NoSuchKey:
+            return None
+        return obj['Body'].read()
+
+    def put(self, key: str, data: bytes):
+        self.s3_client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+
+class CacheEntry:
+    """A stored response: validators, fetch time and the raw body."""
+
+    def __init__(self, url: str, body: bytes, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None, fetched_at: Optional[float] = None,
+                 immutable: bool = False):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.immutable = immutable
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional-GET headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def serialize(self) -> bytes:
+        header = json.dumps({
+            'url': self.url,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'fetched_at': self.fetched_at,
+            'immutable': self.immutable,
+        }).encode()
+        return gzip.compress(header + b'\n' + self.body, compresslevel=6)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'CacheEntry':
+        header, body = gzip.decompress(data).split(b'\n', 1)
+        meta = json.loads(header)
+        return cls(meta['url'], body, meta.get('etag'), meta.get('last_modified'),
+                   meta.get('fetched_at'), meta.get('immutable', False))
+
+
+_STATS_YEAR = re.compile(r'/stats/nfl/(\d{4})(?:/|$|\?)')
+_LEAGUE_ID = re.compile(r'/league/([^/]+)/')
+_NFL_STATE = re.compile(r'/state/nfl(?:$|\?)')
+
+
+class ResponseCache:
+    """
+    Persistent response cache with a per-URL freshness policy.
+
+    - Stats for seasons before current_year and any endpoint of a league in
+      frozen_league_ids are immutable: served from cache, never revalidated.
+    - The NFL state changes as games finish and is never stored.
+    - Everything else is fresh for ttl_seconds, then revalidated with
+      If-None-Match / If-Modified-Since when the stored response had an
+      ETag / Last-Modified, or simply refetched when it did not.
+    """
+
+    def __init__(self, backend: CacheBackend, current_year: int,
+                 frozen_league_ids: Iterable[str] = (), ttl_seconds: float = 3600):
+        self.backend = backend
+        self.current_year = current_year
+        self.frozen_league_ids = {str(league_id) for league_id in frozen_league_ids}
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def is_cacheable(url: str) -> bool:
+        return not _NFL_STATE.search(url)
+
+    def is_immutable(self, url: str) -> bool:
+        stats_year = _STATS_YEAR.search(url)
+        if stats_year:
+            return int(stats_year.group(1)) < self.current_year
+        league = _LEAGUE_ID.search(url)
+        return bool(league) and league.group(1) in self.frozen_league_ids
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        if entry.immutable or self.is_immutable(entry.url):
+            return True
+        return time.time() - entry.fetched_at < self.ttl_seconds
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        parts = urlsplit(url)
+        key = f"{parts.netloc}{parts.path}"
+        if parts.query:
+            key += '__' + re.sub(r'[^A-Za-z0-9_.=-]', '_', parts.query)
+        return key.replace(':', '_') + '.json.gz'
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Stored entry for url, or None (the cache is best-effort; errors are a miss)."""
+        try:
+            data = self.backend.get(self.key_for(url))
+            return CacheEntry.deserialize(data) if data is not None else None
+        except Exception as e:
+            print(f"  WARNING: Response cache read failed for {url}: {e}")
+            return None
+
+    def store(self, url: str, body: bytes, headers):
+        """Persist a fresh 200 response along with its validators."""
+        entry = CacheEntry(
+            url, body,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            immutable=self.is_immutable(url),
+        )
+        self._put(entry)
+
+    def touch(self, url: str, entry: CacheEntry):
+        """Record a successful revalidation (304) so the TTL restarts."""
+        entry.fetched_at = time.time()
+        self._put(entry)
+
+    def _put(self, entry: CacheEntry):
+        try:
+            self.backend.put(self.key_for(entry.url), entry.serialize())
+        except Exception as e:
+            print(f"  WARNING: Response cache write failed for {entry.url}: {e}")
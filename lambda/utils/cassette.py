@@ -0,0 +1,114 @@
+"""
+Record/replay cassettes for the Sleeper API
+A requests transport adapter that records every response (URL, status,
+headers, still-compressed body, elapsed time) to a cassette file, or serves
+them back from that file with no network access.
+
+Replay runs should disable the persistent response cache (RESPONSE_CACHE=none)
+so every request reaches the cassette.
+"""
+
+import base64
+import gzip
+import io
+import json
+import threading
+import time
+from typing import Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+class Cassette:
+    """URL -> recorded response, persisted as gzipped JSON sorted by URL."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> 'Cassette':
+        with gzip.open(self.path, 'rt') as f:
+            self.entries = {entry['url']: entry for entry in json.load(f)}
+        return self
+
+    def save(self):
+        with self._lock:
+            entries = [self.entries[url] for url in sorted(self.entries)]
+        # mtime=0 keeps the file byte-identical for identical recordings
+        with open(self.path, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+            f.write(json.dumps(entries, indent=1).encode())
+
+    def record(self, url: str, status: int, headers: Dict[str, str], body: bytes, elapsed: float):
+        # A 304 carries no body; keep the full response recorded earlier
+        if status == 304 and url in self.entries:
+            return
+        with self._lock:
+            self.entries[url] = {
+                'url': url,
+                'status': status,
+                'headers': headers,
+                'body': base64.b64encode(body).decode('ascii'),
+                'elapsed': round(elapsed, 4),
+            }
+
+    def get(self, url: str) -> Optional[Dict]:
+        return self.entries.get(url)
+
+
+class CassetteAdapter(HTTPAdapter):
+    """
+    Transport adapter for record or replay mode.
+
+    Args:
+        cassette: Where responses are recorded to / replayed from
+        mode: 'record' (hit the network and capture) or 'replay' (no network)
+        latency: Replay delay per request in seconds, or 'recorded' to
+            reproduce the latency seen while recording
+    """
+
+    def __init__(self, cassette: Cassette, mode: str = REPLAY, latency='0', **kwargs):
+        super().__init__(**kwargs)
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.mode == REPLAY:
+            return self._replay(request)
+
+        start = time.perf_counter()
+        response = super().send(request, stream=True, timeout=timeout, verify=verify,
+                                cert=cert, proxies=proxies)
+        body = response.raw.read(decode_content=False)
+        elapsed = time.perf_counter() - start
+        headers = {k: v for k, v in response.headers.items() if k.lower() != 'transfer-encoding'}
+        self.cassette.record(request.url, response.status_code, headers, body, elapsed)
+        response.close()
+        return self._build(request, response.status_code, headers, body)
+
+    def _replay(self, request):
+        entry = self.cassette.get(request.url)
+        if entry is None:
+            return self._build(request, 404, {'X-Cassette': 'miss'}, b'')
+        if self.latency == 'recorded':
+            time.sleep(entry['elapsed'])
+        elif float(self.latency):
+            time.sleep(float(self.latency))
+        return self._build(request, entry['status'], entry['headers'],
+                           base64.b64decode(entry['body']))
+
+    def _build(self, request, status: int, headers: Dict[str, str], body: bytes):
+        """Wrap a (possibly compressed) body so requests decodes it like a live response."""
+        raw = HTTPResponse(
+            body=io.BytesIO(body), headers=headers, status=status,
+            preload_content=False, decode_content=True,
+        )
+        return self.build_response(request, raw)
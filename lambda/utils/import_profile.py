@@ -0,0 +1,145 @@
+"""
+Import-time profiling for cold starts
+Times every module import while enabled, like python -X importtime, and
+prints the slowest top-level packages and modules. Started before
+lambda_function imports anything else, it shows what the init phase
+spends its time on, and which deferred imports land in the first
+invocation.
+
+Only module execution is timed (not the search for the module file).
+This module imports nothing outside the standard library, so enabling
+it adds no imports of its own.
+"""
+
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class _TimedLoader:
+    """Wraps a module's loader for the duration of its import, timing exec_module()."""
+
+    def __init__(self, loader, profiler: 'ImportProfiler'):
+        self.loader = loader
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self.loader, 'create_module', None)
+        return create_module(spec) if create_module is not None else None
+
+    def exec_module(self, module):
+        try:
+            self.profiler.time(module.__name__, self.loader.exec_module, module)
+        finally:
+            # Leave nothing of the profiler behind on the imported module
+            module.__loader__ = self.loader
+            if getattr(module, '__spec__', None) is not None:
+                module.__spec__.loader = self.loader
+
+
+class ImportProfiler:
+    """
+    Meta path hook recording (module, self seconds, cumulative seconds).
+
+    Self time excludes the imports a module triggers; cumulative includes them.
+    """
+
+    def __init__(self):
+        self.records: List[Dict] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        if getattr(self._local, 'finding', False):
+            return None
+        self._local.finding = True
+        try:
+            spec = self._find_spec(name, path, target)
+        finally:
+            self._local.finding = False
+        if spec is not None and spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def _find_spec(self, name, path, target):
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, 'find_spec', None) if finder is not self else None
+            if find_spec is not None:
+                spec = find_spec(name, path, target)
+                if spec is not None:
+                    return spec
+        return None
+
+    def time(self, name: str, exec_module, module):
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            with self._lock:
+                self.records.append({'module': name, 'self': cumulative - children,
+                                     'cumulative': cumulative, 'depth': len(stack)})
+
+    def take(self) -> List[Dict]:
+        """Records since the last call."""
+        with self._lock:
+            records, self.records = self.records, []
+        return records
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def start():
+    """Time every import from now on."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler()
+        sys.meta_path.insert(0, _profiler)
+
+
+def stop():
+    global _profiler
+    if _profiler is not None:
+        sys.meta_path.remove(_profiler)
+        _profiler = None
+
+
+def report(title: str, limit: int = 15) -> Dict:
+    """
+    Print the imports recorded since the last report.
+
+    Args:
+        title: Heading for the printed breakdown
+        limit: Packages / modules listed
+
+    Returns:
+        {'seconds': total, 'modules': count, 'packages': top package -> seconds}
+    """
+    records = _profiler.take() if _profiler is not None else []
+    total = sum(record['cumulative'] for record in records if record['depth'] == 0)
+    packages: Dict[str, float] = {}
+    for record in records:
+        package = record['module'].split('.')[0]
+        packages[package] = packages.get(package, 0.0) + record['self']
+    packages = dict(sorted(packages.items(), key=lambda item: -item[1])[:limit])
+
+    print(f"{title}: {len(records)} modules in {total * 1000:.0f} ms")
+    if records:
+        print("  by package (self ms):  " + ", ".join(
+            f"{package} {seconds * 1000:.0f}" for package, seconds in packages.items()))
+        print(f"  {'cumulative ms':>13} {'self ms':>8}  module")
+        for record in sorted(records, key=lambda r: -r['cumulative'])[:limit]:
+            print(f"  {record['cumulative'] * 1000:13.1f} {record['self'] * 1000:8.1f}  "
+                  f"{'  ' * record['depth']}{record['module']}")
+    return {'seconds': round(total, 4), 'modules': len(records),
+            'packages': {package: round(seconds, 4) for package, seconds in packages.items()}}
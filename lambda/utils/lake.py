@@ -0,0 +1,137 @@
+"""
+Staging table layout in the lake
+Each table is partitioned by year. A full collection writes the whole
+season to year=YYYY/data.parquet; incremental runs add one
+year=YYYY/week-WW.parquet object per newly completed week alongside it,
+and rewrite the latest week object to pick up stat corrections.
+Both live in the same partition, so Athena and the crawler see one table.
+
+The watermark (last week written) of a partition is read back from those
+objects: week objects carry it in their key, data.parquet in its
+'last-week' metadata. Every object also records a SHA-256 of its
+content, so rewriting identical data can be skipped.
+"""
+
+import hashlib
+import io
+import re
+from typing import Dict, List, Optional
+
+
+DATA_OBJECT = 'data.parquet'
+LAST_WEEK_METADATA = 'last-week'
+CONTENT_HASH_METADATA = 'content-sha256'
+
+_WEEK_OBJECT = re.compile(r'week-(\d+)\.parquet$')
+
+
+def partition_prefix(table_name: str, year: int) -> str:
+    return f"staging/{table_name}/year={year}/"
+
+
+def data_key(table_name: str, year: int) -> str:
+    return partition_prefix(table_name, year) + DATA_OBJECT
+
+
+def week_key(table_name: str, year: int, week: int) -> str:
+    return partition_prefix(table_name, year) + f"week-{week:02d}.parquet"
+
+
+def content_hash(table) -> str:
+    """
+    SHA-256 of a table's schema and column values.
+
+    The Parquet body is not hashed: it embeds the writer version and the
+    pandas schema metadata. The table is hashed as one Arrow IPC record
+    batch without schema metadata instead.
+    """
+    import pyarrow as pa
+    digest = _DigestSink()
+    table = table.replace_schema_metadata(None).combine_chunks()
+    with pa.ipc.new_stream(digest, table.schema) as writer:
+        writer.write_table(table)
+    return digest.sha256.hexdigest()
+
+
+class _DigestSink:
+    """Write-only file object that hashes instead of storing."""
+
+    closed = False
+
+    def __init__(self):
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        return len(data)
+
+    def close(self):
+        self.closed = True
+
+
+def list_partition(s3_client, bucket: str, table_name: str, year: int) -> List[str]:
+    """Keys of every object in a table's year partition."""
+    keys = []
+    kwargs = {'Bucket': bucket, 'Prefix': partition_prefix(table_name, year)}
+    while True:
+        response = s3_client.list_objects_v2(**kwargs)
+        keys.extend(obj['Key'] for obj in response.get('Contents', []))
+        if not response.get('IsTruncated'):
+            return keys
+        kwargs['ContinuationToken'] = response['NextContinuationToken']
+
+
+def object_metadata(s3_client, bucket: str, key: str) -> Optional[Dict[str, str]]:
+    """User metadata of an object, or None if it does not exist."""
+    try:
+        return s3_client.head_object(Bucket=bucket, Key=key).get('Metadata', {})
+    except s3_client.exceptions.ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        raise
+
+
+def read_watermark(s3_client, bucket: str, table_name: str, year: int) -> int:
+    """
+    Last week written to a table's year partition (0 if nothing is there yet).
+
+    data.parquet written before watermarks were recorded carries no
+    'last-week' metadata; its week column is read instead.
+    """
+    keys = list_partition(s3_client, bucket, table_name, year)
+    weeks = [int(match.group(1)) for match in map(_WEEK_OBJECT.search, keys) if match]
+
+    if data_key(table_name, year) in keys:
+        weeks.append(_data_object_last_week(s3_client, bucket, data_key(table_name, year)))
+    return max(weeks, default=0)
+
+
+def _data_object_last_week(s3_client, bucket: str, key: str) -> int:
+    last_week = (object_metadata(s3_client, bucket, key) or {}).get(LAST_WEEK_METADATA)
+    if last_week is not None:
+        return int(last_week)
+    import pyarrow.parquet as pq  # only needed for files from before watermarks
+    body = s3_client.get_object(Bucket=bucket, Key=key)['Body'].read()
+    return _max_week(pq.read_table(io.BytesIO(body), columns=['week']))
+
+
+def _max_week(table) -> int:
+    import pyarrow.compute as pc
+    week = pc.max(table.column('week')).as_py()
+    return int(week) if week is not None else 0
+
+
+def delete_week_objects(s3_client, bucket: str, table_name: str, year: int,
+                        through_week: int) -> int:
+    """
+    Remove a partition's week objects once data.parquet covers those weeks.
+    Returns the number of objects deleted.
+    """
+    keys = list_partition(s3_client, bucket, table_name, year)
+    stale = [key for key, match in zip(keys, map(_WEEK_OBJECT.search, keys))
+             if match and int(match.group(1)) <= through_week]
+    # delete_objects takes at most 1000 keys per call
+    for i in range(0, len(stale), 1000):
+        s3_client.delete_objects(Bucket=bucket, Delete={
+            'Objects': [{'Key': key} for key in stale[i:i + 1000]], 'Quiet': True})
+    return len(stale)
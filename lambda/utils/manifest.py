@@ -0,0 +1,73 @@
+"""
+Backfill progress manifest
+Records which (year, table) units a historical backfill has finished, in a
+small JSON object in the lake bucket, so a run cut short by the Lambda
+timeout (or a failed season) can resume without redoing finished work.
+"""
+
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from utils.cache import CacheBackend
+
+
+MANIFEST_KEY = 'backfill_manifest.json'
+
+
+class BackfillManifest:
+    """
+    Completed (year, table) units, persisted after every change.
+
+    A unit only counts as complete for the league it was collected from, so
+    changing a season's league ID makes it run again. Thread-safe; seasons
+    collected in parallel share one manifest.
+    """
+
+    def __init__(self, backend: CacheBackend, key: str = MANIFEST_KEY):
+        self.backend = backend
+        self.key = key
+        self._units: Dict[str, Dict[str, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> 'BackfillManifest':
+        data = self.backend.get(self.key)
+        with self._lock:
+            self._units = json.loads(data)['completed'] if data else {}
+        return self
+
+    def reset(self):
+        """Forget all progress."""
+        with self._lock:
+            self._units = {}
+            self._save()
+
+    def is_complete(self, year: int, table_name: str, league_id: str) -> bool:
+        return self.rows(year, table_name, league_id) is not None
+
+    def rows(self, year: int, table_name: str, league_id: str) -> Optional[int]:
+        """Rows written by a completed unit, or None if it is not complete."""
+        with self._lock:
+            unit = self._units.get(str(year), {}).get(table_name)
+        if unit is None or unit['league_id'] != league_id:
+            return None
+        return unit['rows']
+
+    def mark_complete(self, year: int, table_name: str, league_id: str, rows: int):
+        with self._lock:
+            self._units.setdefault(str(year), {})[table_name] = {
+                'league_id': league_id,
+                'rows': rows,
+                'completed_at': datetime.utcnow().isoformat(),
+            }
+            self._save()
+
+    def completed(self) -> Dict[str, list]:
+        """year -> names of its completed tables."""
+        with self._lock:
+            return {year: sorted(tables) for year, tables in sorted(self._units.items())}
+
+    def _save(self):
+        # Called with the lock held so concurrent updates persist in order
+        self.backend.put(self.key, json.dumps({'completed': self._units}, indent=1, sort_keys=True).encode())
@@ -0,0 +1,181 @@
+"""
+HTTP instrumentation for Sleeper API calls
+Per-endpoint-template request metrics (count, latency percentiles, bytes,
+decode time, retries, cache hits), reported in the handler response and
+emitted as CloudWatch Embedded Metric Format (EMF) log lines.
+"""
+
+import json
+import re
+import threading
+import time
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+
+NAMESPACE = 'SleeperIngest'
+
+# EMF accepts at most 100 values per metric in one log line
+EMF_MAX_VALUES = 100
+
+_TEMPLATES = [
+    (re.compile(r'^/league/[^/]+/matchups/\d+$'), '/league/{id}/matchups/{week}'),
+    (re.compile(r'^/league/[^/]+/([a-z_]+)$'), r'/league/{id}/\1'),
+    (re.compile(r'^/stats/nfl/\d+/\d+$'), '/stats/nfl/{year}/{week}'),
+    (re.compile(r'^/stats/nfl/\d+$'), '/stats/nfl/{year}'),
+]
+
+
+def endpoint_template(url: str) -> str:
+    """Collapse a concrete Sleeper URL to its endpoint template, e.g. /league/{id}/matchups/{week}."""
+    path = urlsplit(url).path
+    if path.startswith('/v1/'):
+        path = path[3:]
+    for pattern, template in _TEMPLATES:
+        if pattern.match(path):
+            return pattern.sub(template, path)
+    return re.sub(r'/\d+(?=/|$)', '/{n}', path)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class EndpointMetrics:
+    """Counters and latency samples for one endpoint template."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.cache_hits: Dict[str, int] = {}
+        self.bytes = 0
+        self.decode_seconds = 0.0
+        self.latencies_ms: List[float] = []
+        self.status_codes: Dict[str, int] = {}
+
+    def summary(self) -> Dict:
+        latencies = sorted(self.latencies_ms)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'cache_hits': dict(self.cache_hits),
+            'bytes': self.bytes,
+            'decode_ms': round(self.decode_seconds * 1000, 1),
+            'latency_ms': {
+                'p50': round(_percentile(latencies, 50), 1),
+                'p95': round(_percentile(latencies, 95), 1),
+                'p99': round(_percentile(latencies, 99), 1),
+                'max': round(latencies[-1], 1) if latencies else 0.0,
+                'total': round(sum(latencies), 1),
+            },
+            'status_codes': dict(self.status_codes),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe per-endpoint-template metrics for one invocation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+
+    def _get(self, url: str) -> EndpointMetrics:
+        template = endpoint_template(url)
+        endpoint = self._endpoints.get(template)
+        if endpoint is None:
+            endpoint = self._endpoints[template] = EndpointMetrics()
+        return endpoint
+
+    def record_request(self, url: str, status, latency_seconds: float,
+                       num_bytes: int = 0, decode_seconds: float = 0.0):
+        """One HTTP attempt; status is the HTTP code, or None for transport errors."""
+        with self._lock:
+            endpoint = self._get(url)
+            endpoint.requests += 1
+            endpoint.latencies_ms.append(latency_seconds * 1000)
+            endpoint.bytes += num_bytes
+            endpoint.decode_seconds += decode_seconds
+            key = str(status) if status is not None else 'error'
+            endpoint.status_codes[key] = endpoint.status_codes.get(key, 0) + 1
+            if status is None or status >= 400:
+                endpoint.errors += 1
+
+    def record_retry(self, url: str):
+        with self._lock:
+            self._get(url).retries += 1
+
+    def record_cache_hit(self, url: str, layer: str):
+        """A response served without a full download ('request', 'persistent', 'revalidated')."""
+        with self._lock:
+            hits = self._get(url).cache_hits
+            hits[layer] = hits.get(layer, 0) + 1
+
+    def summary(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {template: endpoint.summary()
+                    for template, endpoint in sorted(self._endpoints.items())}
+
+    def emf_lines(self, namespace: str = NAMESPACE) -> List[str]:
+        """One or more EMF JSON log lines per endpoint template."""
+        timestamp = int(time.time() * 1000)
+        lines = []
+        with self._lock:
+            endpoints = list(self._endpoints.items())
+            for template, endpoint in endpoints:
+                latencies = [round(v, 1) for v in endpoint.latencies_ms] or [0.0]
+                chunks = [latencies[i:i + EMF_MAX_VALUES]
+                          for i in range(0, len(latencies), EMF_MAX_VALUES)]
+                for i, chunk in enumerate(chunks):
+                    metrics = [{'Name': 'Latency', 'Unit': 'Milliseconds'}]
+                    record = {'Endpoint': template, 'Latency': chunk}
+                    if i == 0:
+                        metrics += [
+                            {'Name': 'Requests', 'Unit': 'Count'},
+                            {'Name': 'Errors', 'Unit': 'Count'},
+                            {'Name': 'Retries', 'Unit': 'Count'},
+                            {'Name': 'CacheHits', 'Unit': 'Count'},
+                            {'Name': 'BytesDownloaded', 'Unit': 'Bytes'},
+                            {'Name': 'DecodeTime', 'Unit': 'Milliseconds'},
+                        ]
+                        record.update({
+                            'Requests': endpoint.requests,
+                            'Errors': endpoint.errors,
+                            'Retries': endpoint.retries,
+                            'CacheHits': sum(endpoint.cache_hits.values()),
+                            'BytesDownloaded': endpoint.bytes,
+                            'DecodeTime': round(endpoint.decode_seconds * 1000, 1),
+                        })
+                    record['_aws'] = {
+                        'Timestamp': timestamp,
+                        'CloudWatchMetrics': [{
+                            'Namespace': namespace,
+                            'Dimensions': [['Endpoint']],
+                            'Metrics': metrics,
+                        }],
+                    }
+                    lines.append(json.dumps(record))
+        return lines
+
+
+metrics = MetricsRegistry()
+
+
+def reset_metrics():
+    """Start a fresh registry (call once per invocation)."""
+    global metrics
+    metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    return metrics
+
+
+def emit_emf(namespace: str = NAMESPACE):
+    """Print the current metrics as EMF lines; Lambda ships stdout to CloudWatch Logs."""
+    for line in metrics.emf_lines(namespace):
+        print(line)
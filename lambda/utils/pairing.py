@@ -0,0 +1,53 @@
+"""
+Opponent pairing
+Vectorized head-to-head pairing shared by the regular-season and playoff
+matchup collectors: teams with the same (week, matchup_id) face each other.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Sequence
+
+
+def pair_opponents(df: pd.DataFrame, id_col: str, points_col: str,
+                   opponent_id_col: str = 'opponent_team_id',
+                   opponent_points_col: str = 'opponent_points',
+                   keys: Sequence[str] = ('week', 'matchup_id')) -> pd.DataFrame:
+    """
+    Add each team's opponent id and points.
+
+    Rows are self-merged on keys with the self match excluded. Only groups
+    of exactly two teams are paired; byes, 1-team groups, groups of three
+    or more and rows with a null key get null opponent columns.
+
+    Args:
+        df: One row per team per matchup
+        id_col: Team identifier column copied into opponent_id_col
+        points_col: Points column copied into opponent_points_col
+        opponent_id_col: Name of the opponent id column to add
+        opponent_points_col: Name of the opponent points column to add
+        keys: Columns that identify a head-to-head matchup
+
+    Returns:
+        A copy of df, in the same order, with the two opponent columns
+    """
+    keys = list(keys)
+    teams = df[keys + [id_col, points_col]].copy()
+    teams['_row'] = np.arange(len(df))
+    teams = teams.dropna(subset=keys)
+
+    pairs = teams.merge(teams, on=keys, suffixes=('', '_opp'))
+    pairs = pairs[pairs['_row'] != pairs['_row_opp']]
+    # Exactly one other team in the group means a head-to-head pair
+    pairs = pairs[pairs.groupby('_row')['_row'].transform('size') == 1]
+
+    rows = pairs['_row'].to_numpy()
+    opponent_ids = np.full(len(df), None, dtype=object)
+    opponent_ids[rows] = pairs[f'{id_col}_opp'].to_numpy(dtype=object)
+    opponent_points = np.full(len(df), np.nan)
+    opponent_points[rows] = pairs[f'{points_col}_opp'].to_numpy(dtype='float64')
+
+    result = df.copy()
+    result[opponent_id_col] = opponent_ids
+    result[opponent_points_col] = opponent_points
+    return result
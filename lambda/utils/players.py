@@ -0,0 +1,173 @@
+"""
+Player directory
+Compact player_id -> (name, position, team) lookup projected from the
+~5MB /players/nfl payload. Refreshed at most once a day and persisted as a
+small Parquet artifact so neither cold nor warm runs repeat the download.
+"""
+
+import io
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.api import stream_all_players
+from utils.cache import CacheBackend, TmpBackend
+from utils.streaming import iter_object_items
+
+
+DIRECTORY_KEY = 'player_directory.parquet'
+DIRECTORY_MAX_AGE = 24 * 60 * 60
+
+PlayerRecord = Tuple[str, Optional[str], Optional[str]]
+
+
+class PlayerDirectory:
+    """
+    Player metadata needed by the collectors, stored column-wise.
+    Rows hold (player_name, position, nfl_team) exactly as the collectors
+    render them, so per-row lookups need no string formatting.
+    """
+
+    def __init__(self, player_ids: List[str], names: List[str],
+                 positions: List[Optional[str]], teams: List[Optional[str]],
+                 built_at: Optional[float] = None):
+        self.player_ids = player_ids
+        self.names = names
+        self.positions = positions
+        self.teams = teams
+        self.built_at = built_at if built_at is not None else time.time()
+        self._index = {player_id: row for row, player_id in enumerate(player_ids)}
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[str, Dict]]) -> 'PlayerDirectory':
+        """Project (player_id, player_info) pairs down to the needed fields."""
+        player_ids, names, positions, teams = [], [], [], []
+        for player_id, info in items:
+            player_ids.append(player_id)
+            names.append(f"{info.get('first_name', '')} {info.get('last_name', '')}".strip() or player_id)
+            positions.append(info.get('position', 'Unknown'))
+            teams.append(info.get('team', 'FA'))
+        return cls(player_ids, names, positions, teams)
+
+    @classmethod
+    def from_players(cls, players: Dict[str, Dict]) -> 'PlayerDirectory':
+        """Project an already-decoded /players/nfl payload."""
+        return cls.from_items(players.items())
+
+    @classmethod
+    def from_stream(cls, chunks: Iterable[bytes]) -> 'PlayerDirectory':
+        """Project the /players/nfl body while it is being decoded, one player at a time."""
+        return cls.from_items(iter_object_items(chunks))
+
+    def lookup(self, player_id: str) -> PlayerRecord:
+        """(player_name, position, nfl_team); unknown players fall back to their ID."""
+        row = self._index.get(player_id)
+        if row is None:
+            return player_id, 'Unknown', 'FA'
+        return self.names[row], self.positions[row], self.teams[row]
+
+    def lookup_columns(self, player_ids: Sequence[str]) -> Tuple[List[str], List, List]:
+        """lookup() for many players at once, as (names, positions, teams) columns."""
+        rows = [self._index.get(player_id) for player_id in player_ids]
+        names, positions, teams = self.names, self.positions, self.teams
+        return (
+            [names[row] if row is not None else player_id for row, player_id in zip(rows, player_ids)],
+            [positions[row] if row is not None else 'Unknown' for row in rows],
+            [teams[row] if row is not None else 'FA' for row in rows],
+        )
+
+    def age(self) -> float:
+        return time.time() - self.built_at
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    def to_parquet(self) -> bytes:
+        table = pa.table({
+            'player_id': pa.array(self.player_ids, pa.string()),
+            'player_name': pa.array(self.names, pa.string()),
+            'position': pa.array(self.positions, pa.string()),
+            'nfl_team': pa.array(self.teams, pa.string()),
+        }).replace_schema_metadata({'built_at': str(self.built_at)})
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, compression='zstd')
+        return buffer.getvalue()
+
+    @classmethod
+    def from_parquet(cls, data: bytes) -> 'PlayerDirectory':
+        table = pq.read_table(io.BytesIO(data))
+        built_at = float(table.schema.metadata[b'built_at'])
+        columns = [table.column(name).to_pylist()
+                   for name in ('player_id', 'player_name', 'position', 'nfl_team')]
+        return cls(*columns, built_at=built_at)
+
+
+_backend: Optional[CacheBackend] = TmpBackend('/tmp/sleeper-cache/reference')
+_directory: Optional[PlayerDirectory] = None
+# Seasons collected in parallel wait for one load instead of each downloading
+_load_lock = threading.Lock()
+
+
+def configure_player_directory(backend: Optional[CacheBackend]):
+    """Set where the directory artifact is persisted (None keeps it in memory only)."""
+    global _backend
+    _backend = backend
+
+
+def get_player_directory(max_age: float = DIRECTORY_MAX_AGE) -> PlayerDirectory:
+    """
+    Get the player directory, downloading /players/nfl only if neither the
+    in-memory copy nor the persisted artifact is younger than max_age.
+    """
+    if _directory is not None and _directory.age() < max_age:
+        return _directory
+    with _load_lock:
+        if _directory is not None and _directory.age() < max_age:
+            return _directory
+        return _load_directory(max_age)
+
+
+def _load_directory(max_age: float) -> PlayerDirectory:
+    global _directory
+    stored = _load_stored()
+    if stored is not None and stored.age() < max_age:
+        print(f"  Loaded player directory ({len(stored)} players, "
+              f"{stored.age() / 3600:.1f}h old)")
+        _directory = stored
+        return _directory
+
+    downloaded = stream_all_players(PlayerDirectory.from_stream)
+    if downloaded is None:
+        if stored is not None:
+            print("  WARNING: Player download failed, using stale player directory")
+            _directory = stored
+            return _directory
+        return PlayerDirectory([], [], [], [])
+
+    print(f"  Loaded {len(downloaded)} players")
+    _directory = downloaded
+    _store(_directory)
+    return _directory
+
+
+def _load_stored() -> Optional[PlayerDirectory]:
+    if _backend is None:
+        return None
+    try:
+        data = _backend.get(DIRECTORY_KEY)
+        return PlayerDirectory.from_parquet(data) if data else None
+    except Exception as e:
+        print(f"  WARNING: Could not read player directory: {e}")
+        return None
+
+
+def _store(directory: PlayerDirectory):
+    if _backend is None or not len(directory):
+        return
+    try:
+        _backend.put(DIRECTORY_KEY, directory.to_parquet())
+    except Exception as e:
+        print(f"  WARNING: Could not persist player directory: {e}")
@@ -0,0 +1,92 @@
+"""
+Invocation time budget
+Tracks the time left before the Lambda deadline and estimates how long a
+unit of work (one season of a backfill) will take from earlier runs, so
+work is only started when it can finish before the invocation is killed.
+"""
+
+import json
+import math
+import threading
+from typing import Dict, Optional
+
+from utils.cache import CacheBackend
+
+
+COSTS_KEY = 'unit_costs.json'
+
+# Assumed seconds for a unit never seen before (a cold historical season)
+DEFAULT_UNIT_SECONDS = 120.0
+
+# Weight of the newest observation in a unit's running estimate
+SMOOTHING = 0.5
+
+
+class TimeBudget:
+    """
+    Remaining invocation time from the Lambda context.
+
+    Without a context (local runs) the budget is unlimited.
+
+    Args:
+        context: Lambda context (anything with get_remaining_time_in_millis())
+        margin: Seconds kept in reserve for writing results and re-invoking
+    """
+
+    def __init__(self, context=None, margin: float = 30.0):
+        self.context = context
+        self.margin = margin
+
+    def remaining(self) -> float:
+        """Seconds until the deadline."""
+        if self.context is None:
+            return math.inf
+        return self.context.get_remaining_time_in_millis() / 1000
+
+    def available(self) -> float:
+        """Seconds left for work, before the margin."""
+        return self.remaining() - self.margin
+
+    def allows(self, seconds: float) -> bool:
+        """Whether work expected to take this long can finish before the margin."""
+        return self.available() >= seconds
+
+
+class UnitCosts:
+    """
+    Observed seconds per work unit, smoothed across runs and persisted.
+
+    Units never seen before are estimated as the slowest known unit, or
+    DEFAULT_UNIT_SECONDS when nothing has been observed yet.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, key: str = COSTS_KEY):
+        self.backend = backend
+        self.key = key
+        self._seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> 'UnitCosts':
+        data = self.backend.get(self.key) if self.backend is not None else None
+        with self._lock:
+            self._seconds = json.loads(data) if data else {}
+        return self
+
+    def estimate(self, unit: str) -> float:
+        with self._lock:
+            if unit in self._seconds:
+                return self._seconds[unit]
+            return max(self._seconds.values(), default=DEFAULT_UNIT_SECONDS)
+
+    def record(self, unit: str, seconds: float):
+        with self._lock:
+            previous = self._seconds.get(unit)
+            self._seconds[unit] = (seconds if previous is None
+                                   else SMOOTHING * seconds + (1 - SMOOTHING) * previous)
+
+    def save(self):
+        if self.backend is None:
+            return
+        with self._lock:
+            data = json.dumps(self._seconds, indent=1, sort_keys=True).encode()
+        self.backend.put(self.key, data)
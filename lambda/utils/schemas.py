@@ -0,0 +1,111 @@
+"""
+Staging table schemas
+Declared Arrow schemas for every stg_* table the Lambda writes, so collectors
+can emit RecordBatches directly and every partition gets the same column
+types regardless of which values a season happened to contain.
+"""
+
+from typing import Dict, Sequence
+
+import pyarrow as pa
+
+
+STAT_COLUMNS = [
+    # Passing
+    'pass_yd', 'pass_td', 'pass_int', 'pass_att', 'pass_cmp',
+    # Rushing
+    'rush_yd', 'rush_td', 'rush_att',
+    # Receiving
+    'rec', 'rec_yd', 'rec_td', 'rec_tgt',
+    # Kicking
+    'fgm', 'fga', 'xpm', 'xpa',
+    # Defense
+    'def_int', 'def_sack', 'def_td', 'pts_allow',
+    # Misc
+    'fum_lost',
+]
+
+REGULAR_SEASON = pa.schema([
+    ('member_id', pa.int64()),
+    ('place', pa.int64()),
+    ('wins', pa.int64()),
+    ('losses', pa.int64()),
+    ('points_scored', pa.float64()),
+    ('points_against', pa.float64()),
+])
+
+MATCHUP_DATA = pa.schema([
+    ('week', pa.int64()),
+    ('matchup_id', pa.int64()),
+    ('team_id', pa.int64()),
+    ('points_scored', pa.float64()),
+    ('opponent_team_id', pa.int64()),
+    ('opponent_points', pa.float64()),
+])
+
+PLAYOFF_MATCHUP_DATA = pa.schema([
+    ('week', pa.int64()),
+    ('round', pa.int64()),
+    ('matchup_id', pa.int64()),
+    ('member_id', pa.int64()),
+    ('opponent_team_id', pa.int64()),
+    ('points', pa.float64()),
+    ('opponent_points', pa.float64()),
+])
+
+PLAYER_DETAILS_BY_TEAM = pa.schema([
+    ('week', pa.int64()),
+    ('team_name', pa.int64()),
+    ('roster_id', pa.int64()),
+    ('player_id', pa.string()),
+    ('player_name', pa.string()),
+    ('position', pa.string()),
+    ('nfl_team', pa.string()),
+    ('is_starter', pa.bool_()),
+    ('fantasy_points', pa.float64()),
+] + [(col, pa.float64()) for col in STAT_COLUMNS])
+
+PLAYER_TOTAL_POINTS = pa.schema([
+    ('player_id', pa.string()),
+    ('player_name', pa.string()),
+    ('position', pa.string()),
+    ('nfl_team', pa.string()),
+    ('weeks_played', pa.int64()),
+    ('total_fantasy_points', pa.float64()),
+    ('avg_points_per_game', pa.float64()),
+])
+
+
+def player_details_schema(profile_names: Sequence[str] = ()) -> pa.Schema:
+    """stg_player_details_by_team plus one fantasy_points_{name} column per scoring profile."""
+    return _with_profiles(PLAYER_DETAILS_BY_TEAM, 'fantasy_points', profile_names)
+
+
+def player_total_points_schema(profile_names: Sequence[str] = ()) -> pa.Schema:
+    """stg_player_total_points plus one total_fantasy_points_{name} column per scoring profile."""
+    return _with_profiles(PLAYER_TOTAL_POINTS, 'total_fantasy_points', profile_names)
+
+
+def _with_profiles(schema: pa.Schema, prefix: str, profile_names: Sequence[str]) -> pa.Schema:
+    for name in profile_names:
+        schema = schema.append(pa.field(f'{prefix}_{name}', pa.float64()))
+    return schema
+
+
+def to_record_batch(columns: Dict[str, Sequence], schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Build a RecordBatch from column arrays/lists in schema order.
+    NaN becomes null, as it does when pandas writes the same columns.
+
+    Args:
+        columns: Column name -> values (NumPy array or list)
+        schema: Target schema; every field must be present in columns
+    """
+    arrays = [pa.array(columns[field.name], type=field.type, from_pandas=True)
+              for field in schema]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def from_pandas(df, schema: pa.Schema) -> pa.RecordBatch:
+    """RecordBatch of a collector DataFrame cast to its declared schema."""
+    return pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
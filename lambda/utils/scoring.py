@@ -3,7 +3,9 @@ Fantasy scoring utilities
 Calculates fantasy points based on player stats and league scoring settings
 """
 
-from typing import Dict
+import numpy as np
+from itertools import chain
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
 
 
 def calculate_player_points(stats: Dict, scoring_settings: Dict) -> float:
@@ -27,3 +29,95 @@ def calculate_player_points(stats: Dict, scoring_settings: Dict) -> float:
             points += scoring_settings[stat_key] * stat_value
     
     return round(points, 2)
+
+
+# Raw scores this close (in hundredths) to a rounding midpoint are rescored
+# with calculate_player_points, whose summation order decides the rounding
+_MIDPOINT_TOLERANCE = 1e-6
+
+_NO_STATS: Mapping = {}
+
+
+class ScoringEngine:
+    """
+    Scoring settings compiled once into a stat-keys x configurations weight matrix.
+
+    The league's own settings are column 0; optional named profiles
+    (alternative rules such as half-PPR) follow. With profiles, score_all()
+    builds one players x stats matrix and scores it against every
+    configuration in a single matrix product; league settings alone are
+    scored per player, since pulling the values out of the stats dicts
+    costs as much as scoring them. Results match calculate_player_points
+    exactly.
+
+    Args:
+        scoring_settings: League scoring configuration
+        profiles: Optional name -> scoring configuration
+    """
+
+    def __init__(self, scoring_settings: Dict, profiles: Optional[Dict[str, Dict]] = None):
+        self.profile_names = tuple(profiles or ())
+        self.configurations = [scoring_settings] + [profiles[name] for name in self.profile_names]
+        self.stat_keys = tuple(sorted({key for settings in self.configurations
+                                       for key, weight in settings.items() if weight}))
+        weights = [[settings.get(key, 0) for settings in self.configurations] for key in self.stat_keys]
+        self.weights = np.array(weights, dtype='float64').reshape(len(self.stat_keys), len(self.configurations))
+
+    def stats_matrix(self, stats_rows: Sequence[Mapping]) -> np.ndarray:
+        """players x stat_keys matrix; missing or null stats are 0."""
+        keys = self.stat_keys
+        values = chain.from_iterable(map((row or _NO_STATS).get, keys) for row in stats_rows)
+        matrix = np.fromiter((value or 0.0 for value in values), dtype='float64',
+                             count=len(stats_rows) * len(keys))
+        return matrix.reshape(len(stats_rows), len(keys))
+
+    def raw_scores(self, matrix: np.ndarray) -> np.ndarray:
+        """Unrounded points, players x configurations."""
+        return matrix @ self.weights
+
+    def score_all(self, stats_rows: Sequence[Mapping]) -> List[List[float]]:
+        """
+        Fantasy points for many players under every configuration at once.
+
+        Args:
+            stats_rows: One stats dict per player (None/empty scores 0.0)
+
+        Returns:
+            One list of points per configuration (league settings first,
+            then profiles in order), rounded to 2 decimals
+        """
+        if not len(stats_rows):
+            return [[] for _ in self.configurations]
+        if len(self.configurations) == 1:
+            settings = self.configurations[0]
+            return [[calculate_player_points(stats, settings) for stats in stats_rows]]
+        return self.score_matrix(self.stats_matrix(stats_rows), stats_rows.__getitem__)
+
+    def score_matrix(self, matrix: np.ndarray,
+                     stats_for_row: Callable[[int], Mapping]) -> List[List[float]]:
+        """
+        Like score_all() for stats already held as a players x stat_keys matrix.
+
+        Args:
+            matrix: Stats matrix with columns in stat_keys order
+            stats_for_row: Returns row i's stats dict, in the key order
+                calculate_player_points would see; only called for the rare
+                rows whose raw score sits on a rounding midpoint
+        """
+        raw = self.raw_scores(matrix)
+        hundredths = np.abs(raw) * 100
+        near_midpoint = np.abs(hundredths - np.floor(hundredths) - 0.5) < _MIDPOINT_TOLERANCE
+        # Away from a midpoint NumPy's rounding agrees with round()
+        rounded = np.round(raw, 2)
+
+        columns = []
+        for j, settings in enumerate(self.configurations):
+            points = rounded[:, j].tolist()
+            for i in np.flatnonzero(near_midpoint[:, j]).tolist():
+                points[i] = calculate_player_points(stats_for_row(i), settings)
+            columns.append(points)
+        return columns
+
+    def score(self, stats_rows: Sequence[Mapping]) -> List[float]:
+        """Fantasy points under the league's own settings."""
+        return self.score_all(stats_rows)[0]
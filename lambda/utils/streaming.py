@@ -0,0 +1,95 @@
+"""
+Streaming JSON decoding
+Incrementally decodes a large top-level JSON object from a byte stream,
+yielding one member at a time so only a single value is materialized at once.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Tuple
+
+
+_WHITESPACE = ' \t\n\r'
+
+
+def _skip_ws(buf: str, pos: int) -> int:
+    while pos < len(buf) and buf[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def iter_object_items(chunks: Iterable[bytes]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (key, value) pairs of a top-level JSON object as bytes arrive.
+
+    Each member is decoded with json's C raw_decode once it is complete in
+    the buffer, then the consumed text is dropped, so peak memory is one
+    chunk plus one member rather than the whole document.
+
+    Args:
+        chunks: The UTF-8 response body in arbitrary pieces
+
+    Raises:
+        ValueError: If the document is not a JSON object or is truncated
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    started = False
+
+    def parse_members(final: bool):
+        """Parse as many complete members as the buffer holds; return (items, pos, done)."""
+        nonlocal started
+        items = []
+        pos = _skip_ws(buf, 0)
+        if not started:
+            if pos >= len(buf):
+                return items, pos, False
+            if buf[pos] != '{':
+                raise ValueError("Expected a JSON object")
+            started = True
+            pos = _skip_ws(buf, pos + 1)
+
+        while pos < len(buf):
+            if buf[pos] == '}':
+                return items, pos + 1, True
+            if buf[pos] == ',':
+                pos = _skip_ws(buf, pos + 1)
+                continue
+            try:
+                key, end = decoder.raw_decode(buf, pos)
+                end = _skip_ws(buf, end)
+                if end >= len(buf):
+                    break
+                if buf[end] != ':':
+                    raise ValueError(f"Expected ':' at offset {end}")
+                value, end = decoder.raw_decode(buf, _skip_ws(buf, end + 1))
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # member not complete yet
+            # A member only counts once the ',' or '}' after it has arrived:
+            # a number cut at a chunk boundary ("1." | "5") decodes as a shorter
+            # number, leaving the rest of it in the buffer
+            end = _skip_ws(buf, end)
+            if end >= len(buf) or buf[end] not in ',}':
+                if final:
+                    raise ValueError(f"Expected ',' or '}}' at offset {end}")
+                break
+            items.append((key, value))
+            pos = end
+        return items, pos, False
+
+    for chunk in chunks:
+        buf += utf8.decode(chunk)
+        items, pos, done = parse_members(final=False)
+        yield from items
+        if done:
+            return
+        buf = buf[pos:]
+
+    buf += utf8.decode(b'', final=True)
+    items, pos, done = parse_members(final=True)
+    yield from items
+    if not done:
+        raise ValueError("Truncated JSON object")
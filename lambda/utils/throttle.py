@@ -0,0 +1,138 @@
+"""
+Rate limiting and retry backoff for Sleeper API calls
+Token-bucket limiter shared by every request, decorrelated-jitter backoff,
+Retry-After parsing and retry classification of HTTP errors.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with additive-increase/multiplicative-decrease.
+
+    Each request takes one token; tokens refill at `rate` per second up to
+    `burst`. When the server signals throttling (429) the rate is halved,
+    and every success nudges it back up towards max_rate.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, min_rate: float = 0.5):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Take one token, sleeping until one is available.
+
+        Args:
+            max_wait: Give up instead of sleeping past this many seconds
+
+        Returns:
+            Seconds waited, or None (no token taken) if the next token
+            would arrive after max_wait
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            if max_wait is not None and waited + wait > max_wait:
+                return None
+            time.sleep(wait)
+            waited += wait
+
+    def on_throttled(self):
+        """Server pushed back: halve the rate and drain the bucket."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+
+    def on_success(self):
+        """Recover towards max_rate by a small fraction of it per success."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+
+class DecorrelatedJitter:
+    """
+    Decorrelated-jitter exponential backoff:
+        sleep = min(cap, uniform(base, previous_sleep * 3))
+    Keep one instance per request so the sequences of concurrent requests
+    stay independent.
+    """
+
+    def __init__(self, base: float, cap: float):
+        self.base = base
+        self.cap = cap
+        self._sleep = base
+
+    def next(self) -> float:
+        self._sleep = min(self.cap, random.uniform(self.base, self._sleep * 3))
+        return self._sleep
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable_status(status: int) -> bool:
+    """429 and 5xx are transient; any other 4xx will fail the same way again."""
+    return status == 429 or status >= 500
+
+
+class ThrottleStats:
+    """Thread-safe counters describing rate limiting and retry behaviour."""
+
+    FIELDS = (
+        'requests', 'throttle_waits', 'throttle_wait_seconds', 'retries',
+        'backoff_seconds', 'rate_limited', 'retry_after_honored',
+        'server_errors', 'transport_errors', 'client_errors', 'failures',
+        'deadline_exceeded',
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = {field: 0 for field in self.FIELDS}
+
+    def add(self, field: str, amount: float = 1):
+        with self._lock:
+            self._counts[field] += amount
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            counts = dict(self._counts)
+        for field in ('throttle_wait_seconds', 'backoff_seconds'):
+            counts[field] = round(counts[field], 3)
+        return counts
@@ -0,0 +1,85 @@
+"""
+Week-level fetch stage
+Fetches every week's inputs (matchups, weekly stats, playoff bracket) once
+per season and hands the same read-only WeekBundle to each collector.
+"""
+
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+from utils.api import (
+    _bracket_url, _matchups_url, _parse_stats, _weekly_stats_url, evict_cached_responses, fetch_many
+)
+
+
+_NO_STATS: Mapping[str, Dict] = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class WeekBundle:
+    """
+    Everything the collectors read for one league week.
+
+    The containers are read-only views over the decoded responses, which
+    are shared by every collector; nested values must not be mutated.
+    """
+    week: int
+    matchups: Tuple[Mapping, ...]
+    stats: Mapping[str, Dict]
+    bracket: Optional[Tuple[Mapping, ...]] = None
+
+    def without_stats(self) -> 'WeekBundle':
+        """The same bundle with its stats payload released."""
+        return replace(self, stats=_NO_STATS)
+
+
+def _freeze_rows(rows) -> Tuple[Mapping, ...]:
+    return tuple(MappingProxyType(row) for row in rows or [] if isinstance(row, dict))
+
+
+def fetch_week_bundles(league_id: str, year: int, weeks: Iterable[int],
+                       stats_weeks: Iterable[int] = (),
+                       with_bracket: bool = False) -> Dict[int, WeekBundle]:
+    """
+    Fetch a season's weekly inputs in two concurrent fan-outs.
+
+    Matchups for every week (plus the bracket) go first; weekly stats are
+    then fetched only for stats_weeks that actually have matchups. The
+    bundles become the only holder of the stats payloads (they are evicted
+    from the request cache), so dropping a bundle's stats frees them.
+
+    Args:
+        league_id: Sleeper league ID
+        year: Season year
+        weeks: Weeks to fetch matchups for
+        stats_weeks: Subset of weeks that also need player stats
+        with_bracket: Attach the winners bracket to every bundle
+
+    Returns:
+        Dictionary of week -> WeekBundle
+    """
+    weeks = list(weeks)
+    matchup_urls = {week: _matchups_url(league_id, week) for week in weeks}
+    bracket_url = _bracket_url(league_id) if with_bracket else None
+    responses = fetch_many(list(matchup_urls.values()) + ([bracket_url] if bracket_url else []))
+
+    matchups = {week: _freeze_rows(responses.get(url)) for week, url in matchup_urls.items()}
+    bracket = _freeze_rows(responses.get(bracket_url)) if with_bracket else None
+
+    stats_urls = {week: _weekly_stats_url(year, week)
+                  for week in stats_weeks if matchups.get(week)}
+    stats_responses = fetch_many(stats_urls.values())
+    evict_cached_responses(stats_urls.values())
+    print(f"  Fetched {len(weeks)} weeks of matchups, {len(stats_urls)} weeks of stats"
+          f"{', bracket' if with_bracket else ''}")
+
+    return {
+        week: WeekBundle(
+            week=week,
+            matchups=matchups[week],
+            stats=(MappingProxyType(_parse_stats(stats_responses.get(stats_urls[week])))
+                   if week in stats_urls else _NO_STATS),
+            bracket=bracket,
+        )
+        for week in weeks
+    }